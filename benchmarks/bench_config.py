@@ -0,0 +1,82 @@
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""Memory and construction time of the virtual machine configurations.
+
+The memory is the growth of the resident set size of the process, each size
+is run in a new process.
+
+Usage: PYTHONPATH=. python benchmarks/bench_config.py [N ...]
+"""
+
+import os
+import sys
+import time
+import StringIO
+import subprocess
+
+from twisted.internet import defer
+
+from virtualbricks import brickfactory, virtualmachines
+
+
+__builtins__._ = str
+
+
+def rss():
+    with open("/proc/self/statm") as fp:
+        return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def bench(size):
+    factory = brickfactory.BrickFactory(defer.Deferred())
+    start_rss = rss()
+    start = time.time()
+    configs = [virtualmachines.VirtualMachineConfig() for _ in xrange(size)]
+    config_time = time.time() - start
+    config_rss = rss() - start_rss
+    del configs
+    start_rss = rss()
+    start = time.time()
+    for i in xrange(size):
+        factory.new_brick("vm", "vm%d" % i)
+    vm_time = time.time() - start
+    vm_rss = rss() - start_rss
+    sio = StringIO.StringIO()
+    start = time.time()
+    for brick in factory.bricks:
+        brick.save_to(sio)
+    save_time = time.time() - start
+    print "{0:>7} {1:>12.3f} {2:>12.1f} {3:>12.3f} {4:>12.1f} {5:>12.3f}".format(
+        size, config_time, config_rss / 1024.0 ** 2, vm_time,
+        vm_rss / 1024.0 ** 2, save_time)
+
+
+def main(sizes):
+    print "{0:>7} {1:>12} {2:>12} {3:>12} {4:>12} {5:>12}".format(
+        "vms", "config (s)", "config (MB)", "vm (s)", "vm (MB)", "save (s)")
+    sys.stdout.flush()
+    for size in sizes:
+        # a new process for each size, so the memory is measured from scratch
+        subprocess.check_call([sys.executable, __file__, "--run", str(size)])
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--run"]:
+        bench(int(sys.argv[2]))
+    else:
+        main(map(int, sys.argv[1:]) or [1000, 10000])
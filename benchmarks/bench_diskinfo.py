@@ -0,0 +1,87 @@
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""Scan of a directory of qcow2 images with the native metadata reader.
+
+IMAGES sparse qcow2 images of 4GB are written, each with 2000 clusters
+allocated in two L2 tables. The images are in the page cache, the best of 5
+scans is reported. If qemu-img is found, the time of "qemu-img info" on the
+first 20 images is reported for comparison.
+
+Usage: PYTHONPATH=. python benchmarks/bench_diskinfo.py [IMAGES]
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import tempfile
+import subprocess
+
+from twisted.python import procutils
+
+from virtualbricks import diskinfo
+from virtualbricks.tests.test_diskinfo import write_qcow2
+
+
+def make_images(directory, count):
+    random.seed(42)
+    for i in xrange(count):
+        allocated = random.sample(xrange(16384), 2000)
+        write_qcow2(os.path.join(directory, "disk%d.qcow2" % i),
+                    size=4 << 30, allocated=allocated,
+                    backing_file="base.img")
+
+
+def best_scan(directory, runs=5):
+    times = []
+    for i in xrange(runs):
+        start = time.time()
+        infos = diskinfo.scan(directory)
+        times.append(time.time() - start)
+    return min(times), infos
+
+
+def qemu_img_info(qemu_img, directory, count):
+    names = sorted(os.listdir(directory))[:count]
+    start = time.time()
+    for name in names:
+        subprocess.check_output([qemu_img, "info",
+                                 os.path.join(directory, name)])
+    return (time.time() - start) / len(names)
+
+
+def main(count):
+    directory = tempfile.mkdtemp(prefix="bench_diskinfo")
+    try:
+        make_images(directory, count)
+        elapsed, infos = best_scan(directory)
+        assert len(infos) == count
+        print "images: {0}".format(count)
+        print "scan (best of 5): {0:.3f} s, {1:.2f} ms per image".format(
+            elapsed, elapsed * 1000 / count)
+        found = procutils.which("qemu-img")
+        if found:
+            print "qemu-img info: {0:.2f} ms per image".format(
+                qemu_img_info(found[0], directory, 20) * 1000)
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,67 @@
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""Lookup costs of the BrickFactory as the number of bricks grows.
+
+Usage: PYTHONPATH=. python benchmarks/bench_factory.py [N ...]
+"""
+
+import sys
+import time
+import timeit
+
+from twisted.internet import defer
+
+from virtualbricks import brickfactory
+
+
+__builtins__._ = str
+LOOKUPS = 10000
+
+
+def populate(size):
+    factory = brickfactory.BrickFactory(defer.Deferred())
+    start = time.time()
+    for i in xrange(size):
+        factory.new_brick("switch", "sw%d" % i)
+    return factory, time.time() - start
+
+
+def bench(size):
+    factory, creation = populate(size)
+    last = "sw%d" % (size - 1)
+    port = last + "_port"
+    timer = timeit.Timer(lambda: factory.get_brick_by_name(last))
+    by_name = min(timer.repeat(3, LOOKUPS)) / LOOKUPS
+    timer = timeit.Timer(lambda: factory.is_in_use("missing"))
+    in_use = min(timer.repeat(3, LOOKUPS)) / LOOKUPS
+    timer = timeit.Timer(lambda: factory.get_sock_by_name(port))
+    by_sock = min(timer.repeat(3, LOOKUPS)) / LOOKUPS
+    print "{0:>7} {1:>12.3f} {2:>14.3f} {3:>12.3f} {4:>12.3f}".format(
+        size, creation * 1e3, by_name * 1e6, in_use * 1e6, by_sock * 1e6)
+
+
+def main(sizes):
+    print "{0:>7} {1:>12} {2:>14} {3:>12} {4:>12}".format(
+        "bricks", "create (ms)", "by name (us)", "in use (us)",
+        "sock (us)")
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main(map(int, sys.argv[1:]) or [10, 100, 1000, 10000])
@@ -0,0 +1,134 @@
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""Throughput between two virtual machines with -net vlans and -netdev.
+
+Two virtual machines are plugged to a vde_switch, once with the old qemu
+vlans (-device MODEL,vlan=N and -net vde,vlan=N) and once with the NICs bound
+to their backends (-netdev vde and -device MODEL,netdev=ID), the forms used
+by VirtualMachine.
+
+The guests boot KERNEL and INITRD. The init of INITRD must read the kernel
+command line: with vb.role=server it configures eth0 as vb.ip and runs
+"iperf3 -s", with vb.role=client it configures eth0 as vb.ip, runs
+"iperf3 -c vb.server" and prints the output of iperf3 on the serial console.
+qemu-system-x86_64 and vde_switch must be in the PATH.
+
+Usage: PYTHONPATH=. python benchmarks/bench_netdev.py KERNEL INITRD [MODEL]
+"""
+
+import os
+import re
+import sys
+import shutil
+import tempfile
+
+from twisted.internet import defer, task, protocol, reactor
+from twisted.python import procutils
+
+
+THROUGHPUT_RE = re.compile(r"([\d.]+) ([KMG])bits/sec\s+.*sender")
+UNITS = {"K": 1e-6, "M": 1e-3, "G": 1}
+TIMEOUT = 120
+
+
+class Console(protocol.ProcessProtocol):
+
+    def __init__(self):
+        self.output = []
+        self.ended = defer.Deferred()
+
+    def outReceived(self, data):
+        self.output.append(data)
+
+    def processEnded(self, reason):
+        self.ended.callback("".join(self.output))
+
+
+def nic_args(legacy, model, switch, mac):
+    if legacy:
+        return ["-device", "{0},vlan=0,mac={1},id=eth0".format(model, mac),
+                "-net", "vde,vlan=0,sock={0},name=vde0".format(switch)]
+    return ["-netdev", "vde,id=vde0,sock={0}".format(switch),
+            "-device", "{0},netdev=vde0,mac={1},id=eth0".format(model, mac)]
+
+
+def spawn(qemu, kernel, initrd, append, nic):
+    console = Console()
+    args = [qemu, "-enable-kvm", "-m", "256", "-nographic", "-no-reboot",
+            "-kernel", kernel, "-initrd", initrd,
+            "-append", "console=ttyS0 panic=-1 " + append] + nic
+    process = reactor.spawnProcess(console, qemu, args, os.environ)
+    return process, console
+
+
+@defer.inlineCallbacks
+def measure(qemu, kernel, initrd, model, switch, legacy):
+    server, _ = spawn(qemu, kernel, initrd,
+                      "vb.role=server vb.ip=10.0.0.1",
+                      nic_args(legacy, model, switch, "52:54:00:00:00:01"))
+    client, console = spawn(qemu, kernel, initrd,
+                            "vb.role=client vb.ip=10.0.0.2 "
+                            "vb.server=10.0.0.1",
+                            nic_args(legacy, model, switch,
+                                     "52:54:00:00:00:02"))
+    timeout = reactor.callLater(TIMEOUT, client.signalProcess, "KILL")
+    try:
+        output = yield console.ended
+    finally:
+        if timeout.active():
+            timeout.cancel()
+        server.signalProcess("KILL")
+    match = THROUGHPUT_RE.search(output)
+    if match is None:
+        defer.returnValue(None)
+    defer.returnValue(float(match.group(1)) * UNITS[match.group(2)])
+
+
+@defer.inlineCallbacks
+def main(kernel, initrd, model):
+    found = [procutils.which(name) for name in ("qemu-system-x86_64",
+                                                "vde_switch")]
+    if not all(found):
+        print "qemu-system-x86_64 and vde_switch are required"
+        return
+    qemu, vde_switch = found[0][0], found[1][0]
+    directory = tempfile.mkdtemp(prefix="bench_netdev")
+    switch = os.path.join(directory, "switch")
+    sw = reactor.spawnProcess(protocol.ProcessProtocol(), vde_switch,
+                              [vde_switch, "-s", switch], os.environ)
+    try:
+        yield task.deferLater(reactor, 1, lambda: None)
+        print "model: {0}".format(model)
+        print "{0:<10} {1:>12}".format("form", "Gbits/sec")
+        for name, legacy in ("-net vlan", True), ("-netdev", False):
+            gbits = yield measure(qemu, kernel, initrd, model, switch, legacy)
+            if gbits is None:
+                print "{0:<10} {1:>12}".format(name, "failed")
+            else:
+                print "{0:<10} {1:>12.3f}".format(name, gbits)
+    finally:
+        sw.signalProcess("TERM")
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print __doc__
+        sys.exit(2)
+    model = sys.argv[3] if len(sys.argv) > 3 else "virtio-net-pci"
+    task.react(lambda reactor: main(sys.argv[1], sys.argv[2], model))
@@ -0,0 +1,98 @@
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""Observer callbacks run while a large project is restored.
+
+An immediate observer counts every notification, as every observer was
+notified before the batching mode, a regular observer counts the
+notifications delivered after coalescing. The redraws are those of the
+topology view, before on every brick notification, now once per reactor turn.
+
+Usage: PYTHONPATH=. python benchmarks/bench_notify.py [VMS ...]
+"""
+
+import sys
+import time
+import StringIO
+
+from twisted.internet import defer, task
+
+from virtualbricks import brickfactory, configfile
+
+
+__builtins__._ = str
+SIGNALS = ("brick-added", "brick-changed", "event-added", "image-added",
+           "image-changed")
+NICS = 4
+
+
+def generate(vms):
+    factory = brickfactory.BrickFactory(defer.Deferred())
+    switches = [factory.new_brick("switch", "sw%d" % i) for i in range(NICS)]
+    for i in xrange(vms):
+        vm = factory.new_brick("vm", "vm%d" % i)
+        for switch in switches:
+            vm.connect(switch.socks[0])
+    fp = StringIO.StringIO()
+    configfile.ConfigFile().save_to(factory, fp)
+    fp.seek(0)
+    return fp
+
+
+def bench(vms):
+    fp = generate(vms)
+    factory = brickfactory.BrickFactory(defer.Deferred())
+    clock = task.Clock()
+    counts = {"immediate": 0, "batched": 0, "redraws": 0, "before": 0}
+    calls = []
+
+    def count(emitter, kind):
+        counts[kind] += 1
+
+    def redraw():
+        del calls[:]
+        counts["redraws"] += 1
+
+    def brick_changed(brick):
+        counts["before"] += 1
+        if not calls:
+            calls.append(clock.callLater(0, redraw))
+
+    for signal in SIGNALS:
+        factory.connect_immediate(signal, count, "immediate")
+        factory.connect(signal, count, "batched")
+    for signal in ("brick-added", "brick-changed", "brick-removed"):
+        factory.connect(signal, brick_changed)
+    start = time.time()
+    configfile.ConfigFile().restore_from(factory, fp)
+    clock.advance(0)
+    elapsed = time.time() - start
+    print "{0:>7} {1:>14} {2:>14} {3:>14} {4:>14} {5:>12.3f}".format(
+        vms, counts["immediate"], counts["batched"], counts["before"],
+        counts["redraws"], elapsed)
+
+
+def main(sizes):
+    print "{0:>7} {1:>14} {2:>14} {3:>14} {4:>14} {5:>12}".format(
+        "vms", "notify before", "notify after", "redraws before",
+        "redraws after", "restore (s)")
+    for size in sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main(map(int, sys.argv[1:]) or [10, 100, 1000])
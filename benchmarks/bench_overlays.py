@@ -0,0 +1,133 @@
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""Start latency of many virtual machines with private disks.
+
+Every virtual machine waits for the creation of its COW overlays. The old
+strategy runs qemu-img and then sync(1) for every disk, the new one creates
+the overlays with the OverlayCreator. qemu-img is used if it is found in the
+PATH, otherwise it is simulated by a script that writes a 192KiB file.
+Optionally DIRTY megabytes are written, and not flushed, before every run to
+show the cost of flushing the whole page cache.
+
+Usage: PYTHONPATH=. python benchmarks/bench_overlays.py [VMS [DISKS [DIRTY]]]
+"""
+
+import os
+import sys
+import stat
+import shutil
+import tempfile
+
+from twisted.internet import defer, task, utils, reactor
+from twisted.python import procutils
+
+from virtualbricks import overlays
+
+
+FAKE_QEMU_IMG = """\
+#!/bin/sh
+# create -b base -f fmt name
+head -c 196608 /dev/zero > "$6"
+"""
+
+
+def find_qemu_img(directory):
+    found = procutils.which("qemu-img")
+    if found:
+        return found[0]
+    path = os.path.join(directory, "qemu-img")
+    with open(path, "w") as fp:
+        fp.write(FAKE_QEMU_IMG)
+    os.chmod(path, stat.S_IRWXU)
+    return path
+
+
+def make_dirty(directory, megabytes):
+    with open(os.path.join(directory, "dirty"), "wb") as fp:
+        for i in xrange(megabytes):
+            fp.write("\x01" * 1024 * 1024)
+
+
+def check(result):
+    out, err, code = result
+    if code != 0:
+        raise RuntimeError(err)
+
+
+def sync_create(qemu_img, base, cowname, fmt):
+    d = utils.getProcessOutputAndValue(qemu_img, ["create", "-b", base, "-f",
+                                                  fmt, cowname], os.environ)
+    d.addCallback(check)
+    d.addCallback(lambda _: utils.getProcessOutputAndValue("sync"))
+    return d.addCallback(check)
+
+
+@defer.inlineCallbacks
+def run(create, qemu_img, base, directory, vms, disks):
+    start = reactor.seconds()
+    latencies = []
+
+    def started(_):
+        latencies.append(reactor.seconds() - start)
+
+    dl = []
+    for vm in xrange(vms):
+        d = defer.gatherResults([
+            create(qemu_img, base, os.path.join(directory,
+                                                "vm%d_hd%d.cow" % (vm, disk)),
+                   "qcow2") for disk in xrange(disks)])
+        dl.append(d.addCallback(started))
+    yield defer.gatherResults(dl)
+    defer.returnValue((sum(latencies) / len(latencies), max(latencies)))
+
+
+@defer.inlineCallbacks
+def main(vms, disks, dirty):
+    directory = tempfile.mkdtemp(prefix="bench_overlays")
+    try:
+        qemu_img = find_qemu_img(directory)
+        base = os.path.join(directory, "base.qcow2")
+        yield utils.getProcessOutputAndValue(
+            qemu_img, ["create", "-f", "qcow2", base, "64M"])
+        print "vms: {0}, disks per vm: {1}, dirty: {2} MB".format(
+            vms, disks, dirty)
+        print "qemu-img: {0}".format(qemu_img)
+        print "{0:<24} {1:>10} {2:>10} {3:>8}".format(
+            "strategy", "mean (s)", "max (s)", "flushes")
+        strategies = [("qemu-img + sync", sync_create, lambda: vms * disks)]
+        for limit in 1, 4, 16:
+            creator = overlays.OverlayCreator(limit)
+            strategies.append(("creator (limit %d)" % limit, creator.create,
+                               lambda creator=creator: creator.flushes))
+        for name, create, flushes in strategies:
+            workdir = tempfile.mkdtemp(dir=directory)
+            make_dirty(workdir, dirty)
+            mean, worst = yield run(create, qemu_img, base, workdir, vms,
+                                    disks)
+            print "{0:<24} {1:>10.3f} {2:>10.3f} {3:>8}".format(
+                name, mean, worst, flushes())
+            shutil.rmtree(workdir)
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    vms = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    disks = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    dirty = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    task.react(lambda reactor: main(vms, disks, dirty))
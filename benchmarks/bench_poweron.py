@@ -0,0 +1,101 @@
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""Cold start of a lab: one brick at a time against the scheduler.
+
+Bricks are simulated, each one takes a random time to start. The lab is made
+of switches and of virtual machines plugged to them.
+
+Usage: PYTHONPATH=. python benchmarks/bench_poweron.py [BRICKS [SWITCHES]]
+"""
+
+import sys
+import random
+
+from twisted.internet import defer, task, reactor
+
+from virtualbricks import link, scheduler
+
+
+__builtins__._ = str
+
+
+class SimulatedBrick:
+
+    def __init__(self, name, start_time):
+        self.name = name
+        self.start_time = start_time
+        self.plugs = []
+        self.socks = [link.Sock(self, name + "_port")]
+        self.running = False
+
+    def poweron(self):
+        if self.running:
+            return defer.succeed(self)
+        d = defer.DeferredList([p.sock.brick.poweron() for p in self.plugs])
+        d.addCallback(lambda _: task.deferLater(reactor, self.start_time,
+                                                self._started))
+        return d
+
+    def _started(self):
+        self.running = True
+        return self
+
+
+def make_lab(size, switches):
+    random.seed(42)
+    sws = [SimulatedBrick("sw%d" % i, random.uniform(0.005, 0.02))
+           for i in range(switches)]
+    vms = []
+    for i in range(size - switches):
+        vm = SimulatedBrick("vm%d" % i, random.uniform(0.02, 0.1))
+        plug = link.Plug(vm)
+        plug.connect(sws[i % switches].socks[0])
+        vm.plugs.append(plug)
+        vms.append(vm)
+    critical = max(b.start_time for b in sws) + max(b.start_time for b in vms)
+    return sws + vms, critical
+
+
+@defer.inlineCallbacks
+def sequential(bricks):
+    start = reactor.seconds()
+    for brick in bricks:
+        yield brick.poweron()
+    defer.returnValue(reactor.seconds() - start)
+
+
+@defer.inlineCallbacks
+def main(size, switches):
+    bricks, critical = make_lab(size, switches)
+    total = sum(b.start_time for b in bricks)
+    print "bricks: {0}, switches: {1}".format(size, switches)
+    print "sum of start times:  {0:8.3f}s".format(total)
+    print "critical path:       {0:8.3f}s".format(critical)
+    elapsed = yield sequential(bricks)
+    print "one at a time:       {0:8.3f}s".format(elapsed)
+    for concurrency in 8, 32, size:
+        bricks, _ = make_lab(size, switches)
+        report = yield scheduler.poweron(bricks, concurrency)
+        print "scheduler ({0:>4}):    {1:8.3f}s".format(concurrency,
+                                                       report.elapsed)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    switches = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    task.react(lambda reactor: main(size, switches))
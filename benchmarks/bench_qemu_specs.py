@@ -0,0 +1,84 @@
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""Import time of virtualbricks.qemu and lookup time of the QEMU specs.
+
+Each import is timed in a new process, the best of N runs is reported.
+
+Usage: PYTHONPATH=. python benchmarks/bench_qemu_specs.py [N]
+"""
+
+import os
+import sys
+import time
+import subprocess
+
+
+IMPORT = """\
+import time
+start = time.time()
+import virtualbricks.qemu
+print time.time() - start
+"""
+
+
+def rss():
+    with open("/proc/self/statm") as fp:
+        return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def import_time(runs):
+    times = []
+    for i in xrange(runs):
+        out = subprocess.check_output([sys.executable, "-c", IMPORT])
+        times.append(float(out))
+    return min(times)
+
+
+def lookups():
+    start_rss = rss()
+    start = time.time()
+    from virtualbricks import qemu
+    qemu.install("2.0.0")
+    first = time.time()
+    qemu.get_cpus("qemu-system-x86_64")
+    qemu.get_machines("qemu-system-x86_64")
+    first = time.time() - first
+    start = time.time()
+    for i in xrange(1000):
+        qemu.get_cpus("qemu-system-x86_64")
+        qemu.get_machines("qemu-system-arm")
+    return first, (time.time() - start) / 2000, rss() - start_rss
+
+
+def main(runs):
+    print "import virtualbricks.qemu (best of {0}): {1:.2f} ms".format(
+        runs, import_time(runs) * 1000)
+    sys.stdout.flush()
+    out = subprocess.check_output([sys.executable, __file__, "--lookups"])
+    first, each, memory = map(float, out.split())
+    print "first lookup: {0:.3f} ms".format(first * 1000)
+    print "next lookups: {0:.1f} us each".format(each * 1000000)
+    print "memory after import and lookups: {0:.1f} MB".format(
+        memory / 1024.0 ** 2)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--lookups"]:
+        print "{0} {1} {2}".format(*lookups())
+    else:
+        main(int(sys.argv[1]) if sys.argv[1:] else 20)
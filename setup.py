@@ -83,7 +83,8 @@ setup(
         "virtualbricks.scripts",
         "virtualbricks.tests"
     ],
-    package_data={"virtualbricks.tests": ["data/*"]},
+    package_data={"virtualbricks": ["data/*.json"],
+                  "virtualbricks.tests": ["data/*"]},
     data_files=[
         ("share/applications", ["share/virtualbricks.desktop"]),
         ("share/pixmaps", ["share/virtualbricks.xpm"]),
@@ -95,7 +96,8 @@ setup(
     ],
     entry_points={
         'console_scripts': [
-            'virtualbricks = virtualbricks.scripts.virtualbricks:run'
+            'virtualbricks = virtualbricks.scripts.virtualbricks:run',
+            'virtualbricks-helper = virtualbricks.scripts.helper:run'
         ]
     },
     cmdclass={
@@ -52,7 +52,11 @@ DEFAULT_CONF = {
     "workspace": DEFAULT_WORKSPACE,
     "current_project": DEFAULT_PROJECT,
     "cowfmt": "qcow2",
-    "show_missing": True
+    "cowjobs": 4,
+    "imagejobs": 1,
+    "warmpoolbudget": 1024,
+    "show_missing": True,
+    "helper": False
 }
 
 
@@ -76,7 +80,7 @@ class Settings:
             return type.__new__(cls, name, bases, dct)
 
     __boolean_values__ = ('kvm', 'ksm', 'python', 'femaleplugs',
-                          'erroronloop', 'systray', 'show_missing')
+                          'erroronloop', 'systray', 'show_missing', 'helper')
     DEFAULT_SECTION = "Main"
     DEFAULT_PROJECT = DEFAULT_PROJECT
     VIRTUALBRICKS_HOME = VIRTUALBRICKS_HOME
@@ -111,6 +115,9 @@ class Settings:
 
     def set(self, attr, value):
         self.config.set(self.DEFAULT_SECTION, attr, str(value))
+        if attr in ("vdepath", "qemupath"):
+            from virtualbricks import _spawn
+            _spawn.clear_cache()
 
     def store(self):
         with open(self.filename, "w") as fp:
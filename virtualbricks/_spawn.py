@@ -1,28 +1,93 @@
 import os
+import time
+
+from twisted.internet import task
 from twisted.internet.utils import getProcessOutput, getProcessOutputAndValue
 
 
-def _abspath_exe(path, executable, return_relative=True):
-    if '/' in executable:
-        if os.access(executable, os.X_OK) or return_relative:
-            return executable
-        else:
-            return None
+# The resolutions of the executables are cached. An entry is checked against
+# the modification time of the directories searched, at most once every
+# CHECK_INTERVAL seconds, and the whole cache is cleared when the configured
+# paths change.
+CHECK_INTERVAL = 1.0
+
+# (search path, executable) -> (absolute path or None, searched directories
+# with their modification time, time of the last check)
+_cache = {}
+
+
+def _search_path(path):
     if isinstance(path, basestring) and path != '':
+        return (path, )
+    return tuple(os.environ.get('PATH', '.').split(':'))
+
+
+def _mtime(directory):
+    try:
+        return os.stat(directory).st_mtime
+    except OSError:
+        return None
+
+
+def _resolve(search_path, executable):
+    searched = []
+    for path in search_path:
+        searched.append((path, _mtime(path)))
         abspath = os.path.join(path, executable)
         if os.access(abspath, os.X_OK):
+            return abspath, tuple(searched)
+    return None, tuple(searched)
+
+
+def _lookup(search_path, executable):
+    key = search_path, executable
+    now = time.time()
+    try:
+        abspath, searched, checked = _cache[key]
+    except KeyError:
+        pass
+    else:
+        if (now - checked < CHECK_INTERVAL or
+                all(_mtime(path) == mtime for path, mtime in searched)):
+            _cache[key] = abspath, searched, now
             return abspath
-        elif return_relative:
+    abspath, searched = _resolve(search_path, executable)
+    _cache[key] = abspath, searched, now
+    return abspath
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def _abspath_exe(path, executable, return_relative=True):
+    if '/' in executable:
+        if os.access(executable, os.X_OK) or return_relative:
             return executable
         else:
             return None
-    paths = os.environ.get('PATH', '.').split(':')
-    for path in paths:
-        if os.access(os.path.join(path, executable), os.X_OK):
-            return os.path.join(path, executable)
-    if return_relative:
+    abspath = _lookup(_search_path(path), executable)
+    if abspath is None and return_relative:
         # cannot find executable, return the relative filename
         return executable
+    return abspath
+
+
+def warm_cache():
+    """Resolve the known executables, one per reactor iteration.
+
+    @return: a deferred that fires when all the executables are resolved.
+    """
+
+    from virtualbricks import tools
+
+    def resolve():
+        for executable in tools.vde_bins:
+            yield abspath_vde(executable)
+        for executable in tools.qemu_bins:
+            yield abspath_qemu(executable)
+
+    return task.coiterate(resolve())
 
 
 def getQemuOutput(executable, args=(), env={}, path=None, reactor=None,
@@ -0,0 +1,227 @@
+# -*- test-case-name: virtualbricks.tests.test_affinity -*-
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+Decide and set the CPUs where the processes of the bricks run.
+
+A child inherits the CPU affinity of the process that forks it: the affinity
+of virtualbricks is changed just for the time of the fork and the new process
+starts, and stays, on its CPUs. The L{Placer} spreads the bricks with the
+C{auto} affinity across the NUMA nodes and keeps every brick on the node of
+the bricks it is connected to.
+"""
+
+import os
+import ctypes
+import ctypes.util
+import contextlib
+import collections
+
+from virtualbricks import log, scheduler
+
+
+__all__ = ["AUTO", "NODE_ROOT", "parse_cpus", "format_cpus",
+           "sched_getaffinity", "sched_setaffinity", "pinned", "numa_nodes",
+           "Placer"]
+
+logger = log.Logger()
+brick_placed = log.Event("{brick} placed on the NUMA node {node}")
+
+AUTO = "auto"
+NODE_ROOT = "/sys/devices/system/node"
+# a cpu_set_t of glibc, 1024 CPUs
+CPU_SETSIZE = 1024
+_MASK_WORDS = CPU_SETSIZE // (8 * ctypes.sizeof(ctypes.c_ulong))
+_cpu_set_t = ctypes.c_ulong * _MASK_WORDS
+_WORD_BITS = 8 * ctypes.sizeof(ctypes.c_ulong)
+
+_libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+
+def parse_cpus(spec):
+    """Parse a list of CPUs in the format of taskset and of sysfs, for
+    example C{"0-3,8"}.
+
+    @rtype: a sorted list of integers.
+    @raise ValueError: if the list is not valid.
+    """
+
+    cpus = set()
+    for item in spec.replace(" ", "").split(","):
+        first, sep, last = item.partition("-")
+        if sep:
+            first, last = int(first), int(last)
+            if first > last:
+                raise ValueError("invalid CPU range %s" % item)
+            cpus.update(range(first, last + 1))
+        else:
+            cpus.add(int(first))
+    if any(not 0 <= cpu < CPU_SETSIZE for cpu in cpus):
+        raise ValueError("CPU out of range in %s" % spec)
+    return sorted(cpus)
+
+
+def format_cpus(cpus):
+    """The inverse of L{parse_cpus}, the consecutive CPUs are joined in
+    ranges."""
+
+    ranges = []
+    for cpu in sorted(cpus):
+        if ranges and ranges[-1][1] == cpu - 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(str(first) if first == last else "%d-%d" % (first, last)
+                    for first, last in ranges)
+
+
+def _check(result):
+    if result != 0:
+        code = ctypes.get_errno()
+        raise OSError(code, os.strerror(code))
+
+
+def sched_getaffinity(pid):
+    """Return the CPUs where the thread C{pid} can run, C{0} is the calling
+    thread."""
+
+    mask = _cpu_set_t()
+    _check(_libc.sched_getaffinity(pid, ctypes.sizeof(mask),
+                                   ctypes.byref(mask)))
+    return [i * _WORD_BITS + bit for i, word in enumerate(mask)
+            for bit in range(_WORD_BITS) if word >> bit & 1]
+
+
+def sched_setaffinity(pid, cpus):
+    """Bind the thread C{pid} to C{cpus}, C{0} is the calling thread. The
+    threads created later by the thread inherit the affinity."""
+
+    mask = _cpu_set_t()
+    for cpu in cpus:
+        mask[cpu // _WORD_BITS] |= 1 << (cpu % _WORD_BITS)
+    _check(_libc.sched_setaffinity(pid, ctypes.sizeof(mask),
+                                   ctypes.byref(mask)))
+
+
+@contextlib.contextmanager
+def pinned(cpus):
+    """Run the block on C{cpus}, the processes spawned in the block keep the
+    affinity. If C{cpus} is empty the affinity is not changed."""
+
+    if not cpus:
+        yield
+        return
+    previous = sched_getaffinity(0)
+    sched_setaffinity(0, cpus)
+    try:
+        yield
+    finally:
+        sched_setaffinity(0, previous)
+
+
+def numa_nodes(root=NODE_ROOT, available=None):
+    """Return the CPUs of every NUMA node, a dictionary node -> list of CPUs,
+    ordered by node.
+
+    Only the CPUs in C{available}, by default those where virtualbricks can
+    run, are considered. If the topology is unknown all the CPUs are on the
+    node 0.
+    """
+
+    if available is None:
+        available = sched_getaffinity(0)
+    available = set(available)
+    nodes = collections.OrderedDict()
+    try:
+        names = os.listdir(root)
+    except OSError:
+        names = []
+    for name in sorted(names, key=lambda name: name[4:].zfill(8)):
+        if not (name.startswith("node") and name[4:].isdigit()):
+            continue
+        try:
+            with open(os.path.join(root, name, "cpulist")) as fp:
+                content = fp.read().strip()
+        except IOError:
+            continue
+        # the nodes with memory only have no CPUs
+        if content:
+            cpus = [cpu for cpu in parse_cpus(content) if cpu in available]
+            if cpus:
+                nodes[int(name[4:])] = cpus
+    if not nodes:
+        nodes[0] = sorted(available)
+    return nodes
+
+
+def _weight(brick):
+    # the virtual machines weigh as many CPUs as they have
+    if "smp" in brick.config:
+        return brick.config["smp"]
+    return 1
+
+
+class Placer:
+    """Choose a NUMA node for the bricks with the C{auto} affinity.
+
+    A brick goes on the node where most of the bricks it is connected to are
+    running, a brick connected to nothing goes on the least loaded node. The
+    load of a node is the number of virtual CPUs placed on it.
+    """
+
+    def __init__(self, factory, root=NODE_ROOT):
+        self.factory = factory
+        self.root = root
+        self._nodes = None
+        # brick -> node
+        self.placements = {}
+
+    def nodes(self):
+        if self._nodes is None:
+            self._nodes = numa_nodes(self.root)
+        return self._nodes
+
+    def _neighbours(self, brick):
+        neighbours = scheduler.dependencies(brick)
+        for other in self.factory.bricks:
+            if other is not brick and brick in scheduler.dependencies(other):
+                neighbours.append(other)
+        return neighbours
+
+    def load(self):
+        load = dict.fromkeys(self.nodes(), 0)
+        for brick, node in self.placements.iteritems():
+            load[node] += _weight(brick)
+        return load
+
+    def place(self, brick):
+        """Return the CPUs of the node chosen for C{brick}."""
+
+        nodes = self.nodes()
+        if brick not in self.placements:
+            load = self.load()
+            votes = collections.Counter(
+                self.placements[other] for other in self._neighbours(brick)
+                if other in self.placements)
+            node = min(nodes, key=lambda n: (-votes[n], load[n], n))
+            self.placements[brick] = node
+            logger.info(brick_placed, brick=brick, node=node)
+        return nodes[self.placements[brick]]
+
+    def release(self, brick):
+        self.placements.pop(brick, None)
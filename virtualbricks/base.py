@@ -17,6 +17,7 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
 import re
+import copy
 
 from twisted.python import reflect
 
@@ -35,30 +36,157 @@ param_not_found = log.Event("Parameter {param} in {brick} not found. "
                             "(val: {value})")
 
 
-class Config(dict):
+def _mutable(value):
+    return type(value).__hash__ is None
+
+
+class _ConfigType(type):
+    """Compute the parameters of a Config class once, when the class is
+    created.
+
+    The C{parameters} attribute of the class is replaced by the parameters
+    accumulated from all its bases. C{_names} holds the sorted names and
+    C{_defaults} the default values in the same order.
+    """
+
+    def __init__(cls, name, bases, dct):
+        super(_ConfigType, cls).__init__(name, bases, dct)
+        parameters = {}
+        reflect.accumulateClassDict(cls, "parameters", parameters)
+        cls.parameters = parameters
+        cls._names = tuple(sorted(parameters))
+        cls._defaults = tuple(parameters[n].default for n in cls._names)
+
+
+class Config(object):
+    """The configuration of a brick.
+
+    It behaves like a dictionary with a fixed set of keys, the parameters.
+    Only the values that have been set are stored in the instance, the others
+    are read from the defaults of the parameters. C{version} is incremented
+    every time a value changes.
+    """
+
+    __metaclass__ = _ConfigType
+    __slots__ = ("_values", "version")
+    __hash__ = None
 
     CONFIG_LINE = re.compile(r"^(\w+?)=(.*)$")
     parameters = {}
 
     def __init__(self):
-        parameters = {}
-        reflect.accumulateClassDict(self.__class__, "parameters", parameters)
-        self.parameters = parameters
-        super(Config, self).__init__((n, v.default) for n, v
-                                     in parameters.iteritems())
+        self._values = {}
+        self.version = 0
+
+    def bump_version(self):
+        """Mark the configuration as changed without changing any value."""
+
+        self.version += 1
+
+    def changes(self, name, value):
+        """Tell if setting C{value} changes the parameter C{name}. A mutable
+        value set again may have been changed in place."""
+
+        current = self[name]
+        return current != value or current is value and _mutable(value)
 
     # dict interface
 
+    def __getitem__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            return self.parameters[name].default
+
     def __setitem__(self, name, value):
         if name not in self.parameters:
             raise ValueError(_("Parameter %s not found") % name)
-        super(Config, self).__setitem__(name, value)
+        changed = self.changes(name, value)
+        if self[name] is not value:
+            self._values[name] = value
+        if changed:
+            self.version += 1
+
+    def __contains__(self, name):
+        return name in self.parameters
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        return iter(self._names)
+
+    iterkeys = __iter__
+
+    def keys(self):
+        return list(self._names)
+
+    def itervalues(self):
+        for name in self._names:
+            yield self[name]
+
+    def values(self):
+        return list(self.itervalues())
+
+    def iteritems(self):
+        for name in self._names:
+            yield name, self[name]
+
+    def items(self):
+        return list(self.iteritems())
+
+    def __eq__(self, other):
+        if not isinstance(other, Config):
+            return NotImplemented
+        return self.items() == other.items()
+
+    def __ne__(self, other):
+        if not isinstance(other, Config):
+            return NotImplemented
+        return self.items() != other.items()
+
+    def __copy__(self):
+        new = self.__class__.__new__(self.__class__)
+        new._values = self._values.copy()
+        new.version = 0
+        return new
+
+    def __deepcopy__(self, memo):
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        new._values = {}
+        new.version = 0
+        for name, default in zip(self._names, self._defaults):
+            value = copy.deepcopy(self[name], memo)
+            if value is not default:
+                new._values[name] = value
+        return new
+
+    def __getstate__(self):
+        return self._values
+
+    def __setstate__(self, state):
+        self._values = state
+        self.version = 0
+
+    def __repr__(self):
+        return "<{0} {1!r}>".format(self.__class__.__name__,
+                                   dict(self.iteritems()))
+
+    def iterchanged(self):
+        """Yield the name, the parameter and the value of the parameters that
+        have not the default value, sorted by name."""
+
+        for name, default in zip(self._names, self._defaults):
+            if name in self._values:
+                value = self._values[name]
+                if value != default:
+                    yield name, self.parameters[name], value
 
     # NOTE: old interface, values are always strings
     def get(self, name, default=None):
         try:
-            val = dict.__getitem__(self, name)
-            return self.parameters[name].to_string(val)
+            return self.parameters[name].to_string(self[name])
         except KeyError:
             return default
 
@@ -70,7 +198,7 @@ class Config(dict):
         return self.parameters[name].to_string(self[name])
 
     def dump(self, write):
-        for key in sorted(self.iterkeys()):
+        for key in self._names:
             write("%s=%s" % (key, self[key]))
 
 
@@ -196,6 +324,7 @@ class Base(object):
 
     def set_name(self, name):
         self._name = name
+        self.config.bump_version()
         self.notify_changed()
 
     name = property(get_name, set_name)
@@ -215,7 +344,7 @@ class Base(object):
 
     def set(self, attrs):
         for name, value in attrs.iteritems():
-            if value != self.config[name]:
+            if self.config.changes(name, value):
                 logger.info(attribute_set, attr=name, brick=self, value=value)
                 self.config[name] = value
                 setter = getattr(self, "cbset_" + name, None)
@@ -243,10 +372,9 @@ class Base(object):
     def save_to(self, fileobj):
         opt_tmp = "{0}={1}"
         l = []
-        for name, param in sorted(self.config.parameters.iteritems()):
-            if self.config[name] != param.default:
-                value = param.to_string_brick(self.config[name], self)
-                l.append(opt_tmp.format(name, value))
+        for name, param, value in self.config.iterchanged():
+            value = param.to_string_brick(value, self)
+            l.append(opt_tmp.format(name, value))
         if l:
             l.append("")
         tmp = "[{0}:{1}]\n{2}\n"
@@ -23,7 +23,8 @@ import termios
 import tty
 import re
 import copy
-import itertools
+import json
+import time
 
 from twisted.application import app
 from twisted.internet import defer, task, stdio, error
@@ -34,7 +35,10 @@ from twisted.conch import manhole
 
 from virtualbricks import errors, settings, configfile, console, project, log
 from virtualbricks import events, link, router, switches, tunnels, tuntaps
-from virtualbricks import virtualmachines, wires
+from virtualbricks import virtualmachines, wires, scheduler, procstat
+from virtualbricks import supervisor, helper, overlays, imagecache, qemu
+from virtualbricks import affinity, imagejobs
+from virtualbricks import _spawn
 from virtualbricks.virtualmachines import is_virtualmachine
 from virtualbricks import observable
 from virtualbricks.tools import is_running
@@ -57,6 +61,7 @@ shut_down = log.Event("Server Shut Down.")
 new_event_ok = log.Event("New event {name} OK")
 uncaught_exception = log.Event("Uncaught exception: {error()}")
 brick_stop = log.Event("Error on brick poweroff")
+checkpoints_save_error = log.Event("Cannot save the checkpoints in {path}")
 
 
 def install_brick_types(registry=None):
@@ -109,19 +114,38 @@ class BrickFactory(object):
         self.events = []
         self.socks = []
         self.disk_images = []
+        # Indexes used for lookups, they are kept in sync with the lists above
+        self.__bricks_by_name = {}
+        self.__events_by_name = {}
+        self.__images_by_name = {}
+        self.__images_by_path = {}
+        self.__socks_by_nickname = {}
         self.__factories = install_brick_types()
         self.__observable = observable.Observable(*self.__signals)
         self.changed = observable.Event(self.__observable, "brick-changed")
+        self.sampler = procstat.Sampler(self)
+        self.supervisor = supervisor.Supervisor(self)
+        self.helper = helper.Helper(os.path.join(settings.VIRTUALBRICKS_HOME,
+                                                 "helper.sock"))
+        self.overlays = overlays.OverlayCreator(int(settings.get("cowjobs")))
+        self.image_cache = imagecache.ImageCache()
+        # the budget is in megabytes
+        self.warm_pool = overlays.WarmPool(
+            self.overlays, int(settings.get("warmpoolbudget")) << 20)
+        self.placer = affinity.Placer(self)
+        self.image_jobs = imagejobs.JobQueue(int(settings.get("imagejobs")))
 
     def _notify(self, event, *args):
-        # if not self.__restore:
-            self.__observable.notify(event, *args)
+        self.__observable.notify(event, *args)
 
     def quit(self):
         if any(is_running(brick) for brick in self.bricks):
             msg = _("Cannot close virtualbricks: there are running bricks")
             raise errors.BrickRunningError(msg)
         logger.info(engine_bye)
+        for brick in self.bricks:
+            self.supervisor.cancel(brick)
+        self.helper.disconnect()
         for e in self.events:
             e.poweroff()
         self._notify("quit", self)
@@ -132,19 +156,22 @@ class BrickFactory(object):
         if any(is_running(brick) for brick in self.bricks):
             msg = _("Project cannot be closed: there are running bricks")
             raise errors.BrickRunningError(msg)
-        # Don't change the list while iterating over it
-        for brick in list(self.bricks):
-            if is_virtualmachine(brick):
-                brick.image_changed.disconnect(self._image_changed)
-            self.del_brick(brick)
-
-        # Don't change the list while iterating over it
-        for e in list(self.events):
-            self.del_event(e)
-
-        del self.socks[:]
-        for image in self.disk_images[:]:
-            self.remove_disk_image(image)
+        with observable.batch(self.__observable):
+            # Don't change the list while iterating over it
+            for brick in list(self.bricks):
+                if is_virtualmachine(brick):
+                    brick.image_changed.disconnect(self._image_changed)
+                self.del_brick(brick)
+
+            # Don't change the list while iterating over it
+            for e in list(self.events):
+                self.del_event(e)
+
+            del self.socks[:]
+            self.__socks_by_nickname.clear()
+            self.warm_pool.clear()
+            for image in self.disk_images[:]:
+                self.remove_disk_image(image)
 
     def register_brick_type(self, factory, *types):
         """Register a new brick type.
@@ -161,12 +188,26 @@ class BrickFactory(object):
     def connect(self, name, callback, *args, **kwds):
         self.__observable.add_observer(name, callback, args, kwds)
 
+    def connect_immediate(self, name, callback, *args, **kwds):
+        """Like L{connect} but the callback is called as soon as the signal
+        is emitted, even in batching mode."""
+
+        self.__observable.add_observer(name, callback, args, kwds, True)
+
     def disconnect(self, name, callback, *args, **kwds):
         self.__observable.remove_observer(name, callback, args, kwds)
 
+    def set_batching(self, batching):
+        """Coalesce the notifications until the end of the reactor turn.
+
+        In batching mode an observer is notified once for each object and
+        signal, no matter how many times the signal is emitted.
+        """
+
+        self.__observable.set_batching(batching)
+
     def set_restore(self, restore):
-        # self.__restore = restore
-        pass
+        self.set_batching(restore)
 
     # Disk Images
 
@@ -179,31 +220,38 @@ class BrickFactory(object):
         img = virtualmachines.Image(self.normalize_name(name), path,
                                     description)
         self.disk_images.append(img)
+        self.__images_by_name[img.name] = img
+        self.__images_by_path[img.path] = img
         self._notify("image-added", img)
         return img
 
     def assert_path_not_in_use(self, path):
-        for img in self.disk_images:
-            if img.path == path:
-                raise errors.ImageAlreadyInUseError(path)
+        if path in self.__images_by_path:
+            raise errors.ImageAlreadyInUseError(path)
 
     def remove_disk_image(self, image):
         self.disk_images.remove(image)
+        del self.__images_by_name[image.name]
+        del self.__images_by_path[image.path]
+        self.image_cache.invalidate(image.path)
+        self.warm_pool.discard(image)
         self._notify("image-removed", image)
 
+    def rename_disk_image(self, image, name):
+        name = self.normalize_name(name)
+        del self.__images_by_name[image.name]
+        image.name = name
+        self.__images_by_name[name] = image
+
     def get_image_by_name(self, name):
         """Return a disk image given its name or {None}."""
 
-        for img in self.disk_images:
-            if img.name == name:
-                return img
+        return self.__images_by_name.get(name)
 
     def get_image_by_path(self, path):
         """Get disk image object from the image library by its path."""
 
-        for img in self.disk_images:
-            if img.path == path:
-                return img
+        return self.__images_by_path.get(path)
 
     # Bricks
 
@@ -226,6 +274,7 @@ class BrickFactory(object):
             raise errors.InvalidTypeError(_("Invalid brick type %s") % type)
         brick = Type(self, self.normalize_name(name))
         self.bricks.append(brick)
+        self.__bricks_by_name[brick.name] = brick
         brick.changed.connect(self._brick_changed)
         if is_virtualmachine(brick):
             brick.image_changed.connect(self._image_changed)
@@ -249,28 +298,123 @@ class BrickFactory(object):
             msg = "Cannot delete brick {0:n}: brick is running".format(brick)
             raise errors.BrickRunningError(msg)
         logger.info(remove_brick, brick=brick.name)
-        socks = set(brick.socks)
-        if socks:
+        if brick.socks:
             logger.info(remove_socks,
-                        socks=", ".join(s.nickname for s in socks))
-            for _brick in self.bricks:
-                for plug in _brick.plugs:
-                    if plug.configured() and plug.sock in socks:
-                        logger.info(disconnect_plug, sock=plug.sock.nickname)
-                        plug.disconnect()
+                        socks=", ".join(s.nickname for s in brick.socks))
+            for sock in brick.socks:
+                for plug in list(sock.plugs):
+                    logger.info(disconnect_plug, sock=sock.nickname)
+                    plug.disconnect()
             for sock in [s for s in self.socks if s.brick is brick]:
                 self.socks.remove(sock)
+                self.__unindex_sock(sock)
         for plug in brick.plugs:
             if plug.configured():
                 plug.disconnect()
+        self.supervisor.forget(brick)
         self.bricks.remove(brick)
+        del self.__bricks_by_name[brick.name]
         brick.changed.disconnect(self._brick_changed)
         self._notify("brick-removed", brick)
 
+    def poweron_all(self, concurrency=scheduler.DEFAULT_CONCURRENCY):
+        """Start all the bricks, the independent ones in parallel.
+
+        @return: a deferred that fires with a L{scheduler.Report}.
+        """
+
+        return scheduler.poweron(self.bricks, concurrency)
+
+    def poweroff_all(self, timeout=scheduler.DEFAULT_TIMEOUT,
+                     kill_timeout=scheduler.DEFAULT_KILL_TIMEOUT):
+        """Stop all the running bricks, the independent ones in parallel.
+
+        Virtual machines are powered down through their monitor first, the
+        bricks still running after C{timeout} seconds are terminated and then
+        killed after other C{kill_timeout} seconds.
+
+        @return: a deferred that fires with a L{scheduler.Report}.
+        """
+
+        return scheduler.poweroff(self.bricks, timeout, kill_timeout)
+
+    # Checkpoints
+
+    def _checkpoints_file(self):
+        return os.path.join(settings.VIRTUALBRICKS_HOME, "checkpoints.json")
+
+    def get_checkpoints(self):
+        """Return the checkpoints of the project, a dictionary that maps the
+        tag of a checkpoint to the time it was taken and to the names of the
+        virtual machines saved in it."""
+
+        try:
+            with open(self._checkpoints_file()) as fp:
+                return json.load(fp)
+        except (IOError, ValueError):
+            return {}
+
+    def _record_checkpoint(self, report, tag):
+        checkpoints = self.get_checkpoints()
+        checkpoints[tag] = {"time": time.time(),
+                            "bricks": [r.brick.name for r in report
+                                       if r.success]}
+        filename = self._checkpoints_file()
+        tmp = filename + ".tmp"
+        try:
+            with open(tmp, "w") as fp:
+                json.dump(checkpoints, fp)
+            os.rename(tmp, filename)
+        except (IOError, OSError):
+            logger.failure(checkpoints_save_error, path=filename)
+        return report
+
+    def checkpoint_all(self, tag,
+                       concurrency=scheduler.DEFAULT_SNAPSHOT_CONCURRENCY):
+        """Save the state of all the running virtual machines in the
+        snapshot C{tag}, see L{scheduler.checkpoint}.
+
+        @return: a deferred that fires with a L{scheduler.Report}.
+        @raise InvalidNameError: if the tag is not valid.
+        """
+
+        if not re.match(r"\A[a-zA-Z0-9_.-]+\Z", tag):
+            raise errors.InvalidNameError(
+                _("Invalid checkpoint name %s") % tag)
+        vms = [brick for brick in self.bricks if is_virtualmachine(brick)]
+        d = scheduler.checkpoint(vms, tag, concurrency)
+        return d.addCallback(self._record_checkpoint, tag)
+
+    def restore_all(self, tag,
+                    concurrency=scheduler.DEFAULT_SNAPSHOT_CONCURRENCY):
+        """Bring the virtual machines saved in the checkpoint C{tag} back to
+        it, see L{scheduler.restore}.
+
+        @return: a deferred that fires with a L{scheduler.Report}.
+        @raise InvalidNameError: if there is no such checkpoint.
+        """
+
+        try:
+            names = self.get_checkpoints()[tag]["bricks"]
+        except KeyError:
+            raise errors.InvalidNameError(_("No checkpoint %s") % tag)
+        vms = [self.get_brick_by_name(name) for name in names
+               if self.get_brick_by_name(name) is not None]
+        return scheduler.restore(vms, tag, concurrency)
+
     def get_brick_by_name(self, name):
-        for b in self.bricks:
-            if b.name == name:
-                return b
+        return self.__bricks_by_name.get(name)
+
+    def rename_brick(self, brick, name):
+        name = self.normalize_name(name)
+        socks = [s for s in self.socks if s.brick is brick]
+        for sock in socks:
+            self.__unindex_sock(sock)
+        del self.__bricks_by_name[brick.name]
+        brick.set_name(name)
+        self.__bricks_by_name[name] = brick
+        for sock in socks:
+            self.__socks_by_nickname[sock.nickname] = sock
 
     def _brick_changed(self, brick):
         self._notify("brick-changed", brick)
@@ -292,6 +436,7 @@ class BrickFactory(object):
         event = events.Event(self, self.normalize_name(name))
         logger.debug(new_event_ok, name=event.name)
         self.events.append(event)
+        self.__events_by_name[event.name] = event
         event.changed.connect(self._event_changed)
         self._notify("event-added", event)
         return event
@@ -306,15 +451,17 @@ class BrickFactory(object):
         event.poweroff()
         event.changed.disconnect(self._event_changed)
         self.events.remove(event)
+        del self.__events_by_name[event.name]
         self._notify("event-removed", event)
 
     def get_event_by_name(self, name):
-        for e in self.events:
-            if e.name == name:
-                return e
+        return self.__events_by_name.get(name)
 
     def rename_event(self, event, name):
-        event.name = self.normalize_name(name)
+        name = self.normalize_name(name)
+        del self.__events_by_name[event.name]
+        event.name = name
+        self.__events_by_name[name] = event
         self._event_changed(event)
 
     def _event_changed(self, event):
@@ -329,10 +476,9 @@ class BrickFactory(object):
         """used to determine whether the chosen name can be used or
         it has already a duplicate among bricks or events."""
 
-        for o in itertools.chain(self.bricks, self.events, self.disk_images):
-            if o.name == name:
-                return True
-        return False
+        return (name in self.__bricks_by_name or
+                name in self.__events_by_name or
+                name in self.__images_by_name)
 
     def normalize_name(self, name):
         """
@@ -364,22 +510,22 @@ class BrickFactory(object):
     def new_sock(self, brick, name=""):
         sock = link.Sock(brick, name)
         self.socks.append(sock)
+        self.__socks_by_nickname[sock.nickname] = sock
         return sock
 
+    def __unindex_sock(self, sock):
+        if self.__socks_by_nickname.get(sock.nickname) is sock:
+            del self.__socks_by_nickname[sock.nickname]
+
     def get_sock_by_name(self, name):
         if name == "_hostonly":
             return virtualmachines.hostonly_sock
-        for sock in self.socks:
-            if sock.nickname == name:
-                return sock
+        return self.__socks_by_nickname.get(name)
 
     def connect_to(self, brick, nick):
-        endpoint = None
         if not nick:
             return None
-        for n in self.socks:
-            if n.nickname == nick:
-                endpoint = n
+        endpoint = self.__socks_by_nickname.get(nick)
         if endpoint is not None:
             return brick.connect(endpoint)
         else:
@@ -602,6 +748,9 @@ class Application:
                                       project.manager.save_current, factory)
         reactor.addSystemEventTrigger("before", "shutdown", self.logger.stop)
         AutosaveTimer(factory)
+        factory.sampler.start()
+        _spawn.warm_cache()
+        qemu.probe()
         if not self.config["noterm"] and not self.config["daemon"]:
             namespace = self.get_namespace()
             namespace["factory"] = factory
@@ -20,12 +20,14 @@
 import os
 import collections
 import functools
+import itertools
 import re
 
 from twisted.internet import protocol, reactor, error, defer
 from zope.interface import implementer
 
-from virtualbricks import base, errors, settings, log, interfaces
+from virtualbricks import (base, errors, settings, log, interfaces, procstat,
+                           supervisor, affinity)
 from virtualbricks.base import (Config as _Config, Parameter, String, Integer,
                                 SpinInt, Float, SpinFloat, Boolean, Object,
                                 ListOf)
@@ -51,6 +53,7 @@ console_done = log.Event("Console terminated\n{status}")
 console_terminated = log.Event("Console terminated\n{status}\nProcess stdout:"
                                "\n{out()}\nProcess stderr:\n{err()}\n")
 invalid_ack = log.Event("ACK received but no command sent.")
+command_failed = log.Event("Command {cmd} failed")
 
 
 class ProcessLogger(object):
@@ -127,21 +130,31 @@ class VDEProcessProtocol(Process):
     """
     Handle the VDE management console.
 
-    Commands are serialized, until an ACK is received, the next command is not
-    sent.
+    Commands are pipelined, up to C{pipeline_size} commands are sent before
+    their ACKs are received, the others are queued. The process answers the
+    commands in order, each ACK fires the deferred of the oldest command.
 
     @cvar delimiter: The line-ending delimiter to use.
+    @cvar PIPELINE_SIZE: The default size of the pipeline.
     """
 
     _buffer = ""
     delimiter = "\n"
     prompt = re.compile(r"^vde(?:\[[^]]*\]:|\$) ", re.MULTILINE)
-    PIPELINE_SIZE = 1
+    status = re.compile(r"^1(\d{3}) (.*)$", re.MULTILINE)
+    data_start = "0000 DATA END WITH '.'"
+    PIPELINE_SIZE = 8
 
-    def __init__(self, brick):
+    def __init__(self, brick, pipeline_size=None):
         Process.__init__(self, brick)
+        if pipeline_size is None:
+            pipeline_size = self.PIPELINE_SIZE
+        self.pipeline_size = pipeline_size
+        # the commands not acknowledged yet, the first _sent are already
+        # written to the process
         self.queue = collections.deque()
-
+        self._deferreds = collections.deque()
+        self._sent = 0
 
     def data_received(self, data):
         """
@@ -156,31 +169,99 @@ class VDEProcessProtocol(Process):
     def ack_received(self, ack):
         self.logger.info(ack)
         try:
-            self.queue.popleft()
+            cmd = self.queue.popleft()
         except IndexError:
             self.logger.warn(invalid_ack)
             self.transport.loseConnection()
         else:
-            if len(self.queue):
-                self._send_command()
+            self._sent -= 1
+            deferred = self._deferreds.popleft()
+            self._flush()
+            try:
+                response = self.parse_response(ack)
+            except errors.CommandError as e:
+                e.command = cmd
+                deferred.errback(e)
+            else:
+                deferred.callback(response)
+
+    def parse_response(self, ack):
+        """Return the text of the response.
+
+        If the response has a data block only the data is returned. If the
+        status reported is an error, L{errors.CommandError} is raised.
+        """
+
+        match = None
+        for match in self.status.finditer(ack):
+            pass
+        if match is not None and int(match.group(1)) != 0:
+            raise errors.CommandError(int(match.group(1)), match.group(2))
+        lines = ack.splitlines()
+        if self.data_start in lines:
+            data = lines[lines.index(self.data_start) + 1:]
+            if "." in data:
+                data = data[:data.index(".")]
+            return "\n".join(data)
+        if match is not None:
+            ack = ack[:match.start()]
+        return ack.strip()
 
     def send_command(self, cmd):
+        """Send a command to the process.
+
+        @return: a deferred that fires with the response of the process, see
+            L{parse_response}.
+        """
+
+        deferred = self._enqueue(cmd)
+        self._flush()
+        return deferred
+
+    def send_batch(self, cmds):
+        """Send many commands to the process with a single write, as many as
+        the pipeline allows.
+
+        @return: a deferred that fires with the list of the responses or
+            fails with L{defer.FirstError} if a command fails.
+        """
+
+        deferreds = [self._enqueue(cmd) for cmd in cmds]
+        self._flush()
+        return defer.gatherResults(deferreds, consumeErrors=True)
+
+    def _enqueue(self, cmd):
+        deferred = defer.Deferred()
         self.queue.append(cmd)
-        if 0 < len(self.queue) <= self.PIPELINE_SIZE:
-            self._send_command()
+        self._deferreds.append(deferred)
+        return deferred
+
+    def _flush(self):
+        data = []
+        while self._sent < min(len(self.queue), self.pipeline_size):
+            cmd = self.queue[self._sent]
+            self.logger.info(cmd)
+            data.append(cmd)
+            if not cmd.endswith(self.delimiter):
+                data.append(self.delimiter)
+            self._sent += 1
+        if data:
+            self.transport.writeSequence(data)
 
-    def _send_command(self):
-        cmd = self.queue[0]
-        self.logger.info(cmd)
-        if cmd.endswith(self.delimiter):
-            return self.transport.write(cmd)
-        return self.transport.writeSequence((cmd, self.delimiter))
+    def processEnded(self, status):
+        self.queue.clear()
+        self._sent = 0
+        deferreds, self._deferreds = self._deferreds, collections.deque()
+        Process.processEnded(self, status)
+        for deferred in deferreds:
+            deferred.errback(status)
 
     def outReceived(self, data):
         self.data_received(data)
 
     def write(self, cmd):
-        self.send_command(cmd)
+        d = self.send_command(cmd)
+        d.addErrback(self.logger.failure_eb, command_failed, cmd=cmd.rstrip())
 
 
 class TermProtocol(protocol.ProcessProtocol):
@@ -212,7 +293,10 @@ class TermProtocol(protocol.ProcessProtocol):
 class Config(_Config):
 
     parameters = {"pon_vbevent": String(""),
-                  "poff_vbevent": String("")}
+                  "poff_vbevent": String(""),
+                  "restart": String(supervisor.NEVER),
+                  # a list of CPUs, "auto" or empty to run anywhere
+                  "affinity": String("")}
 
 
 class Brick(base.Base):
@@ -223,6 +307,9 @@ class Brick(base.Base):
     _started_d = None
     _exited_d = None
     _last_status = None
+    _cmd_lines = None
+    _stop_requested = False
+    usage = None
     process_protocol = VDEProcessProtocol
     config_factory = Config
 
@@ -251,6 +338,7 @@ class Brick(base.Base):
             return defer.fail(errors.NotConnectedError(
                 _("Cannot start '%s': not connected") % self.name))
 
+        self._stop_requested = False
         self._started_d = started = defer.Deferred()
         self._exited_d = defer.Deferred()
         d = self._check_links()
@@ -274,8 +362,10 @@ class Brick(base.Base):
         return started
 
     def poweroff(self, kill=False):
+        self.factory.supervisor.cancel(self)
         if self.proc is None:
             return defer.succeed((self, self._last_status))
+        self._stop_requested = True
         logger.info(shutdown_brick, name=self.name, pid=self.proc.pid)
         try:
             self.proc.signal_process("KILL" if kill else "TERM")
@@ -288,6 +378,9 @@ class Brick(base.Base):
     def get_parameters(self):
         raise NotImplementedError("Bricks.get_parameters() not implemented")
 
+    def rename(self, name):
+        self.factory.rename_brick(self, name)
+
     def configure(self, attrlist):
         attrs = {}
         for name, value in (a.split("=", 2) for a in attrlist):
@@ -307,14 +400,44 @@ class Brick(base.Base):
 
     def process_ended(self, proc, status):
         self.proc = None
+        self.usage = None
         self._start_related_events(off=True)
         self._last_status = status
+        self.factory.placer.release(self)
         # ovvensive programming, raise an exception instead of hide the error
         # behind a lambda (lambda _: None)
         exited, self._exited_d = self._exited_d, None
         exited.callback((self, status))
+        self.factory.supervisor.process_ended(self, status,
+                                              self._stop_requested)
         self.notify_changed()
 
+    def reattach(self, brick):
+        """Connect again to C{brick}, called when C{brick} has been restarted
+        and this brick is plugged to it.
+
+        The brick is restarted.
+        """
+
+        d = self.poweroff()
+        d.addCallback(lambda _: self.poweron())
+        return d
+
+    def cpu_affinity(self):
+        """Return the CPUs where the process of the brick runs or C{None} if
+        it can run anywhere."""
+
+        spec = self.config["affinity"]
+        if spec == affinity.AUTO:
+            return self.factory.placer.place(self)
+        if spec:
+            try:
+                return affinity.parse_cpus(spec)
+            except ValueError:
+                raise errors.BadConfigError(
+                    _("Invalid CPU affinity %s for %s") % (spec, self.name))
+        return None
+
     # Interal interface
 
     def _properly_connected(self):
@@ -330,10 +453,55 @@ class Brick(base.Base):
     def args(self):
         return [self.prog()] + self.build_cmd_line()
 
+    def cached_args(self):
+        """Return the command line built for the current configuration or
+        C{None} if it is not built yet."""
+
+        cmd_line = self._get_memoized("cmd_line")
+        if cmd_line is not None:
+            return [self.prog()] + cmd_line
+        return None
+
     def prog(self):
         raise NotImplementedError(_("Brick.prog() not implemented."))
 
+    def cmd_line_key(self):
+        """Return the state the command line of the brick is built from.
+
+        The configuration of the brick and its links are tracked by the
+        version of the configuration, the socks of the other bricks, the
+        addresses of the plugs and the project home are changed elsewhere and
+        they are part of the key. The executable is not part of the command
+        line, it is resolved at every start.
+        """
+
+        links = tuple((link.mode, link.sock and link.sock.path,
+                       getattr(link, "model", None),
+                       getattr(link, "mac", None))
+                      for link in itertools.chain(self.plugs, self.socks))
+        return self.config.version, links, settings.VIRTUALBRICKS_HOME
+
+    def _get_memoized(self, name):
+        if self._cmd_lines is not None and name in self._cmd_lines:
+            key, value = self._cmd_lines[name]
+            if key == self.cmd_line_key():
+                return value
+        return None
+
+    def _memoize(self, name, build):
+        value = self._get_memoized(name)
+        if value is None:
+            if self._cmd_lines is None:
+                self._cmd_lines = {}
+            key = self.cmd_line_key()
+            value = build()
+            self._cmd_lines[name] = key, value
+        return value
+
     def build_cmd_line(self):
+        return list(self._memoize("cmd_line", self._build_cmd_line))
+
+    def _build_cmd_line(self):
         # TODO: documents the behavior of all cases (#, *, etc.)
         res = []
 
@@ -356,16 +524,26 @@ class Brick(base.Base):
         def start_process(value):
             prog, args = value
             logger.info(start_brick, args=lambda: " ".join(args))
+            self.proc = self.process_protocol(self)
+            cpus = self.cpu_affinity()
             # usePTY?
             if self.needsudo():
+                if settings.get("helper"):
+                    return self.factory.helper.spawn(self.proc, args, cpus)
                 prog = settings.get("sudo")
                 args = [settings.get("sudo"), "--"] + args
-            self.proc = self.process_protocol(self)
-            reactor.spawnProcess(self.proc, prog, args, os.environ)
+            with affinity.pinned(cpus):
+                reactor.spawnProcess(self.proc, prog, args, os.environ)
+
+        def spawn_failed(failure):
+            self.proc = None
+            self.factory.placer.release(self)
+            return failure
 
         l = [defer.maybeDeferred(self.prog), defer.maybeDeferred(self.args)]
         d = defer.gatherResults(l, consumeErrors=True)
         d.addCallback(start_process)
+        d.addErrback(spawn_failed)
         return d
 
     def _start_related_events(self, on=True, off=False):
@@ -396,6 +574,7 @@ class Brick(base.Base):
         for p in self.plugs:
             if not p.configured():
                 p.connect(endpoint)
+                self.config.bump_version()
                 self.notify_changed()
                 return
 
@@ -403,6 +582,7 @@ class Brick(base.Base):
         for p in self.plugs:
             if p.configured():
                 p.disconnect()
+        self.config.bump_version()
         self.notify_changed()
 
     ############################
@@ -440,6 +620,12 @@ class Brick(base.Base):
             if self.pid == -10:
                 return "python-thread   "
             return str(self.pid)
+        elif format_string == "c":
+            return procstat.format_usage(self.usage)[0]
+        elif format_string == "m":
+            return procstat.format_usage(self.usage)[1]
+        elif format_string == "i":
+            return procstat.format_usage(self.usage)[2]
         return base.Base.__format__(self, format_string)
 
     def __repr__(self):
@@ -173,13 +173,21 @@ class ImageBuilder:
 
     def load_from(self, factory, section):
         logger.debug(image_found, name=self.name)
-        path = dict(section).get("path", "")
+        options = dict(section)
+        path = options.get("path", "")
         if factory.is_in_use(self.name):
             logger.info(skip_image, name=self.name)
         elif not os.access(path, os.R_OK):
             logger.info(skip_image_noa)
         else:
-            return factory.new_disk_image(self.name, path)
+            image = factory.new_disk_image(self.name, path)
+            try:
+                warm_pool = int(options.get("warm_pool", 0))
+            except ValueError:
+                warm_pool = 0
+            if warm_pool > 0:
+                factory.warm_pool.resize(image, warm_pool)
+            return image
 
 
 @implementer(interfaces.IBuilder)
@@ -17,13 +17,15 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 
 import os
+import time
 import textwrap
 
 from twisted.internet import interfaces, utils
 from twisted.protocols import basic
 from zope.interface import implementer
 
-from virtualbricks import __version__, bricks, errors, log, settings
+from virtualbricks import __version__, bricks, errors, log, settings, procstat
+from virtualbricks import affinity, tools
 
 
 logger = log.Logger()
@@ -75,6 +77,20 @@ class NullTransportAdapter:
     __init__ = loseConnection = getPeer = getHost = lambda s: None
 
 
+def _numbers(convert, minimum, *values):
+    """Convert the optional numeric arguments of a command, the missing ones
+    are left out.
+
+    @raise ValueError: if an argument is not a number or is less than
+        C{minimum}.
+    """
+
+    numbers = [convert(value) for value in values if value is not None]
+    if any(number < minimum for number in numbers):
+        raise ValueError("%s is less than %s" % (min(numbers), minimum))
+    return numbers
+
+
 def parse(factory, command, console=None):
     protocol = VBProtocol(factory)
     transport = interfaces.ITransport(console, NullTransportAdapter())
@@ -124,6 +140,19 @@ class VBProtocol(Protocol):
     socks                   List of connections available for bricks
     conn[ections]           List of connections for each bricks
     reset                   Remove all the bricks and events
+    startall [N]            Start all the bricks, at most N at a time
+    stopall [T [K]]         Stop all the bricks, terminate the ones still
+                            running after T seconds (default 30) and kill
+                            them K seconds later (default 5)
+    checkpoint TAG [N]      Save all the running VMs, N at a time
+    restore TAG [N]         Bring the VMs back to a checkpoint
+    checkpoints             List the checkpoints of the project
+    cmdlines                Show the cached command line of every brick
+    restarts                Show the restart policy and history of bricks
+    placement               Show the NUMA node of the auto placed bricks
+    memory                  Show the free huge pages and the KSM savings
+    jobs                    List the qemu-img jobs
+    cancel ID               Cancel the qemu-img job ID
     quit                    Stop virtualbricks
     event *args             TODO
     brick *args             TODO
@@ -236,14 +265,152 @@ class VBProtocol(Protocol):
         if not procs:
             self.sendLine("No process running")
         else:
-            self.sendLine("PID\tType\tName")
-            self.sendLine("-" * 24)
+            self.sendLine("PID\tType\tName\tCPU\tRSS\tI/O (read, write)")
+            self.sendLine("-" * 56)
             for b in procs:
-                self.sendLine("%d\t%s\t%s" % (b.pid, b.get_type(), b.name))
+                cpu, rss, io = procstat.format_usage(b.usage)
+                self.sendLine("%d\t%s\t%s\t%s\t%s\t%s" % (
+                    b.pid, b.get_type(), b.name, cpu, rss, io))
 
     def do_reset(self):
         self.factory.reset()
 
+    def send_report(self, report):
+        for result in report:
+            if result.success:
+                status = "{0:.3f}s".format(result.elapsed)
+            else:
+                status = result.result.getErrorMessage()
+            self.sendLine("%s\t%s\t%s" % (result.brick.name,
+                                          "ok" if result.success else "error",
+                                          status))
+        self.sendLine("%d bricks in %.3f seconds" % (len(report),
+                                                     report.elapsed))
+
+    def do_startall(self, concurrency=None):
+        """Start all the bricks"""
+
+        try:
+            args = _numbers(int, 1, concurrency)
+        except ValueError:
+            self.sendLine("usage: startall [N]")
+            return
+        self.factory.poweron_all(*args).addCallback(self.send_report)
+
+    def do_stopall(self, timeout=None, kill_timeout=None):
+        """Stop all the bricks"""
+
+        try:
+            args = _numbers(float, 0, timeout, kill_timeout)
+        except ValueError:
+            self.sendLine("usage: stopall [T [K]]")
+            return
+        self.factory.poweroff_all(*args).addCallback(self.send_report)
+
+    def do_checkpoint(self, tag, concurrency=None):
+        """Save the state of all the running virtual machines"""
+
+        try:
+            args = _numbers(int, 1, concurrency)
+        except ValueError:
+            self.sendLine("usage: checkpoint TAG [N]")
+            return
+        self.factory.checkpoint_all(tag, *args).addCallback(self.send_report)
+
+    def do_restore(self, tag, concurrency=None):
+        """Bring the virtual machines back to a checkpoint"""
+
+        try:
+            args = _numbers(int, 1, concurrency)
+        except ValueError:
+            self.sendLine("usage: restore TAG [N]")
+            return
+        self.factory.restore_all(tag, *args).addCallback(self.send_report)
+
+    def do_checkpoints(self):
+        """List the checkpoints of the project"""
+
+        checkpoints = self.factory.get_checkpoints()
+        for tag, checkpoint in sorted(checkpoints.items(),
+                                      key=lambda item: item[1]["time"]):
+            self.sendLine("%s\t%s\t%s" % (
+                tag, time.strftime("%Y-%m-%d %H:%M:%S",
+                                   time.localtime(checkpoint["time"])),
+                " ".join(checkpoint["bricks"])))
+
+    def do_cmdlines(self):
+        """Show the cached command line of every brick"""
+
+        for brick in self.factory.bricks:
+            args = brick.cached_args()
+            if args is None:
+                self.sendLine("%s\tnot cached" % brick.name)
+            else:
+                self.sendLine("%s\t%s" % (brick.name, " ".join(args)))
+
+    def do_restarts(self):
+        """Show the restart policy and history of every brick"""
+
+        self.sendLine("Name\tPolicy\tRestarts\tDowntime\tState")
+        for brick in self.factory.bricks:
+            metrics = self.factory.supervisor.metrics(brick)
+            if self.factory.supervisor.is_pending(brick):
+                state = "restarting"
+            elif metrics.gave_up:
+                state = "crash loop"
+            else:
+                state = brick.get_state()
+            self.sendLine("%s\t%s\t%d\t%.1fs\t%s" % (
+                brick.name, brick.config["restart"], metrics.restarts,
+                metrics.downtime, state))
+
+    def do_placement(self):
+        """Show the NUMA node of the bricks with the auto affinity"""
+
+        nodes = self.factory.placer.nodes()
+        placements = self.factory.placer.placements
+        for brick in sorted(placements, key=lambda brick: brick.name):
+            node = placements[brick]
+            self.sendLine("%s\tnode %d\t%s" % (
+                brick.name, node, affinity.format_cpus(nodes[node])))
+
+    def do_memory(self):
+        """Show the huge pages available and the memory saved by KSM"""
+
+        pools = tools.hugepages()
+        if not pools:
+            self.sendLine("huge pages: not supported")
+        for size, total, free in pools:
+            self.sendLine("huge pages %s: %d free of %d" % (
+                tools.fmtsize(size), free, total))
+        self.sendLine("hugetlbfs: %s" % (tools.hugetlbfs_mount() or
+                                         "not mounted"))
+        stats = tools.ksm_stats()
+        if stats is None:
+            self.sendLine("ksm: not supported")
+        else:
+            self.sendLine("ksm: %s, %d pages shared by %d, %s saved" % (
+                "running" if stats["run"] == 1 else "stopped",
+                stats["pages_shared"], stats["pages_sharing"],
+                tools.fmtsize(stats["saved"])))
+
+    def do_jobs(self):
+        """List the qemu-img jobs"""
+
+        for job in self.factory.image_jobs.jobs:
+            self.sendLine("%d\t%s\t%.1f%%\t%s" % (job.id, job.state,
+                                                  job.progress,
+                                                  job.description))
+
+    def do_cancel(self, id):
+        """Cancel a qemu-img job"""
+
+        job = self.factory.image_jobs.get(int(id))
+        if job is None:
+            self.sendLine("No such job %s" % id)
+        elif not self.factory.image_jobs.cancel(job):
+            self.sendLine("Job %s is already %s" % (id, job.state))
+
     def do_new(self, typ, name):
         """Create a new brick or event"""
 
@@ -322,6 +489,31 @@ class ImagesProtocol(Protocol):
         for img in self.factory.disk_images:
             self.sendLine("%s, %s" % (img.name, img.path))
 
+    def do_warmpool(self, name, size=None):
+        image = self.factory.get_image_by_name(name)
+        if image is None:
+            self.sendLine("No such image %s" % name)
+        elif size is None:
+            self.sendLine("%s: %d overlays, %d ready" % (
+                image.name, image.warm_pool,
+                self.factory.warm_pool.size(image)))
+        else:
+            self.factory.warm_pool.resize(image, int(size))
+
+    def _queued(self, job):
+        self.sendLine("job %d queued: %s" % (job.id, job.description))
+
+    def do_commit(self, path):
+        self._queued(self.factory.image_jobs.commit(path))
+
+    def do_rebase(self, path, backing_file):
+        self._queued(self.factory.image_jobs.rebase(path, backing_file,
+                                                    unsafe=False))
+
+    def do_convert(self, source, destination, fmt="qcow2"):
+        self._queued(self.factory.image_jobs.convert(source, destination,
+                                                     fmt))
+
     # def do_files(self):
     #     dirname = settings.get("baseimages")
     #     for image_file in os.listdir(dirname):
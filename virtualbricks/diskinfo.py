@@ -0,0 +1,281 @@
+# -*- test-case-name: virtualbricks.tests.test_diskinfo -*-
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+Read the metadata of the disk images without running qemu-img.
+
+The images are mapped in memory and only the headers and, for qcow2 and QED,
+the L1 and L2 tables are read. The allocated size is the size of the guest
+clusters allocated in the image itself, not in its backing files.
+"""
+
+import os
+import re
+import mmap
+import struct
+
+from virtualbricks import tools
+
+
+__all__ = ["DiskInfo", "read", "backing_chain", "scan",
+           "CorruptedImageError"]
+
+QCOW_HEADER = struct.Struct(">IIQIIQBBxxIQ")
+QCOW2_HEADER = struct.Struct(">IIQIIQIIQQIIQ")
+QCOW2_V3_HEADER = struct.Struct(">QQQII")
+QCOW2_OFFSET_MASK = 0x00fffffffffffe00
+QCOW2_EXT_BACKING_FORMAT = 0xe2792aca
+QED_HEADER = struct.Struct("<IIIIQQQQQII")
+VMDK_HEADER = struct.Struct("<IIIQQQQIQQQ")
+VDI_HEADER = struct.Struct("<IIIII256sII16sIQIIII")
+VDI_HEADER_OFFSET = 64
+SECTOR = 512
+PARENT_HINT_RE = re.compile(r'^parentFileNameHint\s*=\s*"([^"]*)"', re.M)
+MAX_CHAIN = 64
+
+
+class CorruptedImageError(Exception):
+    pass
+
+
+class DiskInfo:
+    """
+    @ivar format: a L{tools.ImageFormat}.
+    @ivar virtual_size: the size of the disk seen by the guest.
+    @ivar disk_size: the space used on the host.
+    @ivar allocated: the bytes allocated in the image, C{None} if unknown.
+    @ivar cluster_size: the allocation unit, C{None} if the format has not.
+    @ivar backing_file: the backing file as written in the header, C{""} if
+        the image has no backing file, C{None} if the format does not support
+        backing files.
+    @ivar backing_format: the format of the backing file, if it is recorded.
+    """
+
+    def __init__(self, path, format, virtual_size, disk_size, allocated=None,
+                 cluster_size=None, backing_file=None, backing_format=None):
+        self.path = path
+        self.format = format
+        self.virtual_size = virtual_size
+        self.disk_size = disk_size
+        self.allocated = allocated
+        self.cluster_size = cluster_size
+        self.backing_file = backing_file
+        self.backing_format = backing_format
+
+    def backing_path(self):
+        """Return the absolute path of the backing file, C{None} if the image
+        has no backing file."""
+
+        if not self.backing_file:
+            return None
+        return os.path.join(os.path.dirname(os.path.abspath(self.path)),
+                            self.backing_file)
+
+    def __repr__(self):
+        return "<DiskInfo {0.path} {0.format.name} {0.virtual_size}>".format(
+            self)
+
+
+def _unpack(header, data, offset=0):
+    if len(data) < offset + header.size:
+        raise CorruptedImageError("truncated header")
+    return header.unpack_from(data, offset)
+
+
+def _string(data, offset, size):
+    if offset + size > len(data):
+        raise CorruptedImageError("string outside of the image")
+    return data[offset:offset + size]
+
+
+def _table(data, offset, entries, endian):
+    if offset + entries * 8 > len(data):
+        # the tail of a table may be not written yet
+        entries = max(len(data) - offset, 0) // 8
+    return struct.unpack_from("{0}{1}Q".format(endian, entries), data, offset)
+
+
+def _count_allocated(data, l1, entries, endian):
+    """Count the entries of the L2 tables that are neither zero nor zero
+    clusters, the entries are counted as they are stored on disk."""
+
+    zero_cluster = struct.unpack("=Q", struct.pack(endian + "Q", 1))[0]
+    count = 0
+    for offset in l1:
+        offset &= QCOW2_OFFSET_MASK
+        if offset:
+            l2 = _table(data, offset, entries, "=")
+            count += len(l2) - l2.count(0) - l2.count(zero_cluster)
+    return count
+
+
+def _read_cow(data, info):
+    info.backing_file = data[tools._L:tools._L + tools.COW_SIZE].rstrip("\x00")
+
+
+def _read_qcow(data, info):
+    (_, _, backing_offset, backing_size, _, size, cluster_bits, _, _,
+     _) = _unpack(QCOW_HEADER, data)
+    info.virtual_size = size
+    info.cluster_size = 1 << cluster_bits
+    info.backing_file = _string(data, backing_offset, backing_size)
+
+
+def _read_qcow2(data, info):
+    (_, version, backing_offset, backing_size, cluster_bits, size, _, l1_size,
+     l1_offset, _, _, _, _) = _unpack(QCOW2_HEADER, data)
+    if not 9 <= cluster_bits <= 21:
+        raise CorruptedImageError("invalid cluster size")
+    info.virtual_size = size
+    info.cluster_size = cluster_size = 1 << cluster_bits
+    info.backing_file = _string(data, backing_offset, backing_size)
+    header_length = QCOW2_HEADER.size
+    if version >= 3:
+        header_length = _unpack(QCOW2_V3_HEADER, data,
+                                QCOW2_HEADER.size)[-1]
+    # header extensions
+    offset = header_length
+    end = backing_offset or cluster_size
+    while offset + 8 <= min(end, len(data)):
+        ext_type, ext_len = struct.unpack_from(">II", data, offset)
+        if ext_type == 0:
+            break
+        if ext_type == QCOW2_EXT_BACKING_FORMAT:
+            info.backing_format = _string(data, offset + 8, ext_len)
+        offset += 8 + (ext_len + 7) // 8 * 8
+    l1 = _table(data, l1_offset, l1_size, ">")
+    info.allocated = _count_allocated(data, l1, cluster_size // 8,
+                                      ">") * cluster_size
+
+
+def _read_qed(data, info):
+    (_, cluster_size, table_size, _, _, _, _, l1_offset, size,
+     backing_offset, backing_size) = _unpack(QED_HEADER, data)
+    info.virtual_size = size
+    info.cluster_size = cluster_size
+    if backing_offset:
+        info.backing_file = _string(data, backing_offset, backing_size)
+    else:
+        info.backing_file = ""
+    entries = table_size * cluster_size // 8
+    l1 = _table(data, l1_offset, entries, "<")
+    info.allocated = _count_allocated(data, l1, entries, "<") * cluster_size
+
+
+def _read_vmdk(data, info):
+    (_, _, _, capacity, grain, descriptor_offset, descriptor_size, _, _, _,
+     _) = _unpack(VMDK_HEADER, data)
+    info.virtual_size = capacity * SECTOR
+    info.cluster_size = grain * SECTOR
+    info.backing_file = ""
+    if descriptor_offset:
+        descriptor = _string(data, descriptor_offset * SECTOR,
+                             descriptor_size * SECTOR)
+        match = PARENT_HINT_RE.search(descriptor.rstrip("\x00"))
+        if match:
+            info.backing_file = match.group(1)
+
+
+def _read_vdi(data, info):
+    fields = _unpack(VDI_HEADER, data, VDI_HEADER_OFFSET)
+    size, block_size, _, _, allocated = fields[-5:]
+    info.virtual_size = size
+    info.cluster_size = block_size
+    info.allocated = allocated * block_size
+
+
+_readers = {
+    tools.ImageFormat.COW: _read_cow,
+    tools.ImageFormat.QCOW: _read_qcow,
+    tools.ImageFormat.QCOW2: _read_qcow2,
+    tools.ImageFormat.QED: _read_qed,
+    tools.ImageFormat.VDI: _read_vdi,
+}
+
+
+def read(path):
+    """Read the metadata of an image.
+
+    @rtype: L{DiskInfo}
+    @raise EnvironmentError: if the image cannot be read.
+    @raise CorruptedImageError: if the metadata are not consistent.
+    """
+
+    with open(path, "rb") as fp:
+        st = os.fstat(fp.fileno())
+        info = DiskInfo(path, tools.ImageFormat.RAW, st.st_size,
+                        st.st_blocks * SECTOR)
+        if st.st_size == 0:
+            info.allocated = 0
+            return info
+        data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        fmt = tools.image_type(data[:tools._MAX_HEADER])
+        if fmt == tools.ImageFormat.UNKNOWN:
+            # the data of a raw image can be anything
+            info.allocated = info.disk_size
+        else:
+            info.format = fmt
+        if fmt == tools.ImageFormat.VMDK:
+            # the COWD images, of ESX, are not supported
+            if data[:4] == "KDMV":
+                _read_vmdk(data, info)
+        elif fmt in _readers:
+            _readers[fmt](data, info)
+        return info
+    except struct.error as e:
+        raise CorruptedImageError(str(e))
+    finally:
+        data.close()
+
+
+def backing_chain(path):
+    """Return the L{DiskInfo} of an image followed by those of its backing
+    files, in order."""
+
+    chain = []
+    seen = set()
+    while path is not None:
+        path = os.path.realpath(path)
+        if path in seen or len(chain) >= MAX_CHAIN:
+            raise CorruptedImageError("backing chain loop at " + path)
+        seen.add(path)
+        info = read(path)
+        chain.append(info)
+        path = info.backing_path()
+    return chain
+
+
+def scan(directory):
+    """Read the metadata of all the images in a directory.
+
+    The files that cannot be read or are not valid images are skipped.
+
+    @return: a dictionary path -> L{DiskInfo}.
+    """
+
+    infos = {}
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if not os.path.isfile(path):
+            continue
+        try:
+            infos[path] = read(path)
+        except (EnvironmentError, CorruptedImageError):
+            pass
+    return infos
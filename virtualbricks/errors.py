@@ -92,5 +92,48 @@ class BrickRunningError(Error):
     """There is one or more brick that is running."""
 
 
+class DependencyError(Error):
+    """A brick the brick depends on could not be started."""
+
+
+class CommandError(Error):
+    """A command sent to the management console of a process failed."""
+
+    command = None
+
+    def __init__(self, code, message):
+        Error.__init__(self, code, message)
+        self.code = code
+        self.message = message
+
+
+class QMPError(Error):
+    """A command sent to the QMP socket of a virtual machine failed."""
+
+    def __init__(self, error_class, description):
+        Error.__init__(self, error_class, description)
+        self.error_class = error_class
+        self.description = description
+
+    def __str__(self):
+        return "{0}: {1}".format(self.error_class, self.description)
+
+
+class ImageJobError(Error):
+    """A qemu-img job exited with an error."""
+
+    def __init__(self, job, message):
+        Error.__init__(self, job, message)
+        self.job = job
+        self.message = message
+
+    def __str__(self):
+        return "{0}: {1}".format(self.job.description, self.message)
+
+
+class NotAllowedError(Error):
+    """The privileged helper refused a request."""
+
+
 class NoOptionError(Error):
     '''The config file has no such option.'''
@@ -83,6 +83,9 @@ class Event(base.Base):
     def configured(self):
         return len(self.config["actions"]) > 0 and self.config["delay"] > 0
 
+    def rename(self, name):
+        self.factory.rename_event(self, name)
+
     def get_parameters(self):
         tempstr = _("Delay: %d") % self.config["delay"]
         if len(self.config["actions"]) > 0:
@@ -90,7 +90,7 @@ import textwrap
 import pango
 import gtk
 import twisted
-from twisted.internet import utils, defer, task, error
+from twisted.internet import utils, defer, task
 from twisted.python import filepath
 if twisted.__version__ >= '15.0.2':
     # This is an ugly hack but virtualbricks is not really ready for
@@ -103,7 +103,7 @@ else:
 
 from virtualbricks import __version__
 from virtualbricks import (tools, log, console, settings,
-                           virtualmachines, project, errors)
+                           virtualmachines, project, errors, diskinfo)
 from virtualbricks.virtualmachines import is_virtualmachine
 from virtualbricks.tools import dispose
 from virtualbricks.gui import graphics, widgets
@@ -126,7 +126,6 @@ invalid_mac = log.Event("MAC address {mac} is not valid, generating "
                         "a random one")
 not_implemented = log.Event("Not implemented")
 event_created = log.Event("Event created successfully")
-commit_failed = log.Event("Failed to commit image\n{err}")
 img_invalid = log.Event("Invalid image")
 base_not_found = log.Event("Base not found (invalid cow?)\nstderr:\n{err}")
 img_combo = log.Event("Setting image for combobox")
@@ -356,12 +355,47 @@ class DisksLibraryDialog(Window):
         self.tvcMaster.set_cell_data_func(self.crt4, self.crt4.set_cell_data)
         self.tvcCows.set_cell_data_func(self.crt5, self._set_cows, factory)
         self.tvcSize.set_cell_data_func(self.crt6, self.crt6.set_cell_data)
+        self.tvcFormat.set_cell_data_func(self.crt7, self._set_format,
+                                          factory)
+        self.tvcVirtualSize.set_cell_data_func(self.crt8, self._set_size,
+                                               (factory, "virtual_size"))
+        self.tvcAllocated.set_cell_data_func(self.crt9, self._set_size,
+                                             (factory, "allocated"))
+        for image in factory.disk_images:
+            d = factory.image_cache.lookup(image.path)
+            d.addCallbacks(self._image_read, self._image_not_read)
 
     def __dispose__(self):
         if self._binding_list is not None:
             dispose(self._binding_list)
             self._binding_list = None
 
+    def _image_read(self, info):
+        if self._binding_list is not None:
+            self.tvImages.queue_draw()
+
+    def _image_not_read(self, failure):
+        failure.trap(EnvironmentError, diskinfo.CorruptedImageError)
+
+    @staticmethod
+    def _set_format(column, cell, model, itr, factory):
+        image = model.get_value(itr, 0)
+        info = factory.image_cache.get(image.path)
+        if info is None:
+            cell.set_property("text", "")
+        else:
+            cell.set_property("text", info.format.name.lower())
+
+    @staticmethod
+    def _set_size(column, cell, model, itr, data):
+        factory, attribute = data
+        image = model.get_value(itr, 0)
+        info = factory.image_cache.get(image.path)
+        if info is None or getattr(info, attribute) is None:
+            cell.set_property("text", "")
+        else:
+            cell.set_property("text", tools.fmtsize(getattr(info, attribute)))
+
     @staticmethod
     def _set_used_by(column, cell, model, itr, factory):
         image = model.get_value(itr, 0)
@@ -406,7 +440,12 @@ class DisksLibraryDialog(Window):
         self._hide_config()
 
     def on_btnSave_clicked(self, button):
-        self.image.set_name(self.etrName.get_text())
+        name = self.etrName.get_text()
+        if name != self.image.name:
+            try:
+                self.factory.rename_disk_image(self.image, name)
+            except errors.InvalidNameError:
+                logger.error(invalid_name, name=name)
         self.image.set_description(self.etrDescription.get_text())
         self.image = None
         self._hide_config()
@@ -761,6 +800,7 @@ class CommitImageDialog(Window):
     def __init__(self, progessbar, factory):
         Window.__init__(self)
         self.progessbar = progessbar
+        self.factory = factory
         model = self.get_object("model1")
         for brick in factory.bricks:
             for disk in (disk for disk in disks_of(brick) if disk.cow):
@@ -770,19 +810,12 @@ class CommitImageDialog(Window):
         self.parent = parent
         Window.show(self, parent)
 
-    def _do_image_commit(self, path):
-
-        def log_err((out, err, exit_status)):
-            if exit_status != 0:
-                logger.error(commit_failed, err=err)
-
-        d = getQemuOutputAndValue("qemu-img", ["commit", path], os.environ)
-        d.addCallback(log_err)
-        return d
-
     def do_image_commit(self, path):
         self.window.destroy()
-        self.progessbar.wait_for(self._do_image_commit, path)
+        job = self.factory.image_jobs.commit(path)
+        # the failures are logged by the queue
+        job.wait().addErrback(lambda _: None)
+        JobProgress(self.factory.image_jobs, job, self.parent)
 
     def commit_file(self, pathname):
         question = ("Warning: the base image will be updated to the\n"
@@ -958,15 +991,11 @@ class CreateImageDialog(Window):
 
     def create_image(self, name, pathname, fmt, size, unit):
 
-        def _create_disk(result):
-            out, err, code = result
-            if code:
-                logger.error(err)
-            else:
-                return self.factory.new_disk_image(name, pathname)
+        def _create_disk(job):
+            return self.factory.new_disk_image(name, pathname)
 
-        exit = getQemuOutputAndValue("qemu-img",
-            ["create", "-f", fmt, pathname, size + unit], os.environ)
+        job = self.factory.image_jobs.create(pathname, fmt, size + unit)
+        exit = job.wait()
         exit.addCallback(_create_disk)
         logger.log_failure(exit, img_create_err)
         return exit
@@ -1388,15 +1417,6 @@ def iter_model(model, *columns):
         itr = model.iter_next(itr)
 
 
-def complain_on_error(result):
-    out, err, code = result
-    if code != 0:
-        logger.warn(err)
-        raise error.ProcessTerminated(code)
-    logger.info(err)
-    return result
-
-
 def _set_path(column, cell_renderer, model, iter, colid):
     path = model.get_value(iter, colid)
     cell_renderer.set_property("text",  path.path if path else "")
@@ -1456,6 +1476,32 @@ class Freezer:
         return passthru
 
 
+class JobProgress:
+    """Show the progress of an image job, the user can go on working."""
+
+    def __init__(self, queue, job, parent):
+        self.queue = queue
+        self.job = job
+        builder = gtk.Builder()
+        builder.add_from_file(graphics.get_data_filename("userwait.ui"))
+        self.progressbar = builder.get_object("progressbar")
+        builder.get_object("Pleaselabel").set_text(job.description)
+        self.window = builder.get_object("UserWaitWindow")
+        self.window.set_transient_for(parent)
+        queue.changed.connect(self.on_changed)
+        self.on_changed(job)
+        if not job.finished():
+            self.window.show_all()
+
+    def on_changed(self, job):
+        if job is self.job:
+            self.progressbar.set_fraction(job.progress / 100)
+            self.progressbar.set_text("%.0f%%" % job.progress)
+            if job.finished():
+                self.queue.changed.disconnect(self.on_changed)
+                self.window.destroy()
+
+
 class ProgressBar:
 
     def __init__(self, dialog):
@@ -1552,7 +1598,7 @@ class _HumbleImport:
     def apply(self, project, name, factory, overwrite, open, store1, store2):
         entry = project.get_descriptor()
         imgs = self.get_images(project, entry, store1, store2)
-        deferred = self.rebase_all(project, imgs, entry)
+        deferred = self.rebase_all(project, imgs, entry, factory.image_jobs)
         deferred.addCallback(self.check_rebase)
         deferred.addCallback(lambda a: project.rename(name, overwrite))
         if open:
@@ -1593,7 +1639,7 @@ class _HumbleImport:
             entry.remap_image(name, path.path)
             saved[name] = path
 
-    def rebase_all(self, project, images, entry):
+    def rebase_all(self, project, images, entry, queue):
         lst = []
         for name, path in images.iteritems():
             for vmname, dev in entry.device_for_image(name):
@@ -1601,13 +1647,12 @@ class _HumbleImport:
                 cow = filepath.FilePath(project.path).child(cow_name)
                 if cow.exists():
                     logger.debug(log_rebase, cow=cow.path, basefile=path.path)
-                    lst.append(self.rebase(path.path, cow.path))
+                    lst.append(self.rebase(queue, path.path, cow.path))
         return defer.DeferredList(lst)
 
-    def rebase(self, backing_file, cow, run=utils.getProcessOutputAndValue):
-        args = ["rebase", "-u", "-b", backing_file, cow]
-        d = run("qemu-img", args, os.environ)
-        return d.addCallback(complain_on_error)
+    def rebase(self, queue, backing_file, cow):
+        # the queue runs the rebases some at a time
+        return queue.rebase(cow, backing_file).wait()
 
     def check_rebase(self, result):
         for success, status in result:
@@ -1949,6 +1994,7 @@ class SettingsDialog(Window):
         self.etrSudo.set_text(settings.get("sudo"))
         self.cbSystray.set_active(settings.get("systray"))
         self.cbShowMissing.set_active(settings.get("show_missing"))
+        self.cbHelper.set_active(settings.get("helper"))
         # vde
         try:
             self.fcbVdepath.set_current_folder(settings.get('vdepath'))
@@ -2017,6 +2063,7 @@ class SettingsDialog(Window):
             settings.set("sudo", self.etrSudo.get_text())
             settings.set("systray", self.cbSystray.get_active())
             settings.set("show_missing", self.cbShowMissing.get_active())
+            settings.set("helper", self.cbHelper.get_active())
             # vde
             vdepath = self.fcbVdepath.get_current_folder()
             if vdepath is not None:
@@ -56,7 +56,6 @@ components_not_found = log.Event("{text}\nThere are some components not "
     "found: {components} some functionalities may not be available.\nYou can "
     "disable this alert from the general settings.")
 brick_invalid_name = log.Event("Cannot create brick: Invalid name.")
-not_started = log.Event("Brick not started.")
 stop_error = log.Event("Error on stopping brick.")
 start_error = log.Event("Error on starting brick.")
 dnd_no_socks = log.Event("I don't know what to do, bricks have no socks.")
@@ -73,8 +72,7 @@ proc_signal = log.Event("Sending to process signal {signame}!")
 send_acpi = log.Event("send ACPI {acpievent}")
 proc_restart = log.Event("Restarting process!")
 savevm = log.Event("Save snapshot on virtual machine {name}")
-qemu_version_parsing_error = log.Event("Error while parsing qemu version")
-retrieve_qemu_version_error = log.Event("Error while retrieving qemu version.")
+qemu_probe_error = log.Event("Cannot find the installed qemu binaries")
 usb_access = log.Event("Cannot access /dev/bus/usb. Check user privileges.")
 no_kvm = log.Event("No KVM support found on the system. Check your active "
                    "configuration. KVM will stay disabled.")
@@ -168,11 +166,12 @@ class VMPopupMenu(BrickPopupMenu):
             if out.find(pattern) == -1:
                 raise RuntimeError(_("Cannot find suspend point."))
 
-        def loadvm(_):
-            if self.original.proc is not None:
-                self.original.send("loadvm virtualbricks\n")
-            else:
-                return self.original.poweron("virtualbricks")
+        if self.original.proc is not None:
+            # QEMU reports if the snapshot does not exist
+            d = self.original.qmp()
+            d.addCallback(lambda client: client.loadvm("virtualbricks"))
+            logger.log_failure(d, snap_error)
+            return d
 
         img = self.original.get("hda")
         if img.cow:
@@ -186,7 +185,7 @@ class VMPopupMenu(BrickPopupMenu):
         args = ["snapshot", "-l", path]
         output = getQemuOutput("qemu-img", args, os.environ)
         output.addCallback(grep, "virtualbricks")
-        output.addCallback(loadvm)
+        output.addCallback(lambda _: self.original.poweron("virtualbricks"))
         logger.log_failure(output, snap_error)
         return output
 
@@ -364,13 +363,17 @@ class VMJobMenu(JobMenu):
             return defer.fail(RuntimeError(_("Suspend/Resume not supported on "
                                              "this disk.")))
 
-        if tools.image_type_from_file(path) == tools.ImageFormat.QCOW2:
-            self.original.send("savevm virtualbricks\n")
-            return self.original.poweroff()
+        return factory.image_cache.lookup(path).addCallback(self._suspend)
+
+    def _suspend(self, info):
+        if info.format == tools.ImageFormat.QCOW2:
+            d = self.original.qmp()
+            d.addCallback(lambda client: client.savevm("virtualbricks"))
+            return d.addCallback(lambda _: self.original.poweroff())
         else:
             logger.error(s_r_not_supported)
-            return defer.fail(RuntimeError(_("Suspend/Resume not supported on "
-                                             "this disk.")))
+            raise RuntimeError(_("Suspend/Resume not supported on this "
+                                 "disk."))
 
     def on_suspend_activate(self, menuitem, gui):
         logger.debug(savevm, name=self.original.get_name())
@@ -1062,20 +1065,21 @@ class QemuConfigController(ConfigController):
         mac_c.set_cell_data_func(mac_cr, _set_mac)
 
     def get_config_view(self, gui):
+        if qemu.is_probed():
+            return self._get_config_view(gui)
 
-        def install_qemu_version(version):
-            qemu.parse_and_install(version)
+        def show_config_view(_):
             container = panel.get_parent()
             container.remove(panel)
             container.pack_start(self._get_config_view(gui))
 
         def close_panel(failure):
-            logger.failure(qemu_version_parsing_error, failure)
+            logger.failure(qemu_probe_error, failure)
             gui.curtain_down()
 
-        d = getQemuOutput("qemu-system-x86_64", ["-version"])
-        d.addCallbacks(install_qemu_version, logger.failure_eb,
-                       errbackArgs=(retrieve_qemu_version_error, True))
+        # usually the binaries are already probed at startup
+        d = qemu.probe()
+        d.addCallback(show_config_view)
         d.addErrback(close_panel)
 
         panel = gtk.Alignment(0.5, 0.5)
@@ -1663,6 +1667,7 @@ class VBGUI(TopologyMixin, ReadmeMixin, _Root):
 
     __bricks_binding_list = None
     __events_binding_list = None
+    __topology_call = None
 
     def __init__(self, factory, builder, textbuffer=None):
         self.factory = self.brickfactory = factory
@@ -1675,6 +1680,7 @@ class VBGUI(TopologyMixin, ReadmeMixin, _Root):
         factory.connect("brick-changed", self.on_brick_changed)
         factory.connect("brick-added", self.on_brick_changed)
         factory.connect("brick-removed", self.on_brick_changed)
+        factory.sampler.sampled.connect(self.on_usage_sampled)
         self.progressbar = ProgressBar(self)
         if settings.get("systray"):
             self.start_systray()
@@ -1695,7 +1701,10 @@ class VBGUI(TopologyMixin, ReadmeMixin, _Root):
         # attach the quit callback at the end, so it is not called if an
         # exception is raised before because of a syntax error of another kind
         # of error
-        factory.connect("quit", self.on_quit)
+        factory.connect_immediate("quit", self.on_quit)
+        # redraw the views once for each reactor iteration, not on every
+        # single change
+        factory.set_batching(True)
 
         # Show the main window
         self.wndMain.show()
@@ -1744,6 +1753,10 @@ class VBGUI(TopologyMixin, ReadmeMixin, _Root):
         self.factory.disconnect("brick-changed", self.on_brick_changed)
         self.factory.disconnect("brick-added", self.on_brick_changed)
         self.factory.disconnect("brick-removed", self.on_brick_changed)
+        self.factory.sampler.sampled.disconnect(self.on_usage_sampled)
+        if self.__topology_call is not None:
+            self.__topology_call.cancel()
+            self.__topology_call = None
         if self.__bricks_binding_list is not None:
             dispose(self.__bricks_binding_list)
             self.__bricks_binding_list = None
@@ -1765,8 +1778,17 @@ class VBGUI(TopologyMixin, ReadmeMixin, _Root):
     """ ********************************************************     """
 
     def on_brick_changed(self, brick):
+        # redraw the topology once for all the bricks changed in this turn
+        if self.__topology_call is None:
+            self.__topology_call = reactor.callLater(0, self.__redraw_topology)
+
+    def __redraw_topology(self):
+        self.__topology_call = None
         self.draw_topology()
 
+    def on_usage_sampled(self, sampler):
+        self.tvJobs.queue_draw()
+
     def curtain_down(self):
         self.get_object("main_notebook").show()
         configframe = self.get_object("configframe")
@@ -1999,19 +2021,11 @@ class VBGUI(TopologyMixin, ReadmeMixin, _Root):
         return True
 
     def on_btnStartAll_clicked(self, toolbutton):
-
-        def started_all(results):
-            for success, value in results:
-                if not success:
-                    logger.failure(not_started, value)
-
-        l = [brick.poweron() for brick in self.brickfactory.bricks]
-        defer.DeferredList(l, consumeErrors=True).addCallback(started_all)
+        self.brickfactory.poweron_all()
         return True
 
     def on_btnStopAll_clicked(self, toolbutton):
-        for brick in self.brickfactory.bricks:
-            brick.poweroff()
+        self.brickfactory.poweroff_all()
         return True
 
     def __show_config_if_selected(self, treeview):
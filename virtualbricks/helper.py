@@ -0,0 +1,459 @@
+# -*- test-case-name: virtualbricks.tests.test_helper -*-
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+A privileged helper that starts the processes of the bricks that need root.
+
+The helper is started once with sudo, the first time it is needed, and it
+listens on a Unix socket readable only by the user. Over the socket it spawns
+the allowed programs and configures the network interfaces, the output and
+the termination of the processes are sent back. The helper exits when
+virtualbricks disconnects and it terminates the processes it started.
+
+To the brick, a process started by the helper looks like a process started by
+C{reactor.spawnProcess}.
+"""
+
+import os
+import re
+import sys
+import signal
+
+from twisted.internet import defer, error, protocol, utils, endpoints, task
+from twisted.protocols import amp
+from twisted.python import failure, procutils
+
+from virtualbricks import affinity, errors, log
+
+
+__all__ = ["ALLOWED_PROGRAMS", "DEFAULT_TIMEOUT", "Spawn", "Signal",
+           "Write", "Configure", "ProcessOutput", "ProcessEnded",
+           "interface_commands", "HelperServer", "HelperClient", "Helper",
+           "serve"]
+
+logger = log.Logger()
+helper_started = log.Event("Privileged helper listening on {path}")
+helper_spawn = log.Event("Starting the privileged helper: {args()}")
+helper_lost = log.Event("Connection to the privileged helper lost")
+signal_failed = log.Event("Cannot send SIG{signo} to {pid}")
+write_failed = log.Event("Cannot write to {pid}")
+
+ALLOWED_PROGRAMS = ("vde_plug2tap", "vde_pcapplug")
+DEFAULT_TIMEOUT = 60
+POLL_INTERVAL = 0.2
+CHUNK_SIZE = 0xfff0
+
+_iface_re = re.compile(r"^[a-zA-Z0-9_.][a-zA-Z0-9_.-]*$")
+_address_re = re.compile(r"^[0-9a-fA-F.:]+$")
+
+
+class Spawn(amp.Command):
+    arguments = [("args", amp.ListOf(amp.String())),
+                 ("cpus", amp.ListOf(amp.Integer(), optional=True))]
+    response = [("pid", amp.Integer())]
+    errors = {errors.NotAllowedError: "NOT_ALLOWED"}
+
+
+class Signal(amp.Command):
+    arguments = [("pid", amp.Integer()), ("signo", amp.String())]
+    response = []
+    errors = {error.ProcessExitedAlready: "EXITED"}
+
+
+class Write(amp.Command):
+    arguments = [("pid", amp.Integer()), ("data", amp.String())]
+    response = []
+    errors = {error.ProcessExitedAlready: "EXITED"}
+
+
+class Configure(amp.Command):
+    arguments = [("iface", amp.String()), ("mode", amp.String()),
+                 ("ip", amp.String()), ("nm", amp.String()),
+                 ("gw", amp.String())]
+    response = [("status", amp.Integer())]
+    errors = {errors.NotAllowedError: "NOT_ALLOWED"}
+
+
+class ProcessOutput(amp.Command):
+    arguments = [("pid", amp.Integer()), ("fd", amp.Integer()),
+                 ("data", amp.String())]
+    requiresAnswer = False
+
+
+class ProcessEnded(amp.Command):
+    arguments = [("pid", amp.Integer()),
+                 ("exit_code", amp.Integer(optional=True)),
+                 ("signal", amp.Integer(optional=True))]
+    requiresAnswer = False
+
+
+def interface_commands(iface, mode, ip="", nm="", gw=""):
+    """Return the commands that configure a tap interface.
+
+    @param mode: C{dhcp}, C{manual} or C{off}.
+    @raise ValueError: if an argument is not valid.
+    """
+
+    if not _iface_re.match(iface):
+        raise ValueError("Invalid interface name %r" % iface)
+    if mode == "dhcp":
+        return [["dhclient", iface]]
+    elif mode == "manual":
+        for address in ip, nm:
+            if not _address_re.match(address):
+                raise ValueError("Invalid address %r" % address)
+        commands = [["/sbin/ifconfig", iface, ip, "netmask", nm]]
+        if gw:
+            if not _address_re.match(gw):
+                raise ValueError("Invalid address %r" % gw)
+            commands.append(["/sbin/route", "add", "default", "gw", gw,
+                             "dev", iface])
+        return commands
+    return []
+
+
+def run_commands(commands, env=os.environ):
+    """Run the commands one after the other and return a deferred that
+    fires with the exit status of the first command that fails, 0 if all of
+    them succeed."""
+
+    commands = list(commands)
+
+    def next_command(status):
+        if status != 0 or not commands:
+            return status
+        args = commands.pop(0)
+        d = utils.getProcessValue(args[0], args[1:], env)
+        return d.addCallback(next_command)
+
+    return next_command(0)
+
+
+class _Child(protocol.ProcessProtocol):
+
+    def __init__(self, server):
+        self.server = server
+        self.pid = None
+
+    def childDataReceived(self, fd, data):
+        for i in range(0, len(data), CHUNK_SIZE):
+            self.server.callRemote(ProcessOutput, pid=self.pid, fd=fd,
+                                   data=data[i:i + CHUNK_SIZE])
+
+    def processEnded(self, reason):
+        self.server.child_ended(self, reason.value)
+
+
+class HelperServer(amp.AMP):
+    """The privileged side, it runs as root."""
+
+    def __init__(self, reactor=None, env=None):
+        amp.AMP.__init__(self)
+        if reactor is None:
+            from twisted.internet import reactor
+        self.reactor = reactor
+        self.env = os.environ if env is None else env
+        self.children = {}
+        self.done = defer.Deferred()
+
+    def find_program(self, name):
+        """Return the absolute path of an allowed program.
+
+        The programs are looked up in the C{PATH} of the helper, never in the
+        one of the user.
+        """
+
+        name = os.path.basename(name)
+        if name not in ALLOWED_PROGRAMS:
+            raise errors.NotAllowedError("%s cannot be started by the helper"
+                                         % name)
+        found = procutils.which(name)
+        if not found:
+            raise errors.NotAllowedError("%s not found" % name)
+        return found[0]
+
+    @Spawn.responder
+    def spawn(self, args, cpus=None):
+        prog = self.find_program(args[0])
+        child = _Child(self)
+        # the child inherits the affinity of the helper
+        with affinity.pinned(cpus):
+            transport = self.reactor.spawnProcess(child, prog,
+                                                  [prog] + args[1:], self.env)
+        child.pid = transport.pid
+        self.children[child.pid] = transport
+        return {"pid": child.pid}
+
+    def _get_child(self, pid):
+        try:
+            return self.children[pid]
+        except KeyError:
+            raise error.ProcessExitedAlready()
+
+    @Signal.responder
+    def signal(self, pid, signo):
+        self._get_child(pid).signalProcess(signo)
+        return {}
+
+    @Write.responder
+    def write(self, pid, data):
+        self._get_child(pid).write(data)
+        return {}
+
+    @Configure.responder
+    def configure(self, iface, mode, ip, nm, gw):
+        try:
+            commands = interface_commands(iface, mode, ip, nm, gw)
+        except ValueError as e:
+            raise errors.NotAllowedError(str(e))
+        d = run_commands(commands, self.env)
+        return d.addCallback(lambda status: {"status": status})
+
+    def child_ended(self, child, reason):
+        self.children.pop(child.pid, None)
+        if not self.done.called:
+            self.callRemote(ProcessEnded, pid=child.pid,
+                            exit_code=getattr(reason, "exitCode", 0),
+                            signal=getattr(reason, "signal", None))
+
+    def connectionLost(self, reason):
+        amp.AMP.connectionLost(self, reason)
+        if not self.done.called:
+            self.done.callback(None)
+        for transport in self.children.values():
+            try:
+                transport.signalProcess("TERM")
+            except (OSError, error.ProcessExitedAlready):
+                pass
+
+
+class HelperTransport:
+    """The transport of a process started by the helper."""
+
+    def __init__(self, client, pid):
+        self.client = client
+        self.pid = pid
+
+    def signalProcess(self, signo):
+        if self.pid is None:
+            raise error.ProcessExitedAlready()
+        d = self.client.callRemote(Signal, pid=self.pid, signo=str(signo))
+        d.addErrback(lambda f: f.trap(error.ProcessExitedAlready))
+        d.addErrback(logger.failure_eb, signal_failed, pid=self.pid,
+                     signo=signo)
+
+    def write(self, data):
+        if self.pid is None:
+            return
+        for i in range(0, len(data), CHUNK_SIZE):
+            d = self.client.callRemote(Write, pid=self.pid,
+                                       data=data[i:i + CHUNK_SIZE])
+            d.addErrback(logger.failure_eb, write_failed, pid=self.pid)
+
+    def writeSequence(self, seq):
+        self.write("".join(seq))
+
+    def closeStdin(self):
+        pass
+
+    loseConnection = closeStdin
+
+
+class HelperClient(amp.AMP):
+    """The side of virtualbricks, it runs as the user."""
+
+    def __init__(self):
+        amp.AMP.__init__(self)
+        self.processes = {}
+        self.lost = defer.Deferred()
+
+    def spawn(self, process_protocol, args, cpus=()):
+        """Start a process, like C{reactor.spawnProcess} but asynchronously.
+
+        @param cpus: the CPUs where the process runs, all if empty.
+        @return: a deferred that fires with the transport of the process.
+        """
+
+        def spawned(response):
+            transport = HelperTransport(self, response["pid"])
+            self.processes[transport.pid] = process_protocol, transport
+            process_protocol.makeConnection(transport)
+            return transport
+
+        d = self.callRemote(Spawn, args=args, cpus=list(cpus or ()))
+        return d.addCallback(spawned)
+
+    def configure(self, iface, mode, ip="", nm="", gw=""):
+        d = self.callRemote(Configure, iface=iface, mode=mode, ip=ip, nm=nm,
+                            gw=gw)
+        return d.addCallback(lambda response: response["status"])
+
+    @ProcessOutput.responder
+    def process_output(self, pid, fd, data):
+        if pid in self.processes:
+            self.processes[pid][0].childDataReceived(fd, data)
+        return {}
+
+    @ProcessEnded.responder
+    def process_ended(self, pid, exit_code=None, signal=None):
+        if pid in self.processes:
+            if exit_code == 0 and signal is None:
+                reason = error.ProcessDone(0)
+            else:
+                reason = error.ProcessTerminated(exit_code, signal)
+            self._ended(pid, reason)
+        return {}
+
+    def _ended(self, pid, reason):
+        process_protocol, transport = self.processes.pop(pid)
+        transport.pid = None
+        process_protocol.processExited(failure.Failure(reason))
+        process_protocol.processEnded(failure.Failure(reason))
+
+    def connectionLost(self, reason):
+        amp.AMP.connectionLost(self, reason)
+        logger.warn(helper_lost)
+        for pid in list(self.processes):
+            self._ended(pid, error.ProcessTerminated(None, signal.SIGKILL))
+        self.lost.callback(None)
+
+
+class Helper:
+    """Connect to the helper, start it with sudo if it is not running.
+
+    @ivar client: the L{HelperClient} if connected, C{None} otherwise.
+    """
+
+    client = None
+
+    def __init__(self, path, sudo=None, reactor=None,
+                 timeout=DEFAULT_TIMEOUT):
+        if reactor is None:
+            from twisted.internet import reactor
+        self.path = path
+        self.sudo = sudo
+        self.reactor = reactor
+        self.timeout = timeout
+        self.__waiting = None
+
+    def _endpoint(self):
+        return endpoints.UNIXClientEndpoint(self.reactor, self.path)
+
+    def _connected(self, client):
+        self.client = client
+        client.lost.addCallback(self._lost)
+        return client
+
+    def _lost(self, _):
+        self.client = None
+
+    def _start_helper(self):
+        sudo = self.sudo
+        if sudo is None:
+            from virtualbricks import settings
+            sudo = settings.get("sudo")
+        args = [sudo, "--", sys.executable, "-m",
+                "virtualbricks.scripts.helper", self.path, str(os.getuid())]
+        logger.info(helper_spawn, args=lambda: " ".join(args))
+        # -m looks for the package in the working directory first
+        package_dir = os.path.dirname(os.path.dirname(__file__)) or "."
+        self.reactor.spawnProcess(protocol.ProcessProtocol(), sudo, args,
+                                  os.environ, package_dir)
+
+    def _poll(self, deadline):
+        d = self._endpoint().connect(protocol.Factory.forProtocol(
+            HelperClient))
+
+        def retry(fail):
+            fail.trap(error.ConnectError)
+            if self.reactor.seconds() >= deadline:
+                return fail
+            return task.deferLater(self.reactor, POLL_INTERVAL, self._poll,
+                                   deadline)
+
+        return d.addErrback(retry)
+
+    def connect(self):
+        """Return a deferred that fires with a connected L{HelperClient}."""
+
+        if self.client is not None:
+            return defer.succeed(self.client)
+        if self.__waiting is not None:
+            d = defer.Deferred()
+            self.__waiting.append(d)
+            return d
+        self.__waiting = waiting = []
+
+        def start(fail):
+            fail.trap(error.ConnectError)
+            self._start_helper()
+            return self._poll(self.reactor.seconds() + self.timeout)
+
+        def notify(result):
+            self.__waiting = None
+            for d in waiting:
+                d.callback(result)
+            return result
+
+        d = self._endpoint().connect(protocol.Factory.forProtocol(
+            HelperClient))
+        d.addErrback(start)
+        d.addCallback(self._connected)
+        return d.addBoth(notify)
+
+    def spawn(self, process_protocol, args, cpus=()):
+        return self.connect().addCallback(
+            lambda client: client.spawn(process_protocol, args, cpus))
+
+    def configure(self, iface, mode, ip="", nm="", gw=""):
+        return self.connect().addCallback(
+            lambda client: client.configure(iface, mode, ip, nm, gw))
+
+    def disconnect(self):
+        if self.client is not None:
+            self.client.transport.loseConnection()
+
+
+class _OneClientFactory(protocol.ServerFactory):
+
+    def __init__(self, server):
+        self.server = server
+
+    def buildProtocol(self, addr):
+        # only one client is served, the others are refused
+        server, self.server = self.server, None
+        return server
+
+
+def serve(reactor, path, uid):
+    """Listen on C{path}, the socket is owned by C{uid}, until the first
+    client disconnects."""
+
+    if os.path.exists(path):
+        os.unlink(path)
+    server = HelperServer(reactor)
+    port = reactor.listenUNIX(path, _OneClientFactory(server), mode=0600)
+    os.chown(path, uid, -1)
+    logger.info(helper_started, path=path)
+
+    def stop(_):
+        port.stopListening()
+        if os.path.exists(path):
+            os.unlink(path)
+
+    return server.done.addCallback(stop)
@@ -0,0 +1,106 @@
+# -*- test-case-name: virtualbricks.tests.test_imagecache -*-
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+Cache the metadata read from the headers of the disk images.
+
+An entry is keyed by the device, the inode, the modification time and the
+size of the file: if any of them changes the header is read again. The files
+are read in the reactor's thread pool, slow storage never blocks the reactor.
+"""
+
+import os
+
+from twisted.internet import threads
+
+from virtualbricks import diskinfo
+
+
+__all__ = ["ImageCache", "read_info"]
+
+
+def _key(st):
+    return st.st_dev, st.st_ino, st.st_mtime, st.st_size
+
+
+def read_info(path):
+    """Read the metadata of an image.
+
+    @return: the key of the file and its L{diskinfo.DiskInfo}.
+    """
+
+    with open(path) as fp:
+        # if the file changes while it is read, the next lookup reads it again
+        key = _key(os.fstat(fp.fileno()))
+    return key, diskinfo.read(path)
+
+
+class ImageCache:
+
+    def __init__(self, reactor=None):
+        if reactor is None:
+            from twisted.internet import reactor
+        self.reactor = reactor
+        # path -> (key, DiskInfo)
+        self._entries = {}
+
+    def _lookup(self, path):
+        # run in a thread, self._entries is only read here
+        try:
+            key, info = self._entries[path]
+        except KeyError:
+            pass
+        else:
+            try:
+                if _key(os.stat(path)) == key:
+                    return key, info
+            except OSError:
+                pass
+        return read_info(path)
+
+    def _store(self, result, path):
+        self._entries[path] = result
+        return result[1]
+
+    def lookup(self, path):
+        """Return a deferred that fires with the L{diskinfo.DiskInfo} of an
+        image.
+
+        It fails with C{IOError} if the image cannot be read and with
+        L{diskinfo.CorruptedImageError} if its metadata are not valid.
+        """
+
+        d = threads.deferToThreadPool(self.reactor,
+                                      self.reactor.getThreadPool(),
+                                      self._lookup, path)
+        return d.addCallback(self._store, path)
+
+    def get(self, path):
+        """Return the cached L{diskinfo.DiskInfo} without checking the file,
+        C{None} if the image has not been looked up yet."""
+
+        try:
+            return self._entries[path][1]
+        except KeyError:
+            return None
+
+    def invalidate(self, path):
+        self._entries.pop(path, None)
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,270 @@
+# -*- test-case-name: virtualbricks.tests.test_imagejobs -*-
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+A queue of the long qemu-img operations on the images.
+
+Commits, rebases, conversions and creations run in the background, at most
+C{limit} at a time so that they do not fight for the disk with each other,
+and with the lowest best-effort I/O priority if C{ionice} is available. The
+progress printed by C{qemu-img -p} is parsed and every change of a job is
+notified to the observers of L{JobQueue.changed}.
+"""
+
+import os
+import re
+import itertools
+import collections
+
+from twisted.internet import defer, error, protocol
+from twisted.python import procutils
+
+from virtualbricks import errors, log, observable
+from virtualbricks._spawn import abspath_qemu
+
+
+__all__ = ["DEFAULT_LIMIT", "QUEUED", "RUNNING", "DONE", "FAILED",
+           "CANCELLED", "Job", "JobQueue"]
+
+logger = log.Logger()
+job_started = log.Event("Image job {job.id} started: {job.description}")
+job_done = log.Event("Image job {job.id} done: {job.description}")
+job_failed = log.Event("Image job {job.id} failed: {job.description}\n{err}")
+job_cancelled = log.Event("Image job {job.id} cancelled: {job.description}")
+
+DEFAULT_LIMIT = 1
+# how many finished jobs are remembered
+KEEP_FINISHED = 20
+PROGRESS_RE = re.compile(r"\((\d+(?:\.\d+)?)/100%\)")
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class Job:
+    """
+    @ivar progress: the percentage done, from 0 to 100.
+    @ivar error: the exception of a failed or cancelled job.
+    """
+
+    def __init__(self, id, operation, args, description):
+        self.id = id
+        self.operation = operation
+        self.args = args
+        self.description = description
+        self.state = QUEUED
+        self.progress = 0.0
+        self.error = None
+        self.transport = None
+        self._cancel_requested = False
+        self._waiting = []
+
+    def finished(self):
+        return self.state in (DONE, FAILED, CANCELLED)
+
+    def wait(self):
+        """Return a deferred that fires with the job when it is done or fails
+        with its error."""
+
+        if self.error is not None:
+            return defer.fail(self.error)
+        if self.state == DONE:
+            return defer.succeed(self)
+        d = defer.Deferred()
+        self._waiting.append(d)
+        return d
+
+    def _fire(self):
+        waiting, self._waiting = self._waiting, []
+        for d in waiting:
+            if self.error is not None:
+                d.errback(self.error)
+            else:
+                d.callback(self)
+
+    def __repr__(self):
+        return "<Job {0.id} {0.operation} {0.state} {0.progress:.0f}%>".format(
+            self)
+
+
+class _JobProtocol(protocol.ProcessProtocol):
+
+    def __init__(self, queue, job):
+        self.queue = queue
+        self.job = job
+        self.buffer = ""
+        self.err = []
+
+    def outReceived(self, data):
+        # qemu-img rewrites the progress on the same line with \r
+        self.buffer += data
+        matches = PROGRESS_RE.findall(self.buffer)
+        if matches:
+            self.queue._progress(self.job, float(matches[-1]))
+            self.buffer = self.buffer[self.buffer.rfind(")") + 1:]
+        self.buffer = self.buffer[-64:]
+
+    def errReceived(self, data):
+        self.err.append(data)
+
+    def processEnded(self, reason):
+        self.queue._ended(self.job, reason, "".join(self.err))
+
+
+class JobQueue:
+    """
+    @ivar jobs: the jobs queued or running and the last finished ones.
+    @ivar changed: an event notified with the job every time a job changes.
+    """
+
+    def __init__(self, limit=DEFAULT_LIMIT, reactor=None, nice=True,
+                 qemu_img=None):
+        if reactor is None:
+            from twisted.internet import reactor
+        self.limit = limit
+        self.reactor = reactor
+        self.nice = nice
+        # by default qemu-img is looked up in the configured path at every
+        # job
+        self.qemu_img = qemu_img
+        self.jobs = []
+        self._queue = collections.deque()
+        self._running = set()
+        self._ids = itertools.count(1)
+        self._observable = observable.Observable("changed")
+        self.changed = observable.Event(self._observable, "changed")
+
+    def submit(self, operation, args, description):
+        """Queue C{qemu-img} with C{args}.
+
+        @rtype: L{Job}
+        """
+
+        job = Job(next(self._ids), operation, args, description)
+        self.jobs.append(job)
+        self._queue.append(job)
+        self._observable.notify("changed", job)
+        self._start_next()
+        return job
+
+    def commit(self, path):
+        """Merge the overlay C{path} into its backing file."""
+
+        return self.submit("commit", ["commit", "-p", path],
+                           "commit " + path)
+
+    def rebase(self, path, backing_file, unsafe=True):
+        """Change the backing file of C{path}. An unsafe rebase changes only
+        the header, a safe one copies the data that differ between the old
+        and the new backing file."""
+
+        args = ["rebase", "-u" if unsafe else "-p", "-b", backing_file, path]
+        return self.submit("rebase", args, "rebase {0} on {1}".format(
+            path, backing_file))
+
+    def convert(self, source, destination, fmt):
+        return self.submit("convert", ["convert", "-p", "-O", fmt, source,
+                                       destination],
+                           "convert {0} to {1}".format(source, destination))
+
+    def create(self, path, fmt, size):
+        return self.submit("create", ["create", "-f", fmt, path, size],
+                           "create " + path)
+
+    def get(self, id):
+        for job in self.jobs:
+            if job.id == id:
+                return job
+        return None
+
+    def cancel(self, job):
+        """Cancel a job, a running job is terminated.
+
+        @return: C{False} if the job is already finished.
+        """
+
+        if job.state == QUEUED:
+            self._queue.remove(job)
+            self._finish(job, CANCELLED, defer.CancelledError())
+            return True
+        if job.state == RUNNING and not job._cancel_requested:
+            job._cancel_requested = True
+            try:
+                job.transport.signalProcess("TERM")
+            except error.ProcessExitedAlready:
+                pass
+            return True
+        return False
+
+    def _start_next(self):
+        while self._queue and len(self._running) < self.limit:
+            self._start(self._queue.popleft())
+
+    def _start(self, job):
+        args = [self.qemu_img or abspath_qemu("qemu-img")] + job.args
+        if self.nice:
+            ionice = procutils.which("ionice")
+            if ionice:
+                args = [ionice[0], "-c", "2", "-n", "7"] + args
+        job.state = RUNNING
+        self._running.add(job)
+        try:
+            job.transport = self.reactor.spawnProcess(
+                _JobProtocol(self, job), args[0], args, os.environ)
+        except Exception as e:
+            self._running.discard(job)
+            self._finish(job, FAILED, errors.ImageJobError(job, str(e)))
+            return
+        logger.info(job_started, job=job)
+        self._observable.notify("changed", job)
+
+    def _progress(self, job, progress):
+        if progress != job.progress:
+            job.progress = progress
+            self._observable.notify("changed", job)
+
+    def _ended(self, job, reason, err):
+        self._running.discard(job)
+        job.transport = None
+        if job._cancel_requested:
+            self._finish(job, CANCELLED, defer.CancelledError())
+        elif reason.check(error.ProcessDone):
+            job.progress = 100.0
+            self._finish(job, DONE)
+        else:
+            self._finish(job, FAILED, errors.ImageJobError(
+                job, err.strip() or str(reason.value)))
+        self._start_next()
+
+    def _finish(self, job, state, exc=None):
+        job.state = state
+        job.error = exc
+        if state == DONE:
+            logger.info(job_done, job=job)
+        elif state == FAILED:
+            logger.error(job_failed, job=job, err=exc.message)
+        else:
+            logger.info(job_cancelled, job=job)
+        finished = [j for j in self.jobs if j.finished()]
+        for old in finished[:-KEEP_FINISHED]:
+            self.jobs.remove(old)
+        self._observable.notify("changed", job)
+        job._fire()
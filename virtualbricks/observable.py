@@ -1,43 +1,118 @@
+# -*- test-case-name: virtualbricks.tests.test_observable -*-
 # Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
 # Copyright (C) 2013 Virtualbricks team
 
+import collections
+
+
 class Observable:
+    """
+    Notify the observers of named events.
+
+    In batching mode the notifications are collected and delivered at the end
+    of the reactor turn, each emitter is notified once for each event. The
+    observers added with C{immediate} set are always notified as soon as the
+    event is emitted.
+    """
 
     thawed = False
+    clock = None
+    __batching = 0
+    __flush_call = None
 
     def __init__(self, *names):
         self.__events = {}
+        self.__immediate = {}
+        self.__pending = collections.OrderedDict()
         for name in names:
             self.add_event(name)
 
     def set_thaw(self, value):
         self.thawed = value
 
+    def set_batching(self, batching):
+        """Enter or leave batching mode, calls can be nested.
+
+        Leaving the outermost batching mode delivers the pending
+        notifications.
+        """
+
+        if batching:
+            self.__batching += 1
+        else:
+            assert self.__batching > 0, "Not in batching mode"
+            self.__batching -= 1
+            if self.__batching == 0:
+                self.flush()
+
+    def is_batching(self):
+        return self.__batching > 0
+
     def add_event(self, name):
         if name in self.__events:
             raise ValueError("Event %s already present" % name)
         self.__events[name] = []
+        self.__immediate[name] = []
 
-    def add_observer(self, name, callback, args, kwds):
+    def add_observer(self, name, callback, args, kwds, immediate=False):
         if name not in self.__events:
             raise ValueError("Event %s not present" % name)
         if not callable(callback):
             raise TypeError("%r is not callable" % (callback, ))
-        self.__events[name].append((callback, args, kwds))
+        if immediate:
+            self.__immediate[name].append((callback, args, kwds))
+        else:
+            self.__events[name].append((callback, args, kwds))
 
     def remove_observer(self, name, callback, args, kwds):
         if name not in self.__events:
             raise ValueError("Event %s not present" % name)
         if not callable(callback):
             raise TypeError("%r is not callable" % (callback, ))
-        self.__events[name].remove((callback, args, kwds))
+        try:
+            self.__events[name].remove((callback, args, kwds))
+        except ValueError:
+            self.__immediate[name].remove((callback, args, kwds))
 
     def notify(self, name, emitter):
         if name not in self.__events:
             raise ValueError("Event %s not present" % name)
-        if not self.thawed:
-            for callback, args, kwds in self.__events[name]:
-                callback(emitter, *args, **kwds)
+        if self.thawed:
+            return
+        self.__deliver(self.__immediate[name], emitter)
+        if self.__batching:
+            # emitters are not required to be hashable
+            key = (name, id(emitter))
+            if key not in self.__pending:
+                self.__pending[key] = (name, emitter)
+                if self.__flush_call is None:
+                    self.__flush_call = self.__get_clock().callLater(
+                        0, self.flush)
+        else:
+            self.__deliver(self.__events[name], emitter)
+
+    def flush(self):
+        """Deliver now the pending notifications."""
+
+        if self.__flush_call is not None:
+            if self.__flush_call.active():
+                self.__flush_call.cancel()
+            self.__flush_call = None
+        pending = self.__pending.values()
+        self.__pending.clear()
+        for name, emitter in pending:
+            self.__deliver(self.__events[name], emitter)
+
+    def __deliver(self, observers, emitter):
+        # observers can be removed by a callback
+        for callback, args, kwds in list(observers):
+            callback(emitter, *args, **kwds)
+
+    def __get_clock(self):
+        if self.clock is None:
+            from twisted.internet import reactor
+            return reactor
+        return self.clock
 
     def __len__(self):
         return len(self.__events)
@@ -57,6 +132,12 @@ class Event:
             raise TypeError("%r is not callable" % (callback, ))
         self.__observable.add_observer(self.__name, callback, args, kwds)
 
+    def connect_immediate(self, callback, *args, **kwds):
+        if not callable(callback):
+            raise TypeError("%r is not callable" % (callback, ))
+        self.__observable.add_observer(self.__name, callback, args, kwds,
+                                       immediate=True)
+
     def disconnect(self, callback, *args, **kwds):
         if not callable(callback):
             raise TypeError("%r is not callable" % (callback, ))
@@ -73,3 +154,15 @@ class thaw:
 
     def __exit__(self, exc_type, exc_value, traceback):
         self.observable.set_thaw(False)
+
+
+class batch:
+
+    def __init__(self, observable):
+        self.observable = observable
+
+    def __enter__(self):
+        self.observable.set_batching(True)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.observable.set_batching(False)
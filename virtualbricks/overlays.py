@@ -0,0 +1,351 @@
+# -*- test-case-name: virtualbricks.tests.test_overlays -*-
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+Create the private COW overlays of the disks.
+
+The overlays are created with C{qemu-img create}, at most C{limit} at the
+same time. A new overlay must be on disk before its virtual machine is
+started but, instead of running sync(1) and flushing all the dirty pages of
+the host, only the created files and their directories are fsync'ed. The
+overlays created while a flush is running are flushed together by the next
+one.
+
+An image can have a warm pool: overlays of the image created in advance, in
+the background, and kept in the C{.warmpool} directory of the project. When a
+disk needs its private overlay, one of the pool is renamed in place, an
+atomic operation on the same file system, and the pool is refilled. The space
+used by all the pools is limited by a budget.
+"""
+
+import os
+import uuid
+import errno
+import hashlib
+
+from twisted.internet import defer, threads, utils
+from twisted.python import failure
+
+from virtualbricks import settings, log
+from virtualbricks._spawn import abspath_qemu
+
+
+__all__ = ["DEFAULT_LIMIT", "OverlayCreator", "WarmPool", "fsync_paths"]
+
+DEFAULT_LIMIT = 4
+POOL_DIRECTORY = ".warmpool"
+
+logger = log.Logger()
+fill_error = log.Event("Cannot fill the warm pool of {image}")
+no_qemu_img = log.Event("qemu-img not found, the warm pool of {image} is not "
+                        "filled")
+over_budget = log.Event("The warm pools use {usage} bytes, the budget of "
+                        "{budget} bytes is exhausted")
+take_error = log.Event("Cannot take the pooled overlay {path}")
+other_device = log.Event("The warm pool {directory} is not on the "
+                         "filesystem of {cowname}")
+
+
+def _fsync(path):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_paths(paths):
+    """Flush the files and, once each, the directories that contain them."""
+
+    directories = []
+    for path in paths:
+        _fsync(path)
+        directory = os.path.dirname(os.path.abspath(path))
+        if directory not in directories:
+            directories.append(directory)
+    for directory in directories:
+        _fsync(directory)
+
+
+def _created(result, cowname):
+    out, err, code = result
+    if code != 0:
+        raise RuntimeError("Cannot create private COW\n%s" % err)
+    return cowname
+
+
+class OverlayCreator:
+    """
+    @ivar flushes: how many flushes have been done.
+    """
+
+    def __init__(self, limit=DEFAULT_LIMIT, flush=None):
+        if flush is None:
+            flush = lambda paths: threads.deferToThread(fsync_paths, paths)
+        self.semaphore = defer.DeferredSemaphore(limit)
+        self.flushes = 0
+        self._flush = flush
+        # (path, deferred) waiting for the next flush
+        self._pending = []
+        self._flushing = False
+
+    def create(self, qemu_img, base, cowname, fmt):
+        """Create a new overlay of C{base} and flush it to disk.
+
+        @return: a deferred that fires with C{cowname}.
+        """
+
+        d = self.semaphore.run(self._run, qemu_img, base, cowname, fmt)
+        return d.addCallback(self._persist)
+
+    def _run(self, qemu_img, base, cowname, fmt):
+        args = ["create", "-b", base, "-f", fmt, cowname]
+        d = utils.getProcessOutputAndValue(qemu_img, args, os.environ)
+        return d.addCallback(_created, cowname)
+
+    def _persist(self, cowname):
+        d = defer.Deferred()
+        self._pending.append((cowname, d))
+        if not self._flushing:
+            self._flush_pending()
+        return d
+
+    def _flush_pending(self):
+        pending, self._pending = self._pending, []
+        self._flushing = True
+        self.flushes += 1
+        d = defer.maybeDeferred(self._flush, [path for path, _ in pending])
+        d.addBoth(self._flushed, pending)
+
+    def _flushed(self, result, pending):
+        self._flushing = False
+        if isinstance(result, failure.Failure):
+            for _, d in pending:
+                d.errback(result)
+        else:
+            for path, d in pending:
+                d.callback(path)
+        if self._pending:
+            self._flush_pending()
+
+
+def _pool_key(base, fmt):
+    return hashlib.sha1("{0}\0{1}".format(fmt, base)).hexdigest()[:16]
+
+
+def _disk_usage(path):
+    try:
+        return os.stat(path).st_blocks * 512
+    except OSError:
+        return 0
+
+
+def _unlink(path):
+    try:
+        os.unlink(path)
+    except OSError as e:
+        if e.errno != errno.ENOENT:
+            raise
+
+
+class WarmPool:
+    """
+    Keep ready the overlays of the images with a warm pool.
+
+    A pool is identified by its directory, the base image and the format of
+    the overlays. The overlays left by a previous session are adopted the
+    first time a pool is used.
+
+    @ivar usage: the space used on disk by the ready overlays.
+    """
+
+    def __init__(self, creator, budget, flush=None, home=None):
+        if flush is None:
+            flush = lambda paths: threads.deferToThread(fsync_paths, paths)
+        if home is None:
+            home = lambda: settings.VIRTUALBRICKS_HOME
+        self.creator = creator
+        self.budget = budget
+        self.usage = 0
+        self._flush = flush
+        self._home = home
+        # (directory, base, fmt) -> [path]
+        self._ready = {}
+        # (directory, base, fmt) -> number of overlays being created
+        self._filling = {}
+        # path -> space used on disk
+        self._sizes = {}
+        # the size of the last overlay created, used to estimate the space
+        # of the overlays being created
+        self._estimate = 0
+
+    def directory(self):
+        return os.path.join(self._home(), POOL_DIRECTORY)
+
+    def _pool(self, directory, base, fmt):
+        key = directory, base, fmt
+        if key not in self._ready:
+            self._ready[key] = self._adopt(directory, _pool_key(base, fmt))
+        return key
+
+    def _adopt(self, directory, prefix):
+        try:
+            names = sorted(os.listdir(directory))
+        except OSError:
+            return []
+        paths = []
+        for name in names:
+            if not name.startswith(prefix + "-"):
+                continue
+            path = os.path.join(directory, name)
+            if name.endswith(".cow"):
+                self._account(path)
+                paths.append(path)
+            else:
+                # interrupted while it was being created
+                _unlink(path)
+        return paths
+
+    def _account(self, path):
+        self._sizes[path] = size = _disk_usage(path)
+        self.usage += size
+
+    def _forget(self, path):
+        self.usage -= self._sizes.pop(path, 0)
+
+    def _pending_usage(self):
+        return sum(self._filling.itervalues()) * self._estimate
+
+    def size(self, image, fmt=None):
+        """Return the number of ready overlays of an image."""
+
+        if fmt is None:
+            fmt = settings.get("cowfmt")
+        return len(self._ready[self._pool(self.directory(), image.path, fmt)])
+
+    def fill(self, image, fmt=None):
+        """Start the creation of the overlays missing from the pool of an
+        image, within the budget."""
+
+        if fmt is None:
+            fmt = settings.get("cowfmt")
+        directory = self.directory()
+        key = self._pool(directory, image.path, fmt)
+        missing = (image.warm_pool - len(self._ready[key]) -
+                   self._filling.get(key, 0))
+        if missing <= 0:
+            return
+        qemu_img = abspath_qemu("qemu-img", return_relative=False)
+        if qemu_img is None:
+            logger.warn(no_qemu_img, image=image.name)
+            return
+        try:
+            os.makedirs(directory)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        prefix = _pool_key(image.path, fmt)
+        for i in range(missing):
+            if self.usage + self._pending_usage() >= self.budget:
+                logger.info(over_budget, usage=self.usage, budget=self.budget)
+                break
+            self._filling[key] = self._filling.get(key, 0) + 1
+            tmp = os.path.join(directory, "{0}-{1}.tmp".format(
+                prefix, uuid.uuid4().hex[:12]))
+            d = self.creator.create(qemu_img, image.path, tmp, fmt)
+            d.addBoth(self._created, key, tmp)
+            d.addErrback(logger.failure_eb, fill_error, image=image.name)
+
+    def _created(self, result, key, tmp):
+        self._filling[key] -= 1
+        if isinstance(result, failure.Failure):
+            _unlink(tmp)
+            return result
+        if key not in self._ready:
+            # the pool has been discarded in the meantime
+            _unlink(tmp)
+            return
+        path = tmp[:-len(".tmp")] + ".cow"
+        os.rename(tmp, path)
+        self._ready[key].append(path)
+        self._account(path)
+        self._estimate = self._sizes[path]
+
+    def take(self, image, cowname, fmt=None):
+        """Move a ready overlay of C{image} to C{cowname} and refill the pool.
+
+        @return: a deferred that fires with C{cowname} once the rename is on
+            disk or C{None} if the image has no ready overlay.
+        """
+
+        if not image.warm_pool:
+            return None
+        if fmt is None:
+            fmt = settings.get("cowfmt")
+        key = self._pool(self.directory(), image.path, fmt)
+        ready = self._ready[key]
+        while ready:
+            path = ready.pop(0)
+            self._forget(path)
+            try:
+                os.rename(path, cowname)
+            except OSError as e:
+                if e.errno == errno.EXDEV:
+                    # the overlay is on another filesystem, it stays in the
+                    # pool and the caller creates a new one
+                    ready.insert(0, path)
+                    self._account(path)
+                    logger.info(other_device, cowname=cowname,
+                                directory=self.directory())
+                    return None
+                logger.failure(take_error, path=path)
+            else:
+                self.fill(image, fmt)
+                d = defer.maybeDeferred(self._flush, [cowname])
+                return d.addCallback(lambda _: cowname)
+        self.fill(image, fmt)
+        return None
+
+    def resize(self, image, size):
+        """Change the number of overlays kept ready for an image."""
+
+        image.warm_pool = size
+        for key, paths in self._ready.iteritems():
+            if key[1] == image.path:
+                while len(paths) > size:
+                    path = paths.pop()
+                    self._forget(path)
+                    _unlink(path)
+        if size:
+            self.fill(image)
+
+    def discard(self, image):
+        """Remove all the ready overlays of an image."""
+
+        for key in [key for key in self._ready if key[1] == image.path]:
+            for path in self._ready.pop(key):
+                self._forget(path)
+                _unlink(path)
+
+    def clear(self):
+        """Forget the pools, the overlays are left on disk to be adopted
+        later."""
+
+        self._ready.clear()
+        self._sizes.clear()
+        self.usage = 0
@@ -0,0 +1,169 @@
+# -*- test-case-name: virtualbricks.tests.test_procstat -*-
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+Sample the resources used by the processes of the bricks.
+
+At every tick the sampler reads C{/proc/<pid>/stat}, C{statm} and C{io} of
+every running brick and sets C{brick.usage} to an L{Usage}. The CPU and the
+I/O are rates, they are known from the second sample of a process on.
+"""
+
+import os
+import collections
+
+from twisted.internet import task
+
+from virtualbricks import log, observable
+from virtualbricks.tools import fmtsize
+
+
+__all__ = ["DEFAULT_INTERVAL", "Counters", "Usage", "read_counters", "usage",
+           "format_usage", "Sampler"]
+
+logger = log.Logger()
+sampler_failed = log.Event("Process sampler stopped")
+
+DEFAULT_INTERVAL = 2
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+Counters = collections.namedtuple("Counters", ["cpu", "rss", "read_bytes",
+                                               "write_bytes"])
+Usage = collections.namedtuple("Usage", ["cpu", "rss", "read_rate",
+                                         "write_rate"])
+
+
+def read_counters(pid, root="/proc"):
+    """Return the L{Counters} of a process or C{None} if the process does not
+    exist.
+
+    The CPU time is in seconds, the resident set size in bytes. The I/O
+    counters are C{None} if they cannot be read, that is the case of the
+    processes of other users.
+    """
+
+    base = os.path.join(root, str(pid))
+    try:
+        with open(os.path.join(base, "stat")) as fp:
+            stat = fp.read()
+        with open(os.path.join(base, "statm")) as fp:
+            statm = fp.read()
+    except IOError:
+        return None
+    # the name of the process can contain spaces and parens
+    fields = stat[stat.rindex(")") + 2:].split()
+    cpu = float(int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+    rss = int(statm.split()[1]) * PAGE_SIZE
+    read_bytes = write_bytes = None
+    try:
+        with open(os.path.join(base, "io")) as fp:
+            for line in fp:
+                name, value = line.split(":")
+                if name == "read_bytes":
+                    read_bytes = int(value)
+                elif name == "write_bytes":
+                    write_bytes = int(value)
+    except IOError:
+        pass
+    return Counters(cpu, rss, read_bytes, write_bytes)
+
+
+def _rate(new, old, elapsed):
+    if new is None or old is None or elapsed <= 0:
+        return None
+    return max(new - old, 0) / elapsed
+
+
+def usage(counters, previous=None, elapsed=0):
+    """Return the L{Usage} from two samples taken C{elapsed} seconds apart.
+
+    Without a previous sample only the resident set size is known.
+    """
+
+    if previous is None:
+        return Usage(None, counters.rss, None, None)
+    cpu = _rate(counters.cpu, previous.cpu, elapsed)
+    if cpu is not None:
+        cpu *= 100
+    return Usage(cpu, counters.rss,
+                 _rate(counters.read_bytes, previous.read_bytes, elapsed),
+                 _rate(counters.write_bytes, previous.write_bytes, elapsed))
+
+
+def format_usage(usage):
+    """Return the CPU, the memory and the I/O of a L{Usage} as strings, "-"
+    if the value is not known."""
+
+    if usage is None:
+        return "-", "-", "-"
+    cpu = "-" if usage.cpu is None else "{0:.1f}%".format(usage.cpu)
+    if usage.read_rate is None or usage.write_rate is None:
+        io = "-"
+    else:
+        io = "{0}/s {1}/s".format(fmtsize(int(usage.read_rate)),
+                                  fmtsize(int(usage.write_rate)))
+    return cpu, fmtsize(usage.rss), io
+
+
+class Sampler:
+    """Sample all the running bricks of a factory, one pass each tick.
+
+    @ivar sampled: an event notified after every pass.
+    """
+
+    def __init__(self, factory, clock=None, root="/proc"):
+        if clock is None:
+            from twisted.internet import reactor as clock
+        self.factory = factory
+        self.clock = clock
+        self.root = root
+        self.__samples = {}
+        self.__call = None
+        self._observable = observable.Observable("sampled")
+        self.sampled = observable.Event(self._observable, "sampled")
+
+    def start(self, interval=DEFAULT_INTERVAL):
+        self.__call = task.LoopingCall(self.sample)
+        self.__call.clock = self.clock
+        d = self.__call.start(interval)
+        d.addErrback(logger.failure_eb, sampler_failed)
+        return d
+
+    def stop(self):
+        if self.__call is not None and self.__call.running:
+            self.__call.stop()
+        self.__call = None
+
+    def sample(self):
+        now = self.clock.seconds()
+        samples, self.__samples = self.__samples, {}
+        for brick in self.factory.bricks:
+            if brick.proc is None or brick.pid <= 0:
+                continue
+            counters = read_counters(brick.pid, self.root)
+            if counters is None:
+                brick.usage = None
+                continue
+            self.__samples[brick.pid] = now, counters
+            if brick.pid in samples:
+                then, previous = samples[brick.pid]
+                brick.usage = usage(counters, previous, now - then)
+            else:
+                brick.usage = usage(counters)
+        self._observable.notify("sampled", self)
@@ -1,7 +1,34 @@
-from virtualbricks import _qemu
+# -*- test-case-name: virtualbricks.tests.test_qemu -*-
+import os
+import re
+import json
+import errno
 
+from twisted.internet import defer, utils
+
+from virtualbricks import _qemu, log
+
+
+logger = log.Logger()
+probe_failed = log.Event("Cannot probe {path}")
+cache_load_error = log.Event("Cannot load the qemu capabilities cache {path}")
+cache_save_error = log.Event("Cannot save the qemu capabilities cache {path}")
+
+# how many binaries are probed at the same time
+MAX_PARALLEL = 8
+CACHE_FILENAME = "qemu-capabilities.json"
+# the first version with -netdev and -device
+NETDEV_VERSION = (0, 12)
+# the first version with aio=io_uring
+IO_URING_VERSION = (5, 0)
 
 _version = None
+# executable name -> Capabilities of the installed binaries, empty until they
+# are probed
+_capabilities = {}
+_probed = False
+# the deferreds waiting for the running probe
+_probing = None
 
 
 def _get_version():
@@ -20,6 +47,9 @@ def parse_and_install(string):
 
 
 def get_executables(version=None):
+    if _capabilities:
+        return tuple((name, caps.arch) for name, caps in
+                     sorted(_capabilities.items()))
     if version is None:
         version = _get_version()
     if version is None:
@@ -28,6 +58,8 @@ def get_executables(version=None):
 
 
 def get_cpus(architecture, version=None):
+    if architecture in _capabilities:
+        return _capabilities[architecture].cpus
     if version is None:
         version = _get_version()
     if version is None:
@@ -37,9 +69,320 @@ def get_cpus(architecture, version=None):
 
 
 def get_machines(architecture, version=None):
+    if architecture in _capabilities:
+        return _capabilities[architecture].machines
     if version is None:
         version = _get_version()
     if version is None:
         raise TypeError("Invalid qemu version")
     machines = _qemu.load_spec(version)['machines']
     return machines[architecture]
+
+
+def version_tuple(version):
+    """Return a version string, like C{"2.1.0"}, as a tuple of integers."""
+
+    return tuple(int(n) for n in re.findall(r"\d+", version)[:3])
+
+
+def get_version(name):
+    """Return the version of an executable as a tuple, the version of the
+    static specs if it has not been probed or C{None} if it is unknown."""
+
+    if name in _capabilities:
+        version = _capabilities[name].version
+    else:
+        version = _get_version()
+    if version is None:
+        return None
+    return version_tuple(version)
+
+
+def supports_netdev(name):
+    """Return C{True} if the network backends of an executable can be given
+    with C{-netdev} instead of the vlans of C{-net}.
+
+    If the version is unknown, the binary is assumed to be recent: the vlans
+    are not supported anymore since qemu 2.12.
+    """
+
+    version = get_version(name)
+    return version is None or version >= NETDEV_VERSION
+
+
+def supports_io_uring(name):
+    """Return C{True} if the disks of an executable can use the io_uring
+    backend, an unknown version is assumed to be recent."""
+
+    version = get_version(name)
+    return version is None or version >= IO_URING_VERSION
+
+
+class Capabilities:
+    """What an installed qemu binary supports.
+
+    @ivar identity: the size and the modification time of the binary, the
+        capabilities are probed again when it changes.
+    """
+
+    def __init__(self, path, identity, version, cpus, machines):
+        self.path = path
+        self.identity = identity
+        self.version = version
+        self.cpus = cpus
+        self.machines = machines
+
+    @property
+    def name(self):
+        return os.path.basename(self.path)
+
+    @property
+    def arch(self):
+        return self.name[len("qemu-system-"):]
+
+    def __eq__(self, other):
+        if not isinstance(other, Capabilities):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not self == other
+
+    def dump(self):
+        return {"size": self.identity[0], "mtime": self.identity[1],
+                "version": self.version, "cpus": self.cpus,
+                "machines": self.machines}
+
+    @classmethod
+    def load(cls, path, doc):
+        return cls(str(path), (doc["size"], doc["mtime"]),
+                   str(doc["version"]), _qemu._pairs(doc["cpus"]),
+                   _qemu._pairs(doc["machines"]))
+
+
+# "x86           qemu64  QEMU Virtual CPU version 2.0.0", "  arm1026",
+# "PowerPC 601_v1           PVR 00010001", "MIPS '4Kc'"
+CPU_RE = re.compile(r"^(?:(?:x86|PowerPC|Sparc|MIPS)\s+)?"
+                    r"(?:'(?P<quoted>[^']+)'|(?P<name>\S+))\s*(?P<desc>.*)$")
+
+
+def parse_cpus(output):
+    """Parse the output of C{qemu -cpu help}."""
+
+    cpus = []
+    for line in output.splitlines():
+        line = line.strip()
+        if line.startswith("Recognized"):
+            # the CPUID flags follow
+            break
+        if not line or line.endswith(":"):
+            continue
+        match = CPU_RE.match(line)
+        name = match.group("quoted") or match.group("name")
+        cpus.append((name, match.group("desc") or name))
+    return tuple(cpus)
+
+
+def parse_machines(output):
+    """Parse the output of C{qemu -machine help}."""
+
+    machines = []
+    for line in output.splitlines():
+        line = line.strip()
+        if not line or line.endswith(":"):
+            continue
+        parts = line.split(None, 1)
+        machines.append((parts[0], parts[-1]))
+    return tuple(machines)
+
+
+def identity(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime
+
+
+def find_binaries(search_path):
+    """Return the absolute paths of the qemu-system-* binaries.
+
+    If the same binary is in more than one directory, only the first one is
+    returned.
+    """
+
+    found = {}
+    for directory in search_path:
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            continue
+        for name in names:
+            path = os.path.join(directory, name)
+            if (name.startswith("qemu-system-") and name not in found and
+                    os.access(path, os.X_OK)):
+                found[name] = path
+    return sorted(found.values())
+
+
+def load_cache(filename):
+    """Return the cached capabilities, by binary path."""
+
+    try:
+        with open(filename) as fp:
+            doc = json.load(fp)
+        return dict((str(path), Capabilities.load(path, caps))
+                    for path, caps in doc.items())
+    except IOError as e:
+        if e.errno != errno.ENOENT:
+            logger.failure(cache_load_error, path=filename)
+    except (ValueError, KeyError, TypeError):
+        logger.failure(cache_load_error, path=filename)
+    return {}
+
+
+def save_cache(filename, capabilities):
+    tmp = filename + ".tmp"
+    try:
+        with open(tmp, "w") as fp:
+            json.dump(dict((caps.path, caps.dump())
+                           for caps in capabilities.values()), fp)
+        os.rename(tmp, filename)
+    except (IOError, OSError):
+        logger.failure(cache_save_error, path=filename)
+
+
+def _output(result):
+    out, err, code = result
+    if code != 0:
+        raise RuntimeError(err.strip() or "exit code %d" % code)
+    return out
+
+
+def probe_binary(path, reactor=None):
+    """Run C{-version}, C{-cpu help} and C{-machine help} in parallel.
+
+    Only C{-version} is required to succeed, the binaries that do not accept
+    the other options report no cpus or machines.
+
+    @rtype: L{Capabilities}
+    """
+
+    ident = identity(path)
+
+    def run(*args):
+        d = utils.getProcessOutputAndValue(path, args, os.environ,
+                                           reactor=reactor)
+        return d.addCallback(_output)
+
+    def build(results):
+        # all the processes are waited for, even if -version failed
+        for success, result in results:
+            if not success:
+                return result
+        version, cpus, machines = [result for _, result in results]
+        return Capabilities(path, ident, version, cpus, machines)
+
+    d = defer.DeferredList([
+        run("-version").addCallback(_qemu.parse_qemu_version),
+        run("-cpu", "help").addCallbacks(parse_cpus, lambda _: ()),
+        run("-machine", "help").addCallbacks(parse_machines, lambda _: ())
+    ], consumeErrors=True)
+    return d.addCallback(build)
+
+
+def _default_search_path():
+    from virtualbricks import settings, _spawn
+
+    return _spawn._search_path(settings.get("qemupath"))
+
+
+def _default_cache():
+    from virtualbricks import settings
+
+    return os.path.join(settings.DEFAULT_HOME, CACHE_FILENAME)
+
+
+def _probe(search_path, cache, reactor):
+    cached = load_cache(cache)
+    probed = {}
+    semaphore = defer.DeferredSemaphore(MAX_PARALLEL)
+    running = []
+
+    def add(caps):
+        probed[caps.path] = caps
+
+    for path in find_binaries(search_path):
+        caps = cached.get(path)
+        try:
+            if caps is not None and caps.identity == identity(path):
+                add(caps)
+                continue
+        except OSError:
+            continue
+        d = semaphore.run(probe_binary, path, reactor)
+        d.addCallbacks(add, logger.failure_eb,
+                       errbackArgs=(probe_failed, ),
+                       errbackKeywords={"path": path})
+        running.append(d)
+
+    def done(_):
+        if probed != cached:
+            save_cache(cache, probed)
+        return probed
+
+    return defer.gatherResults(running).addCallback(done)
+
+
+def _install(probed):
+    global _probed
+    _capabilities.clear()
+    for caps in probed.values():
+        _capabilities[caps.name] = caps
+    # if no binary is found, probe again the next time
+    _probed = bool(_capabilities)
+    # the static specs are still used for the binaries that are not probed
+    for name in "qemu-system-x86_64", "qemu-system-i386":
+        if name in _capabilities:
+            try:
+                install(_qemu.last_supported_version(
+                    _capabilities[name].version))
+            except ValueError:
+                pass
+            break
+    return _capabilities
+
+
+def is_probed():
+    """Return C{True} if the installed binaries have already been found and
+    probed."""
+
+    return _probed
+
+
+def probe(search_path=None, cache=None, reactor=None):
+    """Probe the installed qemu binaries and install their capabilities.
+
+    The capabilities are cached on disk, keyed by the path, the size and the
+    modification time of the binary, and only the new or changed binaries are
+    run. If a probe is already running, its result is returned.
+
+    @return: a deferred that fires with the capabilities by executable name.
+    """
+
+    global _probing
+    d = defer.Deferred()
+    if _probing is not None:
+        _probing.append(d)
+        return d
+    _probing = [d]
+    if search_path is None:
+        search_path = _default_search_path()
+    if cache is None:
+        cache = _default_cache()
+
+    def notify(result):
+        global _probing
+        waiting, _probing = _probing, None
+        for d in waiting:
+            d.callback(result)
+
+    _probe(search_path, cache, reactor).addCallback(_install).addBoth(notify)
+    return d
@@ -0,0 +1,233 @@
+# -*- test-case-name: virtualbricks.tests.test_qmp -*-
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+A client of the QEMU Machine Protocol.
+
+Every virtual machine listens for QMP on a Unix socket besides its human
+monitor. The commands are pipelined: each request carries an id and the
+responses are matched to the requests by it. The asynchronous events of QEMU,
+SHUTDOWN, STOP, RESUME and so on, are delivered to the subscribers.
+"""
+
+import json
+import itertools
+
+from twisted.internet import defer, error, endpoints, task
+from twisted.protocols import basic
+
+from virtualbricks import errors, log
+
+
+__all__ = ["DEFAULT_TIMEOUT", "QMPProtocol", "connect"]
+
+logger = log.Logger()
+unexpected_message = log.Event("Unexpected QMP message: {message}")
+subscriber_error = log.Event("Error in a subscriber of the QMP event {name}")
+
+DEFAULT_TIMEOUT = 10
+POLL_INTERVAL = 0.1
+
+
+class QMPProtocol(basic.LineOnlyReceiver):
+    """
+    @ivar greeting: the greeting of QEMU, with its version and capabilities.
+    @ivar ready: a deferred that fires with the protocol once the
+        capabilities are negotiated.
+    @ivar lost: a deferred that fires when the connection is lost.
+    """
+
+    delimiter = "\n"
+    MAX_LENGTH = 1 << 24
+
+    def __init__(self):
+        self.greeting = None
+        self.ready = defer.Deferred()
+        self.lost = defer.Deferred()
+        self._ids = itertools.count(1)
+        # id -> deferred
+        self._pending = {}
+        # event -> [callback]
+        self._subscribers = {}
+
+    def lineReceived(self, line):
+        line = line.strip()
+        if not line:
+            return
+        try:
+            message = json.loads(line)
+        except ValueError:
+            logger.warn(unexpected_message, message=line)
+            return
+        if "QMP" in message:
+            self.greeting = message["QMP"]
+            d = self.execute("qmp_capabilities")
+            d.addCallback(lambda _: self)
+            d.chainDeferred(self.ready)
+        elif "event" in message:
+            self._dispatch(message)
+        elif message.get("id") in self._pending:
+            d = self._pending.pop(message["id"])
+            if "error" in message:
+                err = message["error"]
+                d.errback(errors.QMPError(err.get("class", ""),
+                                          err.get("desc", "")))
+            else:
+                d.callback(message.get("return"))
+        else:
+            logger.warn(unexpected_message, message=line)
+
+    def _dispatch(self, message):
+        event = message["event"]
+        for callback in list(self._subscribers.get(event, ())):
+            try:
+                callback(event, message.get("data", {}))
+            except:
+                logger.failure(subscriber_error, name=event)
+
+    def connectionLost(self, reason):
+        pending, self._pending = self._pending, {}
+        for d in pending.itervalues():
+            d.errback(reason)
+        if not self.ready.called:
+            self.ready.errback(reason)
+        self.lost.callback(None)
+
+    def subscribe(self, event, callback):
+        """Call C{callback(event, data)} every time QEMU emits C{event}."""
+
+        self._subscribers.setdefault(event, []).append(callback)
+
+    def unsubscribe(self, event, callback):
+        self._subscribers[event].remove(callback)
+
+    def execute(self, command, **arguments):
+        """Send a command, it is not necessary to wait for the response of
+        the previous one.
+
+        @return: a deferred that fires with the return value of the command
+            or fails with L{errors.QMPError}.
+        """
+
+        id = next(self._ids)
+        request = {"execute": command, "id": id}
+        if arguments:
+            request["arguments"] = arguments
+        self._pending[id] = d = defer.Deferred()
+        self.sendLine(json.dumps(request))
+        return d
+
+    def human_command(self, command_line):
+        """Run a command of the human monitor, return its output."""
+
+        return self.execute("human-monitor-command",
+                            **{"command-line": command_line})
+
+    def query_status(self):
+        """Return a deferred that fires with the run state of the virtual
+        machine, a dictionary with the C{running} and C{status} keys."""
+
+        return self.execute("query-status")
+
+    def stop(self):
+        return self.execute("stop")
+
+    def cont(self):
+        return self.execute("cont")
+
+    def system_powerdown(self):
+        return self.execute("system_powerdown")
+
+    def system_reset(self):
+        return self.execute("system_reset")
+
+    def device_add(self, driver, id=None, **properties):
+        properties["driver"] = driver
+        if id is not None:
+            properties["id"] = id
+        return self.execute("device_add", **properties)
+
+    def device_del(self, id):
+        return self.execute("device_del", id=id)
+
+    def query_block(self):
+        """Return a deferred that fires with the list of the block devices."""
+
+        return self.execute("query-block")
+
+    def block_set_io_throttle(self, device=None, id=None, **limits):
+        """Set the I/O limits of a block device, given by its name or by the
+        id of its guest device. The limits that are not given are removed."""
+
+        arguments = dict.fromkeys(("iops", "iops_rd", "iops_wr", "bps",
+                                   "bps_rd", "bps_wr"), 0)
+        arguments.update(limits)
+        if device is not None:
+            arguments["device"] = device
+        if id is not None:
+            arguments["id"] = id
+        return self.execute("block_set_io_throttle", **arguments)
+
+    def _snapshot(self, command, name):
+        # savevm and loadvm exist only in the human monitor, they report the
+        # errors in their output
+        def check(output):
+            if output and output.strip():
+                raise errors.QMPError("GenericError", output.strip())
+
+        d = self.human_command("{0} {1}".format(command, name))
+        return d.addCallback(check)
+
+    def savevm(self, name):
+        """Save the state of the virtual machine in the snapshot C{name}."""
+
+        return self._snapshot("savevm", name)
+
+    def loadvm(self, name):
+        """Restore the state of the virtual machine from the snapshot
+        C{name}."""
+
+        return self._snapshot("loadvm", name)
+
+
+def connect(path, reactor=None, timeout=DEFAULT_TIMEOUT):
+    """Connect to the QMP socket of a virtual machine.
+
+    QEMU may not be listening yet when it has just been started, the socket
+    is polled for C{timeout} seconds.
+
+    @return: a deferred that fires with a L{QMPProtocol} ready to execute
+        commands.
+    """
+
+    if reactor is None:
+        from twisted.internet import reactor
+    endpoint = endpoints.UNIXClientEndpoint(reactor, path)
+    deadline = reactor.seconds() + timeout
+
+    def attempt():
+        d = endpoints.connectProtocol(endpoint, QMPProtocol())
+        return d.addErrback(retry)
+
+    def retry(fail):
+        fail.trap(error.ConnectError)
+        if reactor.seconds() >= deadline:
+            return fail
+        return task.deferLater(reactor, POLL_INTERVAL, attempt)
+
+    return attempt().addCallback(lambda protocol: protocol.ready)
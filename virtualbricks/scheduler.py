@@ -0,0 +1,399 @@
+# -*- test-case-name: virtualbricks.tests.test_scheduler -*-
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+Start and stop many bricks at once following the topology of the lab.
+
+A brick depends on the bricks that own the socks its plugs are connected to.
+A brick is started as soon as all its dependencies are running and it is
+stopped as soon as all the bricks that depend on it are stopped, so bricks
+that do not depend on each other are started and stopped in parallel.
+
+The virtual machines of a lab can be checkpointed together: they are paused
+at the same time, so that their snapshots are consistent with each other,
+their states are saved in parallel and then they are resumed together.
+"""
+
+import collections
+
+from twisted.internet import defer, error
+from twisted.python import failure
+
+from virtualbricks import errors, log
+from virtualbricks.tools import is_running
+
+
+if False:  # pyflakes
+    _ = str
+
+
+__all__ = ["DEFAULT_CONCURRENCY", "DEFAULT_STOP_CONCURRENCY",
+           "DEFAULT_TIMEOUT", "DEFAULT_KILL_TIMEOUT", "PowerResult", "Report",
+           "DEFAULT_SNAPSHOT_CONCURRENCY", "dependencies", "dependency_graph",
+           "toposort", "poweron", "stop", "poweroff", "checkpoint",
+           "restore"]
+
+logger = log.Logger()
+lab_started = log.Event("Started {done} of {total} bricks in {elapsed:.3f} "
+                        "seconds")
+lab_stopped = log.Event("Stopped {done} of {total} bricks in {elapsed:.3f} "
+                        "seconds")
+brick_failed = log.Event("Operation failed on {brick}")
+brick_not_stopped = log.Event("{brick} is still running, sending SIG{signame}")
+lab_checkpointed = log.Event("Saved {done} of {total} virtual machines in "
+                             "{elapsed:.3f} seconds")
+lab_restored = log.Event("Restored {done} of {total} virtual machines in "
+                         "{elapsed:.3f} seconds")
+cont_failed = log.Event("Cannot resume {brick}")
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_STOP_CONCURRENCY = 64
+DEFAULT_TIMEOUT = 30
+DEFAULT_KILL_TIMEOUT = 5
+# saving the state of a virtual machine writes all its RAM
+DEFAULT_SNAPSHOT_CONCURRENCY = 4
+
+PowerResult = collections.namedtuple("PowerResult", ["brick", "success",
+                                                     "result", "elapsed"])
+
+
+class Report:
+    """The outcome of an operation over many bricks.
+
+    @ivar results: a L{PowerResult} for each brick, in the order the bricks
+        were given.
+    @ivar elapsed: the seconds taken by the whole operation.
+    """
+
+    def __init__(self, results, elapsed):
+        self.results = results
+        self.elapsed = elapsed
+
+    def failures(self):
+        return [r for r in self.results if not r.success]
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self):
+        return len(self.results)
+
+
+def dependencies(brick):
+    """Return the bricks that own the socks the plugs of C{brick} are
+    connected to."""
+
+    deps = []
+    for plug in brick.plugs:
+        if plug.sock is not None:
+            other = plug.sock.brick
+            if other is not None and other is not brick and other not in deps:
+                deps.append(other)
+    return deps
+
+
+def dependency_graph(bricks):
+    """Return a dictionary that maps each brick to its dependencies.
+
+    Dependencies that are not in C{bricks} are ignored, the brick starts them
+    by itself when it is powered on.
+    """
+
+    known = set(bricks)
+    return dict((brick, [d for d in dependencies(brick) if d in known])
+                for brick in bricks)
+
+
+def toposort(graph):
+    """Return the nodes of the graph, dependencies first.
+
+    If the graph has loops, the edges that close the loops are ignored.
+    """
+
+    order = []
+    visited = set()
+    for root in graph:
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [(root, iter(graph[root]))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if child not in visited:
+                    visited.add(child)
+                    stack.append((child, iter(graph[child])))
+                    break
+            else:
+                stack.pop()
+                order.append(node)
+    return order
+
+
+class _Outcome:
+    """Notify many waiters when a brick is done."""
+
+    def __init__(self):
+        self.result = None
+        self.waiters = []
+
+    def wait(self):
+        if self.result is not None:
+            return defer.succeed(self.result)
+        d = defer.Deferred()
+        self.waiters.append(d)
+        return d
+
+    def done(self, result):
+        self.result = result
+        waiters, self.waiters = self.waiters, []
+        for d in waiters:
+            d.callback(result)
+
+
+def _timed(clock, func, *args):
+    start = clock.seconds()
+    d = defer.maybeDeferred(func, *args)
+    d.addBoth(lambda result: (result, clock.seconds() - start))
+    return d
+
+
+def _run(bricks, graph, action, concurrency, clock, strict):
+    """Run C{action} on every brick once the bricks in C{graph[brick]} are
+    done.
+
+    If C{strict} is true, C{action} is not run if one of the bricks waited for
+    failed.
+    """
+
+    semaphore = defer.DeferredSemaphore(concurrency)
+    outcomes = {}
+    results = {}
+    start = clock.seconds()
+
+    def finish(result, brick, outcome):
+        value, elapsed = result
+        success = not isinstance(value, failure.Failure)
+        if not success:
+            logger.failure(brick_failed, value, brick=brick)
+        results[brick] = PowerResult(brick, success, value, elapsed)
+        outcome.done(success)
+
+    def run(waited, brick, outcome):
+        if all(waited) or not strict:
+            d = semaphore.run(_timed, clock, action, brick)
+        else:
+            msg = _("Cannot start '%s': a dependency failed") % brick.name
+            d = defer.succeed((failure.Failure(errors.DependencyError(msg)),
+                               None))
+        d.addCallback(finish, brick, outcome)
+        return d
+
+    pending = []
+    for brick in toposort(graph):
+        # only the bricks already scheduled are waited for, the others close a
+        # loop
+        waits = [outcomes[other].wait() for other in graph[brick]
+                 if other in outcomes]
+        outcome = outcomes[brick] = _Outcome()
+        d = defer.gatherResults(waits)
+        d.addCallback(run, brick, outcome)
+        pending.append(d)
+
+    def report(_):
+        return Report([results[b] for b in bricks], clock.seconds() - start)
+
+    return defer.gatherResults(pending).addCallback(report)
+
+
+def _log_report(report, event):
+    done = len(report) - len(report.failures())
+    logger.info(event, done=done, total=len(report), elapsed=report.elapsed)
+    return report
+
+
+def poweron(bricks, concurrency=DEFAULT_CONCURRENCY, clock=None):
+    """Start all the bricks, following their dependencies.
+
+    @param bricks: the bricks to start.
+    @param concurrency: how many bricks can be starting at the same time.
+    @type concurrency: C{int}
+    @return: a deferred that fires with a L{Report}. It never fails, the
+        errors are reported in the L{PowerResult}s.
+    """
+
+    if clock is None:
+        from twisted.internet import reactor as clock
+
+    bricks = list(bricks)
+    graph = dependency_graph(bricks)
+    d = _run(bricks, graph, lambda b: b.poweron(), concurrency, clock, True)
+    return d.addCallback(_log_report, lab_started)
+
+
+def stop(brick, timeout=DEFAULT_TIMEOUT, kill_timeout=DEFAULT_KILL_TIMEOUT,
+         clock=None):
+    """Stop a brick gracefully, if it does not stop in time, terminate it.
+
+    Virtual machines receive an ACPI powerdown, the other bricks a SIGTERM.
+    If the brick is still running after C{timeout} seconds, it receives a
+    SIGTERM and, after other C{kill_timeout} seconds, a SIGKILL.
+
+    @return: a deferred that fires as L{IBrick.poweroff}.
+    """
+
+    if clock is None:
+        from twisted.internet import reactor as clock
+
+    def send_signal(signo):
+        logger.warn(brick_not_stopped, brick=brick, signame=signo)
+        try:
+            brick.send_signal(signo)
+        except (OSError, error.ProcessExitedAlready):
+            pass
+
+    def cancel(passthru):
+        for call in calls:
+            if call.active():
+                call.cancel()
+        return passthru
+
+    d = brick.poweroff()
+    calls = [clock.callLater(timeout, send_signal, "TERM"),
+             clock.callLater(timeout + kill_timeout, send_signal, "KILL")]
+    return d.addBoth(cancel)
+
+
+def poweroff(bricks, timeout=DEFAULT_TIMEOUT,
+             kill_timeout=DEFAULT_KILL_TIMEOUT,
+             concurrency=DEFAULT_STOP_CONCURRENCY, clock=None):
+    """Stop all the bricks, a brick is stopped after all the bricks plugged to
+    it.
+
+    See L{stop} for C{timeout} and C{kill_timeout}.
+
+    @return: a deferred that fires with a L{Report}.
+    """
+
+    if clock is None:
+        from twisted.internet import reactor as clock
+
+    bricks = [brick for brick in bricks if is_running(brick)]
+    dependents = dict((brick, []) for brick in bricks)
+    for brick, deps in dependency_graph(bricks).iteritems():
+        for dep in deps:
+            dependents[dep].append(brick)
+    action = lambda b: stop(b, timeout, kill_timeout, clock)
+    d = _run(bricks, dependents, action, concurrency, clock, False)
+    return d.addCallback(_log_report, lab_stopped)
+
+
+def _pause(vms):
+    """Pause all the virtual machines at the same time.
+
+    @return: a deferred that fires with a dictionary that maps each virtual
+        machine to its QMP client or, if it could not be paused, to the
+        failure.
+    """
+
+    def stop(client):
+        return client.stop().addCallback(lambda _: client)
+
+    d = defer.DeferredList([vm.qmp().addCallback(stop) for vm in vms],
+                           consumeErrors=True)
+    return d.addCallback(lambda results: dict(
+        (vm, result) for vm, (_, result) in zip(vms, results)))
+
+
+def _resume(paused):
+    deferreds = []
+    for vm, client in paused.iteritems():
+        if not isinstance(client, failure.Failure):
+            d = client.cont()
+            d.addErrback(logger.failure_eb, cont_failed, brick=vm)
+            deferreds.append(d)
+    return defer.DeferredList(deferreds)
+
+
+def _snapshot(vms, paused, action, concurrency, clock, start):
+    def run(vm):
+        client = paused.get(vm)
+        if isinstance(client, failure.Failure):
+            return client
+        return action(vm, client)
+
+    def finish(report):
+        d = _resume(paused)
+        return d.addCallback(lambda _: Report(report.results,
+                                              clock.seconds() - start))
+
+    # no dependencies, the machines are saved in the given order
+    graph = collections.OrderedDict((vm, []) for vm in vms)
+    return _run(vms, graph, run, concurrency, clock, False).addCallback(finish)
+
+
+def checkpoint(vms, tag, concurrency=DEFAULT_SNAPSHOT_CONCURRENCY,
+               clock=None):
+    """Save the state of all the running virtual machines in the snapshot
+    C{tag}.
+
+    The virtual machines are paused together, their states are saved, at
+    most C{concurrency} at a time, and they are resumed together.
+
+    @return: a deferred that fires with a L{Report} of the running virtual
+        machines, the elapsed time of a result is the time taken to save the
+        state of that machine.
+    """
+
+    if clock is None:
+        from twisted.internet import reactor as clock
+
+    vms = [vm for vm in vms if is_running(vm)]
+    start = clock.seconds()
+    d = _pause(vms)
+    d.addCallback(lambda paused: _snapshot(
+        vms, paused, lambda vm, client: client.savevm(tag), concurrency,
+        clock, start))
+    return d.addCallback(_log_report, lab_checkpointed)
+
+
+def restore(vms, tag, concurrency=DEFAULT_SNAPSHOT_CONCURRENCY, clock=None):
+    """Bring all the virtual machines back to the snapshot C{tag}.
+
+    The running virtual machines are paused together, their states are
+    loaded and they are resumed together, the others are started from the
+    snapshot. At most C{concurrency} machines are restored at a time.
+
+    @return: a deferred that fires with a L{Report}.
+    """
+
+    if clock is None:
+        from twisted.internet import reactor as clock
+
+    vms = list(vms)
+    start = clock.seconds()
+
+    def action(vm, client):
+        if client is None:
+            return vm.poweron(tag)
+        return client.loadvm(tag)
+
+    d = _pause([vm for vm in vms if is_running(vm)])
+    d.addCallback(lambda paused: _snapshot(vms, paused, action, concurrency,
+                                           clock, start))
+    return d.addCallback(_log_report, lab_restored)
@@ -0,0 +1,210 @@
+# -*- test-case-name: virtualbricks.tests.test_supervisor -*-
+# Virtualbricks - a vde/qemu gui written in python and GTK/Glade.
+# Copyright (C) 2013 Virtualbricks team
+
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+Restart the bricks whose process dies unexpectedly.
+
+The C{restart} parameter of a brick selects the policy: C{never} (the
+default), C{on-failure}, the brick is restarted if its process exits with an
+error or is killed by a signal, and C{always}. A process ended by
+L{IBrick.poweroff} is never restarted.
+
+The restarts are delayed with an exponential backoff. The crashes are counted
+over a sliding window, if a brick crashes more than C{max_restarts} times in
+the window it is left stopped. Once a brick is running again, the running
+bricks plugged to its socks are re-attached.
+"""
+
+from twisted.internet import defer, error
+
+from virtualbricks import log
+
+
+__all__ = ["NEVER", "ON_FAILURE", "ALWAYS", "POLICIES", "DEFAULT_DELAY",
+           "DEFAULT_MAX_DELAY", "DEFAULT_MAX_RESTARTS", "DEFAULT_WINDOW",
+           "Metrics", "Supervisor", "dependents"]
+
+logger = log.Logger()
+brick_crashed = log.Event("{brick} terminated unexpectedly, restarting it in "
+                          "{delay} seconds")
+brick_restarted = log.Event("{brick} restarted after {downtime:.3f} seconds")
+restart_failed = log.Event("Cannot restart {brick}")
+crash_loop = log.Event("{brick} crashed {crashes} times in {window} seconds, "
+                       "giving up")
+invalid_policy = log.Event("Invalid restart policy {policy} for {brick}")
+reattach_failed = log.Event("Cannot re-attach {brick}")
+
+NEVER = "never"
+ON_FAILURE = "on-failure"
+ALWAYS = "always"
+POLICIES = (NEVER, ON_FAILURE, ALWAYS)
+DEFAULT_DELAY = 1
+DEFAULT_MAX_DELAY = 60
+DEFAULT_MAX_RESTARTS = 5
+DEFAULT_WINDOW = 300
+
+
+def _failed(status):
+    return status is not None and not status.check(error.ProcessDone)
+
+
+def dependents(brick):
+    """Return the running bricks plugged to the socks of C{brick}."""
+
+    deps = []
+    for sock in brick.socks:
+        for plug in sock.plugs:
+            other = plug.brick
+            if (other is not None and other is not brick and
+                    other.proc is not None and other not in deps):
+                deps.append(other)
+    return deps
+
+
+class Metrics:
+    """The restart history of a brick.
+
+    @ivar restarts: how many times the brick has been restarted.
+    @ivar downtime: the seconds the brick has been down before the restarts.
+    @ivar crashes: the times of the crashes in the current window.
+    @ivar down_since: when the brick crashed, C{None} if it is not waiting to
+        be restarted.
+    @ivar gave_up: C{True} if the brick is in a crash loop and it is not
+        restarted anymore.
+    """
+
+    def __init__(self):
+        self.restarts = 0
+        self.downtime = 0.0
+        self.crashes = []
+        self.down_since = None
+        self.gave_up = False
+
+
+class Supervisor:
+
+    def __init__(self, factory, clock=None, delay=DEFAULT_DELAY,
+                 max_delay=DEFAULT_MAX_DELAY,
+                 max_restarts=DEFAULT_MAX_RESTARTS, window=DEFAULT_WINDOW):
+        if clock is None:
+            from twisted.internet import reactor as clock
+        self.factory = factory
+        self.clock = clock
+        self.delay = delay
+        self.max_delay = max_delay
+        self.max_restarts = max_restarts
+        self.window = window
+        self.__metrics = {}
+        self.__calls = {}
+
+    def metrics(self, brick):
+        """Return the L{Metrics} of a brick."""
+
+        try:
+            return self.__metrics[brick]
+        except KeyError:
+            metrics = self.__metrics[brick] = Metrics()
+            return metrics
+
+    def is_pending(self, brick):
+        """Return C{True} if the brick is waiting to be restarted."""
+
+        return brick in self.__calls
+
+    def cancel(self, brick):
+        """Do not restart a brick that is waiting to be restarted."""
+
+        call = self.__calls.pop(brick, None)
+        if call is not None and call.active():
+            call.cancel()
+        metrics = self.__metrics.get(brick)
+        if metrics is not None:
+            metrics.down_since = None
+
+    def forget(self, brick):
+        """Cancel any restart and drop the metrics of a removed brick."""
+
+        self.cancel(brick)
+        self.__metrics.pop(brick, None)
+
+    def should_restart(self, brick, status):
+        policy = brick.config["restart"]
+        if policy == ALWAYS:
+            return True
+        elif policy == ON_FAILURE:
+            return _failed(status)
+        elif policy != NEVER:
+            logger.warn(invalid_policy, policy=policy, brick=brick.name)
+        return False
+
+    def process_ended(self, brick, status, requested):
+        """Called when the process of a brick ends.
+
+        @param requested: C{True} if the brick was stopped on request.
+        """
+
+        if requested:
+            self.cancel(brick)
+        elif self.should_restart(brick, status):
+            self._crashed(brick)
+
+    def _crashed(self, brick):
+        now = self.clock.seconds()
+        metrics = self.metrics(brick)
+        metrics.crashes = [t for t in metrics.crashes
+                           if now - t < self.window] + [now]
+        if len(metrics.crashes) > self.max_restarts:
+            logger.error(crash_loop, brick=brick.name,
+                         crashes=len(metrics.crashes), window=self.window)
+            metrics.gave_up = True
+            metrics.down_since = None
+            return
+        metrics.gave_up = False
+        if metrics.down_since is None:
+            metrics.down_since = now
+        delay = min(self.delay * 2 ** (len(metrics.crashes) - 1),
+                    self.max_delay)
+        logger.warn(brick_crashed, brick=brick.name, delay=delay)
+        self.__calls[brick] = self.clock.callLater(delay, self._restart,
+                                                   brick)
+
+    def _restart(self, brick):
+        del self.__calls[brick]
+        if brick not in self.factory.bricks or brick.proc is not None:
+            self.metrics(brick).down_since = None
+            return defer.succeed(None)
+        d = brick.poweron()
+        d.addCallbacks(self._restarted, self._restart_failed,
+                       callbackArgs=(brick, ), errbackArgs=(brick, ))
+        return d
+
+    def _restarted(self, _, brick):
+        metrics = self.metrics(brick)
+        metrics.restarts += 1
+        if metrics.down_since is not None:
+            downtime = self.clock.seconds() - metrics.down_since
+            metrics.downtime += downtime
+            metrics.down_since = None
+            logger.info(brick_restarted, brick=brick.name, downtime=downtime)
+        for other in dependents(brick):
+            d = defer.maybeDeferred(other.reattach, brick)
+            d.addErrback(logger.failure_eb, reattach_failed, brick=other.name)
+
+    def _restart_failed(self, failure, brick):
+        logger.failure(restart_failed, failure, brick=brick.name)
+        self._crashed(brick)
@@ -5,10 +5,30 @@ from virtualbricks import brickfactory, bricks, virtualmachines as vm
 
 class ProcessTransportStub:
 
-    pid = -1
+    def __init__(self, pid=-1):
+        self.pid = pid
+        self.signals = []
+        self.written = []
 
     def signalProcess(self, signal):
-        pass
+        self.signals.append(signal)
+
+    def write(self, data):
+        self.written.append(data)
+
+
+class ProcessReactorStub:
+    """A reactor that does not start the processes, every call to
+    spawnProcess is recorded in C{spawned} as (protocol, executable, args,
+    transport)."""
+
+    def __init__(self):
+        self.spawned = []
+
+    def spawnProcess(self, protocol, executable, args, env):
+        transport = ProcessTransportStub(42 + len(self.spawned))
+        self.spawned.append((protocol, executable, args, transport))
+        return transport
 
 
 def hook():
@@ -0,0 +1,119 @@
+import os
+
+from twisted.trial import unittest
+
+from virtualbricks import affinity
+from virtualbricks.tests import stubs
+
+
+class TestCpuList(unittest.TestCase):
+
+    def test_parse(self):
+        self.assertEqual(affinity.parse_cpus("0-3,8, 10-11,2"),
+                         [0, 1, 2, 3, 8, 10, 11])
+        self.assertEqual(affinity.parse_cpus("5"), [5])
+
+    def test_parse_invalid(self):
+        for spec in "", "a", "3-1", "1,,2", "-1", "4096":
+            self.assertRaises(ValueError, affinity.parse_cpus, spec)
+
+    def test_format(self):
+        self.assertEqual(affinity.format_cpus([11, 0, 1, 2, 3, 8, 10]),
+                         "0-3,8,10-11")
+        self.assertEqual(affinity.format_cpus([]), "")
+
+
+class TestAffinity(unittest.TestCase):
+
+    def test_roundtrip(self):
+        cpus = affinity.sched_getaffinity(0)
+        self.assertNotEqual(cpus, [])
+        affinity.sched_setaffinity(0, cpus)
+        self.assertEqual(affinity.sched_getaffinity(0), cpus)
+
+    def test_invalid_pid(self):
+        self.assertRaises(OSError, affinity.sched_getaffinity, -1)
+
+    def test_pinned(self):
+        """The affinity is changed only inside the block."""
+
+        calls = []
+        self.patch(affinity, "sched_getaffinity", lambda pid: [0, 1, 2, 3])
+        self.patch(affinity, "sched_setaffinity",
+                   lambda pid, cpus: calls.append((pid, cpus)))
+        with affinity.pinned([2]):
+            self.assertEqual(calls, [(0, [2])])
+        self.assertEqual(calls, [(0, [2]), (0, [0, 1, 2, 3])])
+        with affinity.pinned(None):
+            pass
+        self.assertEqual(len(calls), 2)
+
+
+class TestNuma(unittest.TestCase):
+
+    def setUp(self):
+        self.root = self.mktemp()
+        os.mkdir(self.root)
+
+    def add_node(self, name, cpulist):
+        os.mkdir(os.path.join(self.root, name))
+        with open(os.path.join(self.root, name, "cpulist"), "w") as fp:
+            fp.write(cpulist + "\n")
+
+    def test_nodes(self):
+        self.add_node("node0", "0-3")
+        self.add_node("node10", "8-11")
+        self.add_node("node2", "4-7")
+        self.add_node("node3", "")
+        os.mkdir(os.path.join(self.root, "power"))
+        nodes = affinity.numa_nodes(self.root, range(10))
+        self.assertEqual(nodes.items(), [(0, [0, 1, 2, 3]),
+                                         (2, [4, 5, 6, 7]),
+                                         (10, [8, 9])])
+
+    def test_no_topology(self):
+        nodes = affinity.numa_nodes(os.path.join(self.root, "missing"),
+                                    [1, 0])
+        self.assertEqual(nodes.items(), [(0, [0, 1])])
+
+
+class TestPlacer(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = stubs.FactoryStub()
+        self.placer = affinity.Placer(self.factory)
+        self.placer._nodes = {0: [0, 1], 1: [2, 3]}
+
+    def vm(self, name, smp=1):
+        vm = self.factory.new_brick("vm", name)
+        vm.set({"smp": smp})
+        return vm
+
+    def test_spread(self):
+        """The unconnected bricks go on the least loaded node."""
+
+        self.assertEqual(self.placer.place(self.vm("vm1", 2)), [0, 1])
+        self.assertEqual(self.placer.place(self.vm("vm2")), [2, 3])
+        self.assertEqual(self.placer.place(self.vm("vm3")), [2, 3])
+        self.assertEqual(self.placer.load(), {0: 2, 1: 2})
+
+    def test_colocate(self):
+        """A virtual machine goes on the node of its switch."""
+
+        self.placer.place(self.vm("vm1", 4))
+        switch = self.factory.new_brick("switch", "sw")
+        self.assertEqual(self.placer.place(switch), [2, 3])
+        vm2 = self.vm("vm2", 8)
+        vm2.connect(switch.socks[0])
+        vm3 = self.vm("vm3")
+        vm3.connect(switch.socks[0])
+        self.assertEqual(self.placer.place(vm2), [2, 3])
+        self.assertEqual(self.placer.place(vm3), [2, 3])
+
+    def test_release(self):
+        vm1 = self.vm("vm1")
+        self.placer.place(vm1)
+        self.assertEqual(self.placer.placements, {vm1: 0})
+        self.placer.release(vm1)
+        self.placer.release(vm1)
+        self.assertEqual(self.placer.placements, {})
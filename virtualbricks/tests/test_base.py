@@ -105,6 +105,31 @@ class TestConfig(unittest.TestCase):
         self.assertIsNot(cfg, self.config2)
         self.assertIs(cfg["obj"], self.config2["obj"])
 
+    def test_parameters_per_class(self):
+        """The parameters are computed once for each class and the defaults
+        are not stored in the instances."""
+
+        self.assertIs(self.config2.parameters, Config2().parameters)
+        self.assertEqual(Config2._names, ("bool", "float", "int", "obj",
+                                          "spinint", "str"))
+        self.assertEqual(self.config2._values, {})
+        self.assertNotIn("spinint", Config1.parameters)
+
+    def test_equality(self):
+        other = Config2()
+        self.assertEqual(self.config2, other)
+        other["str"] = "b"
+        self.assertNotEqual(self.config2, other)
+        other["str"] = "a"
+        self.assertEqual(self.config2, other)
+        self.assertNotEqual(self.config1, self.config2)
+
+    def test_iterchanged(self):
+        self.config2["str"] = "a"
+        self.config2["int"] = 43
+        self.assertEqual([(n, v) for n, _, v in self.config2.iterchanged()],
+                         [("int", 43)])
+
 
 class TestTypes(unittest.TestCase):
 
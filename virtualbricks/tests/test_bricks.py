@@ -4,9 +4,10 @@ import signal
 
 from twisted.trial import unittest
 from twisted.internet import error, defer
+from twisted.python import failure
 from twisted.test import proto_helpers
 
-from virtualbricks import errors, link, bricks
+from virtualbricks import errors, link, bricks, affinity, settings
 from virtualbricks.tests import stubs, successResultOf
 
 
@@ -43,6 +44,31 @@ class TestBricks(unittest.TestCase):
         self.assertEqual(self.brick.args(),
                          ["true", "-a", "arg1", "-c", "-d", "d"])
 
+    def test_cmd_line_cached(self):
+        """The command line is built once until the configuration or the
+        links of the brick change."""
+
+        calls = []
+        build = self.brick._build_cmd_line
+        self.brick._build_cmd_line = lambda: calls.append(None) or build()
+        self.assertIs(self.brick.cached_args(), None)
+        args = self.brick.args()
+        self.assertEqual(self.brick.args(), args)
+        self.assertEqual(self.brick.cached_args(), args)
+        self.assertEqual(len(calls), 1)
+        self.brick.set({"a": "arg2"})
+        self.assertEqual(self.brick.build_cmd_line(),
+                         ["-a", "arg2", "-c", "-d", "d"])
+        self.assertEqual(len(calls), 2)
+        self.brick.set({"a": "arg2"})
+        self.brick.build_cmd_line()
+        self.assertEqual(len(calls), 2)
+        plug = link.Plug(self.brick)
+        self.brick.plugs.append(plug)
+        self.brick.connect(link.Sock(None, "sock"))
+        self.brick.build_cmd_line()
+        self.assertEqual(len(calls), 3)
+
     def test_poweron_badconfig(self):
         self.brick.proc = object()
         result = []
@@ -85,6 +111,70 @@ class TestBricks(unittest.TestCase):
         self.brick.poweron().addErrback(result.append)
         result[0].trap(IOError)
 
+    def test_poweron_affinity(self):
+        """The process is spawned while virtualbricks runs on the CPUs of the
+        brick, the child inherits them."""
+
+        pinned = []
+        self.patch(affinity, "sched_getaffinity", lambda pid: [0, 1, 2, 3])
+        self.patch(affinity, "sched_setaffinity",
+                   lambda pid, cpus: pinned.append(cpus))
+
+        def spawnProcess(*a, **kw):
+            self.assertEqual(pinned, [[1, 3]])
+
+        from twisted.internet import reactor
+        self.patch(reactor, "spawnProcess", spawnProcess)
+        self.brick.configured = lambda: True
+        self.brick.set({"affinity": "1,3"})
+        self.brick.poweron()
+        self.assertEqual(pinned, [[1, 3], [0, 1, 2, 3]])
+
+    def test_poweron_affinity_helper(self):
+        """The processes started by the privileged helper get the affinity
+        too."""
+
+        spawned = []
+
+        class HelperStub:
+
+            def spawn(self, proto, args, cpus=()):
+                spawned.append(cpus)
+                return defer.succeed(None)
+
+        self.addCleanup(settings.set, "helper", settings.get("helper"))
+        settings.set("helper", True)
+        self.factory.helper = HelperStub()
+        self.brick.needsudo = lambda: True
+        self.brick.configured = lambda: True
+        self.brick.set({"affinity": "1,3"})
+        self.brick.poweron()
+        self.assertEqual(spawned, [[1, 3]])
+
+    def test_poweron_invalid_affinity(self):
+        self.brick.configured = lambda: True
+        self.brick.set({"affinity": "1-"})
+        result = []
+        self.brick.poweron().addErrback(result.append)
+        result[0].trap(errors.BadConfigError)
+        self.assertIs(self.brick.proc, None)
+
+    def test_poweron_auto_affinity_error(self):
+        """The node chosen for a brick that did not start is released."""
+
+        def spawnProcess(*a, **kw):
+            raise IOError(errno.EAGAIN, os.strerror(errno.EAGAIN))
+
+        from twisted.internet import reactor
+        self.patch(reactor, "spawnProcess", spawnProcess)
+        self.factory.placer._nodes = {0: affinity.sched_getaffinity(0)}
+        self.brick.configured = lambda: True
+        self.brick.set({"affinity": "auto"})
+        result = []
+        self.brick.poweron().addErrback(result.append)
+        result[0].trap(IOError)
+        self.assertEqual(self.factory.placer.placements, {})
+
     def test_poweroff_not_running(self):
         """
         If the brick is not started, poweroff succeed and return the last
@@ -192,3 +282,52 @@ class TestVDEProcessProtocol(unittest.TestCase):
         self.assertEqual(len(self.proto.queue), 0)
         self.proto.data_received(self.PROMPT)
         self.assertTrue(self.transport.disconnecting)
+
+    def test_pipeline(self):
+        """Commands are sent without waiting for the ACKs, up to the size of
+        the pipeline."""
+
+        self.proto.pipeline_size = 2
+        self.proto.send_command(self.CMD1)
+        self.proto.send_command(self.CMD2)
+        self.proto.send_command("showinfo")
+        self.assertEqual(self.transport.value(),
+                         self.CMD1 + "\n" + self.CMD2 + "\n")
+        self.transport.clear()
+        self.proto.data_received(self.PROMPT)
+        self.assertEqual(self.transport.value(), "showinfo\n")
+
+    def test_response(self):
+        d1 = self.proto.send_command(self.CMD1)
+        d2 = self.proto.send_command("showinfo")
+        self.proto.data_received("1000 Success\n\n" + self.PROMPT +
+                                 "0000 DATA END WITH '.'\nVDE switch\n"
+                                 "numports=32\n.\n1000 Success\n\n")
+        self.assertEqual(successResultOf(self, d1), "")
+        self.assertNoResult(d2)
+        self.proto.data_received(self.PROMPT)
+        self.assertEqual(successResultOf(self, d2),
+                         "VDE switch\nnumports=32")
+
+    def test_response_error(self):
+        d = self.proto.send_command("port/setnumports 0")
+        self.proto.data_received("1022 Invalid argument\n\n" + self.PROMPT)
+        failure = self.failureResultOf(d, errors.CommandError)
+        self.assertEqual(failure.value.code, 22)
+        self.assertEqual(failure.value.command, "port/setnumports 0")
+
+    def test_send_batch(self):
+        d = self.proto.send_batch([self.CMD1, self.CMD2])
+        self.assertEqual(self.transport.value(),
+                         self.CMD1 + "\n" + self.CMD2 + "\n")
+        self.proto.data_received("1000 Success\n" + self.PROMPT + "text\n" +
+                                 self.PROMPT)
+        self.assertEqual(successResultOf(self, d), ["", "text"])
+
+    def test_process_ended(self):
+        """Commands not acknowledged fail when the process ends."""
+
+        d = self.proto.send_command(self.CMD1)
+        self.proto.processEnded(failure.Failure(error.ProcessDone(0)))
+        self.failureResultOf(d, error.ProcessDone)
+        self.assertEqual(len(self.proto.queue), 0)
@@ -3,7 +3,7 @@ import textwrap
 
 from zope.interface import implementer
 from twisted.python import components
-from twisted.internet import interfaces
+from twisted.internet import defer, interfaces
 
 from virtualbricks import console
 from virtualbricks.tests import unittest, stubs
@@ -71,6 +71,49 @@ class TestProtocol(unittest.TestCase):
         self.assertEquals(self.factory.events[0].name, "test_event")
         self.assertEquals(self.factory.events[0].get_type(), "Event")
 
+    def test_cmdlines(self):
+        self.parse("new stub test")
+        self.discard_output()
+        self.parse("cmdlines")
+        self.assertIn("> test\tnot cached\n", self.stdout.getvalue())
+        self.discard_output()
+        args = self.factory.bricks[0].args()
+        self.parse("cmdlines")
+        self.assertIn("> test\t%s\n" % " ".join(args),
+                      self.stdout.getvalue())
+
+    def test_stopall(self):
+        """The grace period and the time before the kill are optional."""
+
+        calls = []
+
+        def poweroff_all(*args):
+            calls.append(args)
+            return defer.Deferred()
+
+        self.factory.poweroff_all = poweroff_all
+        self.parse("stopall")
+        self.parse("stopall 10")
+        self.parse("stopall 10 2.5")
+        self.assertEqual(calls, [(), (10.0,), (10.0, 2.5)])
+
+    def test_invalid_numbers(self):
+        """A command with an argument that is not a valid number replies
+        with its usage and does nothing."""
+
+        self.factory.poweroff_all = self.factory.poweron_all = None
+        self.factory.checkpoint_all = self.factory.restore_all = None
+        for cmd, usage in [
+                ("startall x", "usage: startall [N]"),
+                ("startall 0", "usage: startall [N]"),
+                ("stopall 10 x", "usage: stopall [T [K]]"),
+                ("stopall -1", "usage: stopall [T [K]]"),
+                ("checkpoint tag x", "usage: checkpoint TAG [N]"),
+                ("restore tag 1.5", "usage: restore TAG [N]")]:
+            self.discard_output()
+            self.parse(cmd)
+            self.assertIn("> %s\n" % usage, self.stdout.getvalue())
+
     def test_quit_command(self):
         result = []
         self.factory.quit = lambda: result.append(True)
@@ -14,6 +14,7 @@ DEPLOYMENT_PATH = os.environ.get("VIRTUALBRICKS_DEPLOYMENT_PATH", None)
 if DEPLOYMENT_PATH is None:
     DEPLOYMENT_PATH = os.path.dirname(virtualbricks.__file__)
 GUI_DATA_PATH = os.path.join(DEPLOYMENT_PATH, "gui", "data")
+QEMU_DATA_PATH = os.path.join(DEPLOYMENT_PATH, "data")
 NORMALIZE_RE = re.compile("[^a-zA-Z0-9_]")
 
 
@@ -68,6 +69,12 @@ GUI_DATA_FILES = set([
     "wire.png",
 ])
 
+QEMU_DATA_FILES = set([
+    "qemu_specs_1_0.json",
+    "qemu_specs_1_1_2.json",
+    "qemu_specs_2_0_0.json",
+])
+
 TEST_DATA_FILES = set([
     "qemu-img",
 ])
@@ -109,6 +116,18 @@ class TestDeploymentGuiDataFiles(unittest.TestCase):
         exec test_definition
 
 
+@skipUnless(should_test_deployment(), "deployment tests are not enabled")
+class TestDeploymentQemuDataFiles(unittest.TestCase):
+
+    # test qemu specifications
+    for datafile in QEMU_DATA_FILES:
+        test_definition = _data_test_template.format(
+            data_path=QEMU_DATA_PATH,
+            filename=datafile,
+            name=NORMALIZE_RE.sub("_", datafile))
+        exec test_definition
+
+
 @skipUnless(should_test_deployment(), "deployment tests are not enabled")
 class TestDeploymentTestDataFiles(unittest.TestCase):
 
@@ -141,6 +160,10 @@ def is_gui_data_file(dirpath, filename):
             os.path.join(dirpath[len(cp)+1:], filename) in GUI_DATA_FILES)
 
 
+def is_qemu_data_file(dirpath, filename):
+    return dirpath == QEMU_DATA_PATH and filename in QEMU_DATA_FILES
+
+
 def is_test_data_file(dirpath, filename):
     return dirpath.startswith(TEST_DATA_PATH) and filename in TEST_DATA_FILES
 
@@ -154,6 +177,7 @@ def file_should_be_test_and_it_is_not(dirpath, filename):
     if fnmatch.fnmatch(filename, ".*.sw?"):
         return False
     return (not (is_gui_data_file(dirpath, filename) or
+                 is_qemu_data_file(dirpath, filename) or
                  is_test_data_file(dirpath, filename)) and
             not is_py_file(filename))
 
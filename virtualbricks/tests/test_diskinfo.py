@@ -0,0 +1,198 @@
+import os
+import struct
+
+from twisted.trial import unittest
+
+from virtualbricks import diskinfo, tools
+
+
+def write_qcow2(path, size=1 << 30, backing_file="", cluster_bits=16,
+                allocated=(), zero=(), version=2, backing_format=None):
+    """Write a qcow2 image with the given guest clusters allocated.
+
+    The L1 table is in the second cluster, followed by the L2 tables and by
+    the data clusters.
+    """
+
+    cluster_size = 1 << cluster_bits
+    entries = cluster_size // 8
+    l1_size = -(-size // (entries * cluster_size))
+    tables = {}
+    for guest_cluster in list(allocated) + list(zero):
+        l1_index, _ = divmod(guest_cluster, entries)
+        tables.setdefault(l1_index, [0] * entries)
+    l2_offsets = dict((index, (2 + i) * cluster_size)
+                      for i, index in enumerate(sorted(tables)))
+    data_cluster = 2 + len(tables)
+    for guest_cluster in allocated:
+        l1_index, l2_index = divmod(guest_cluster, entries)
+        tables[l1_index][l2_index] = (1 << 63) | data_cluster * cluster_size
+        data_cluster += 1
+    for guest_cluster in zero:
+        l1_index, l2_index = divmod(guest_cluster, entries)
+        tables[l1_index][l2_index] = 1
+    header_length = 72 if version == 2 else 104
+    extensions = ""
+    if backing_format is not None:
+        extensions += struct.pack(">II", diskinfo.QCOW2_EXT_BACKING_FORMAT,
+                                  len(backing_format))
+        extensions += backing_format.ljust(-(-len(backing_format) // 8) * 8,
+                                           "\x00")
+    extensions += struct.pack(">II", 0, 0)
+    backing_offset = header_length + len(extensions) if backing_file else 0
+    header = diskinfo.QCOW2_HEADER.pack(
+        tools.QCOW_MAGIC, version, backing_offset, len(backing_file),
+        cluster_bits, size, 0, l1_size, cluster_size, 0, 0, 0, 0)
+    if version == 3:
+        header += diskinfo.QCOW2_V3_HEADER.pack(0, 0, 0, 4, header_length)
+    l1 = [0] * l1_size
+    for index, offset in l2_offsets.items():
+        l1[index] = (1 << 63) | offset
+    with open(path, "wb") as fp:
+        fp.write(header + extensions + backing_file)
+        fp.seek(cluster_size)
+        fp.write(struct.pack(">%dQ" % l1_size, *l1))
+        for index, offset in l2_offsets.items():
+            fp.seek(offset)
+            fp.write(struct.pack(">%dQ" % entries, *tables[index]))
+        fp.seek(data_cluster * cluster_size - 1)
+        fp.write("\x00")
+
+
+def write_qed(path, backing_file=""):
+    cluster_size = 4096
+    header = diskinfo.QED_HEADER.pack(
+        tools.QED_MAGIC, cluster_size, 1, 1, 0, 0, 0, cluster_size, 1 << 30,
+        diskinfo.QED_HEADER.size if backing_file else 0, len(backing_file))
+    l1 = [2 * cluster_size] + [0] * 511
+    l2 = [3 * cluster_size, 4 * cluster_size, 1] + [0] * 509
+    with open(path, "wb") as fp:
+        fp.write(header + backing_file)
+        fp.seek(cluster_size)
+        fp.write(struct.pack("<512Q", *l1))
+        fp.write(struct.pack("<512Q", *l2))
+        fp.seek(5 * cluster_size - 1)
+        fp.write("\x00")
+
+
+class TestRead(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.abspath(self.mktemp())
+
+    def test_qcow2(self):
+        write_qcow2(self.path, allocated=[0, 1, 8192 + 3], zero=[5],
+                    backing_file="base.img")
+        info = diskinfo.read(self.path)
+        self.assertEqual(info.format, tools.ImageFormat.QCOW2)
+        self.assertEqual(info.virtual_size, 1 << 30)
+        self.assertEqual(info.cluster_size, 1 << 16)
+        self.assertEqual(info.allocated, 3 << 16)
+        self.assertEqual(info.backing_file, "base.img")
+        self.assertEqual(info.backing_path(),
+                         os.path.join(os.path.dirname(self.path), "base.img"))
+
+    def test_qcow2_v3(self):
+        write_qcow2(self.path, allocated=[7], version=3,
+                    backing_file="/base.img", backing_format="raw")
+        info = diskinfo.read(self.path)
+        self.assertEqual(info.format, tools.ImageFormat.QCOW2)
+        self.assertEqual(info.allocated, 1 << 16)
+        self.assertEqual(info.backing_file, "/base.img")
+        self.assertEqual(info.backing_format, "raw")
+
+    def test_qcow2_no_backing_file(self):
+        write_qcow2(self.path)
+        info = diskinfo.read(self.path)
+        self.assertEqual((info.backing_file, info.allocated), ("", 0))
+        self.assertIs(info.backing_path(), None)
+
+    def test_qed(self):
+        write_qed(self.path, "base.img")
+        info = diskinfo.read(self.path)
+        self.assertEqual(info.format, tools.ImageFormat.QED)
+        self.assertEqual(info.virtual_size, 1 << 30)
+        self.assertEqual(info.allocated, 2 * 4096)
+        self.assertEqual(info.backing_file, "base.img")
+
+    def test_vmdk(self):
+        descriptor = 'parentCID=ffffffff\nparentFileNameHint="base.vmdk"\n'
+        header = diskinfo.VMDK_HEADER.pack(tools.VMDK_MAGIC, 1, 3, 2097152,
+                                           128, 1, 1, 512, 0, 0, 0)
+        with open(self.path, "wb") as fp:
+            fp.write(header.ljust(512, "\x00") + descriptor.ljust(512, "\x00"))
+        info = diskinfo.read(self.path)
+        self.assertEqual(info.format, tools.ImageFormat.VMDK)
+        self.assertEqual(info.virtual_size, 1 << 30)
+        self.assertEqual(info.cluster_size, 1 << 16)
+        self.assertEqual(info.backing_file, "base.vmdk")
+
+    def test_vdi(self):
+        header = diskinfo.VDI_HEADER.pack(
+            tools.VDI_SIGNATURE, 0x00010001, 400, 1, 0, "", 512, 1024, "", 0,
+            1 << 30, 1 << 20, 0, 1024, 10)
+        with open(self.path, "wb") as fp:
+            fp.write("<<< Oracle VM VirtualBox Disk Image >>>\n".ljust(64,
+                                                                     "\x00"))
+            fp.write(header)
+        info = diskinfo.read(self.path)
+        self.assertEqual(info.format, tools.ImageFormat.VDI)
+        self.assertEqual(info.virtual_size, 1 << 30)
+        self.assertEqual(info.allocated, 10 << 20)
+        self.assertIs(info.backing_file, None)
+
+    def test_raw(self):
+        with open(self.path, "wb") as fp:
+            fp.write("\x01" * 4096)
+        info = diskinfo.read(self.path)
+        self.assertEqual(info.format, tools.ImageFormat.RAW)
+        self.assertEqual(info.virtual_size, 4096)
+        self.assertIs(info.backing_file, None)
+
+    def test_corrupted(self):
+        with open(self.path, "wb") as fp:
+            fp.write(diskinfo.QCOW2_HEADER.pack(
+                tools.QCOW_MAGIC, 2, 1 << 20, 10, 16, 1 << 30, 0, 0, 0, 0, 0,
+                0, 0))
+        self.assertRaises(diskinfo.CorruptedImageError, diskinfo.read,
+                          self.path)
+
+    def test_missing(self):
+        self.assertRaises(IOError, diskinfo.read, self.path)
+
+
+class TestChain(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = os.path.abspath(self.mktemp())
+        os.mkdir(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def test_chain(self):
+        with open(self.path("base.img"), "wb") as fp:
+            fp.write("\x00" * 4096)
+        write_qcow2(self.path("middle.qcow2"), backing_file="base.img")
+        write_qcow2(self.path("top.qcow2"),
+                    backing_file=self.path("middle.qcow2"))
+        chain = diskinfo.backing_chain(self.path("top.qcow2"))
+        self.assertEqual([info.path for info in chain],
+                         [self.path("top.qcow2"), self.path("middle.qcow2"),
+                          self.path("base.img")])
+
+    def test_loop(self):
+        write_qcow2(self.path("a"), backing_file="b")
+        write_qcow2(self.path("b"), backing_file="a")
+        self.assertRaises(diskinfo.CorruptedImageError,
+                          diskinfo.backing_chain, self.path("a"))
+
+    def test_scan(self):
+        write_qcow2(self.path("a.qcow2"))
+        write_qed(self.path("b.qed"))
+        with open(self.path("broken.qcow2"), "wb") as fp:
+            fp.write("QFI\xfb\x00\x00\x00\x02")
+        os.mkdir(self.path("subdir"))
+        infos = diskinfo.scan(self.directory)
+        self.assertEqual(sorted(infos), [self.path("a.qcow2"),
+                                         self.path("b.qed")])
@@ -1,8 +1,11 @@
+import os
+
 from twisted.trial import unittest
 
 from virtualbricks.tools import is_running
 from virtualbricks.tests import stubs, successResultOf
-from virtualbricks.errors import BrickRunningError
+from virtualbricks.errors import (BrickRunningError, NameAlreadyInUseError,
+                                  ImageAlreadyInUseError)
 
 
 class TestFactory(unittest.TestCase):
@@ -62,3 +65,84 @@ class TestFactory(unittest.TestCase):
         self.assertRaises(BrickRunningError, factory.del_brick, brick)
         self.assertEqual(factory.bricks, [brick])
         self.assertTrue(is_running(brick))
+
+    def test_get_brick_by_name(self):
+        factory = stubs.Factory()
+        brick = factory.new_brick("stub", "test_brick")
+        self.assertIs(factory.get_brick_by_name("test_brick"), brick)
+        self.assertIs(factory.get_brick_by_name("other"), None)
+        factory.del_brick(brick)
+        self.assertIs(factory.get_brick_by_name("test_brick"), None)
+        self.assertFalse(factory.is_in_use("test_brick"))
+
+    def test_rename_brick(self):
+        """Renaming a brick updates the names and the socks in use."""
+
+        factory = stubs.Factory()
+        switch = factory.new_brick("switch", "sw")
+        sock = factory.get_sock_by_name("sw_port")
+        self.assertIs(sock, switch.socks[0])
+        switch.rename("sw1")
+        self.assertIs(factory.get_brick_by_name("sw1"), switch)
+        self.assertIs(factory.get_brick_by_name("sw"), None)
+        self.assertFalse(factory.is_in_use("sw"))
+        self.assertTrue(factory.is_in_use("sw1"))
+        self.assertIs(factory.get_sock_by_name("sw_port"), None)
+        self.assertIs(factory.get_sock_by_name("sw1_port"), sock)
+
+    def test_rename_brick_name_in_use(self):
+        factory = stubs.Factory()
+        brick = factory.new_brick("stub", "test_brick")
+        factory.new_event("test_event")
+        self.assertRaises(NameAlreadyInUseError, brick.rename, "test_event")
+        self.assertIs(factory.get_brick_by_name("test_brick"), brick)
+
+    def test_rename_event(self):
+        factory = stubs.Factory()
+        event = factory.new_event("test_event")
+        event.rename("test_event1")
+        self.assertIs(factory.get_event_by_name("test_event1"), event)
+        self.assertIs(factory.get_event_by_name("test_event"), None)
+
+    def test_vm_sock_by_name(self):
+        factory = stubs.Factory()
+        vm = factory.new_brick("vm", "vm")
+        sock = vm.add_sock()
+        self.assertIs(factory.get_sock_by_name("vm_sock_eth0"),
+                      sock.original)
+        factory.del_brick(vm)
+        self.assertIs(factory.get_sock_by_name("vm_sock_eth0"), None)
+
+    def test_connect_to(self):
+        factory = stubs.Factory()
+        factory.new_brick("switch", "sw")
+        wire = factory.new_brick("wire", "wire")
+        self.assertIs(factory.connect_to(wire, "nothing"), None)
+        factory.connect_to(wire, "sw_port")
+        self.assertEqual(wire.plugs[0].sock.nickname, "sw_port")
+
+    def test_reset_lookups(self):
+        factory = stubs.Factory()
+        factory.new_brick("switch", "sw")
+        factory.new_event("test_event")
+        factory.reset()
+        self.assertIs(factory.get_brick_by_name("sw"), None)
+        self.assertIs(factory.get_event_by_name("test_event"), None)
+        self.assertIs(factory.get_sock_by_name("sw_port"), None)
+        factory.new_brick("switch", "sw")
+
+    def test_disk_images(self):
+        factory = stubs.Factory()
+        path = os.path.abspath(self.mktemp())
+        image = factory.new_disk_image("image", path)
+        self.assertIs(factory.get_image_by_name("image"), image)
+        self.assertIs(factory.get_image_by_path(path), image)
+        self.assertRaises(ImageAlreadyInUseError, factory.new_disk_image,
+                          "image1", path)
+        factory.rename_disk_image(image, "image1")
+        self.assertIs(factory.get_image_by_name("image"), None)
+        self.assertIs(factory.get_image_by_name("image1"), image)
+        factory.remove_disk_image(image)
+        self.assertIs(factory.get_image_by_name("image1"), None)
+        self.assertIs(factory.get_image_by_path(path), None)
+        self.assertFalse(factory.is_in_use("image1"))
@@ -0,0 +1,157 @@
+from twisted.trial import unittest
+from twisted.internet import error, protocol
+from twisted.python import failure
+from twisted.test import iosim
+
+from virtualbricks import affinity, errors, helper
+from virtualbricks.tests import stubs
+
+
+class ProcessProtocolStub(protocol.ProcessProtocol):
+
+    reason = None
+
+    def __init__(self):
+        self.out = []
+
+    def outReceived(self, data):
+        self.out.append(data)
+
+    def processEnded(self, reason):
+        self.reason = reason
+
+
+class TestInterfaceCommands(unittest.TestCase):
+
+    def test_dhcp(self):
+        self.assertEqual(helper.interface_commands("tap0", "dhcp"),
+                         [["dhclient", "tap0"]])
+
+    def test_manual(self):
+        self.assertEqual(
+            helper.interface_commands("tap0", "manual", "10.0.0.1",
+                                      "255.255.255.0", "10.0.0.254"),
+            [["/sbin/ifconfig", "tap0", "10.0.0.1", "netmask",
+              "255.255.255.0"],
+             ["/sbin/route", "add", "default", "gw", "10.0.0.254", "dev",
+              "tap0"]])
+
+    def test_off(self):
+        self.assertEqual(helper.interface_commands("tap0", "off"), [])
+
+    def test_invalid(self):
+        """Arguments that could be taken as options are refused."""
+
+        self.assertRaises(ValueError, helper.interface_commands, "-tap0",
+                          "dhcp")
+        self.assertRaises(ValueError, helper.interface_commands, "tap0",
+                          "manual", "10.0.0.1 -x", "255.255.255.0")
+
+
+class TestHelper(unittest.TestCase):
+
+    def setUp(self):
+        self.reactor = stubs.ProcessReactorStub()
+        self.client, self.server, self.pump = iosim.connectedServerAndClient(
+            lambda: helper.HelperServer(self.reactor, {}),
+            helper.HelperClient)
+        self.server.find_program = self.find_program
+
+    def find_program(self, name):
+        if name not in helper.ALLOWED_PROGRAMS:
+            raise errors.NotAllowedError(name)
+        return "/usr/sbin/" + name
+
+    def spawn(self, proto):
+        d = self.client.spawn(proto, ["vde_plug2tap", "-s", "sock", "tap0"])
+        self.pump.flush()
+        return self.successResultOf(d)
+
+    def test_spawn(self):
+        proto = ProcessProtocolStub()
+        transport = self.spawn(proto)
+        self.assertIs(proto.transport, transport)
+        self.assertEqual(transport.pid, 42)
+        child, prog, args, _ = self.reactor.spawned[0]
+        self.assertEqual(prog, "/usr/sbin/vde_plug2tap")
+        self.assertEqual(args, [prog, "-s", "sock", "tap0"])
+        child.childDataReceived(1, "hello")
+        self.pump.flush()
+        self.assertEqual(proto.out, ["hello"])
+
+    def test_spawn_affinity(self):
+        """The helper runs on the CPUs of the process while it spawns it."""
+
+        pinned = []
+        self.patch(affinity, "sched_getaffinity", lambda pid: [0, 1, 2, 3])
+        self.patch(affinity, "sched_setaffinity",
+                   lambda pid, cpus: pinned.append(cpus))
+        spawnProcess = self.reactor.spawnProcess
+
+        def spawn_pinned(*args):
+            self.assertEqual(pinned, [[1, 3]])
+            return spawnProcess(*args)
+
+        self.reactor.spawnProcess = spawn_pinned
+        d = self.client.spawn(ProcessProtocolStub(),
+                              ["vde_plug2tap", "-s", "sock", "tap0"], [1, 3])
+        self.pump.flush()
+        self.successResultOf(d)
+        self.assertEqual(pinned, [[1, 3], [0, 1, 2, 3]])
+
+    def test_spawn_no_affinity(self):
+        self.patch(affinity, "sched_setaffinity",
+                   lambda pid, cpus: self.fail("affinity changed"))
+        self.spawn(ProcessProtocolStub())
+        self.assertEqual(len(self.reactor.spawned), 1)
+
+    def test_not_allowed(self):
+        # the errors of the commands must be handled before they arrive
+        failures = []
+        self.client.spawn(ProcessProtocolStub(),
+                          ["/bin/sh"]).addErrback(failures.append)
+        self.pump.flush()
+        failures[0].trap(errors.NotAllowedError)
+        self.assertEqual(self.reactor.spawned, [])
+
+    def test_signal_and_write(self):
+        transport = self.spawn(ProcessProtocolStub())
+        transport.signalProcess("TERM")
+        transport.write("data")
+        self.pump.flush()
+        server_transport = self.reactor.spawned[0][3]
+        self.assertEqual(server_transport.signals, ["TERM"])
+        self.assertEqual(server_transport.written, ["data"])
+
+    def test_process_ended(self):
+        proto = ProcessProtocolStub()
+        transport = self.spawn(proto)
+        child = self.reactor.spawned[0][0]
+        child.processEnded(failure.Failure(error.ProcessTerminated(1)))
+        self.pump.flush()
+        proto.reason.trap(error.ProcessTerminated)
+        self.assertEqual(proto.reason.value.exitCode, 1)
+        self.assertIs(transport.pid, None)
+        self.assertRaises(error.ProcessExitedAlready,
+                          transport.signalProcess, "TERM")
+
+    def test_process_done(self):
+        proto = ProcessProtocolStub()
+        self.spawn(proto)
+        child = self.reactor.spawned[0][0]
+        child.processEnded(failure.Failure(error.ProcessDone(0)))
+        self.pump.flush()
+        proto.reason.trap(error.ProcessDone)
+
+    def test_connection_lost(self):
+        """If the connection is lost the helper terminates its processes and
+        the processes are reported as terminated."""
+
+        proto = ProcessProtocolStub()
+        self.spawn(proto)
+        self.client.transport.loseConnection()
+        self.pump.flush()
+        self.assertEqual(self.reactor.spawned[0][3].signals, ["TERM"])
+        self.assertTrue(self.server.done.called)
+        proto.reason.trap(error.ProcessTerminated)
+        self.flushLoggedErrors()
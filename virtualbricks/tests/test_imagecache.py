@@ -0,0 +1,69 @@
+import os
+
+from twisted.trial import unittest
+
+from virtualbricks import imagecache, tools
+from virtualbricks.tests.test_diskinfo import write_qcow2
+
+
+class TestImageCache(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.abspath(self.mktemp())
+        write_qcow2(self.path, backing_file="/base.img")
+        self.cache = imagecache.ImageCache()
+        self.reads = []
+        read_info = imagecache.read_info
+
+        def count_reads(path):
+            self.reads.append(path)
+            return read_info(path)
+
+        self.patch(imagecache, "read_info", count_reads)
+
+    def test_read_info(self):
+        _, info = imagecache.read_info(self.path)
+        self.assertEqual((info.format, info.backing_file),
+                         (tools.ImageFormat.QCOW2, "/base.img"))
+
+    def test_cached(self):
+        """The header is read only once if the file does not change."""
+
+        def lookup_again(info):
+            self.assertEqual(self.cache.get(self.path), info)
+            return self.cache.lookup(self.path)
+
+        def check(info):
+            self.assertEqual(info.backing_file, "/base.img")
+            self.assertEqual(self.reads, [self.path])
+
+        d = self.cache.lookup(self.path)
+        d.addCallback(lookup_again)
+        return d.addCallback(check)
+
+    def test_changed(self):
+
+        def change(_):
+            write_qcow2(self.path, backing_file="/other/base.img")
+            os.utime(self.path, (0, 0))
+            return self.cache.lookup(self.path)
+
+        def check(info):
+            self.assertEqual(info.backing_file, "/other/base.img")
+            self.assertEqual(len(self.reads), 2)
+
+        return self.cache.lookup(self.path).addCallback(change).addCallback(
+            check)
+
+    def test_invalidate(self):
+        self.assertIs(self.cache.get(self.path), None)
+
+        def invalidate(_):
+            self.cache.invalidate(self.path)
+            self.assertIs(self.cache.get(self.path), None)
+
+        return self.cache.lookup(self.path).addCallback(invalidate)
+
+    def test_missing(self):
+        d = self.cache.lookup(self.path + ".missing")
+        return self.assertFailure(d, IOError)
@@ -0,0 +1,97 @@
+from twisted.trial import unittest
+from twisted.internet import defer, error
+from twisted.python import failure
+
+from virtualbricks import imagejobs, errors
+from virtualbricks.tests import stubs, successResultOf, failureResultOf
+
+
+def end(protocol, code=0):
+    if code == 0:
+        reason = error.ProcessDone(0)
+    else:
+        reason = error.ProcessTerminated(code)
+    protocol.processEnded(failure.Failure(reason))
+
+
+class TestJobQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.reactor = stubs.ProcessReactorStub()
+        self.queue = imagejobs.JobQueue(2, self.reactor, nice=False,
+                                         qemu_img="qemu-img")
+        self.changes = []
+        self.queue.changed.connect(self.changes.append)
+
+    def test_limit(self):
+        """At most limit jobs run at the same time, the next job starts when
+        one ends."""
+
+        jobs = [self.queue.commit("/a.cow"), self.queue.commit("/b.cow"),
+                self.queue.rebase("/c.cow", "/base.img")]
+        self.assertEqual([job.state for job in jobs],
+                         [imagejobs.RUNNING, imagejobs.RUNNING,
+                          imagejobs.QUEUED])
+        self.assertEqual([args[1:] for _, _, args, _ in self.reactor.spawned],
+                         [["commit", "-p", "/a.cow"],
+                          ["commit", "-p", "/b.cow"]])
+        end(self.reactor.spawned[1][0])
+        self.assertEqual(jobs[1].state, imagejobs.DONE)
+        self.assertEqual(jobs[1].progress, 100)
+        self.assertIs(successResultOf(self, jobs[1].wait()), jobs[1])
+        self.assertEqual(jobs[2].state, imagejobs.RUNNING)
+        self.assertEqual(self.reactor.spawned[2][2][1:],
+                         ["rebase", "-u", "-b", "/base.img", "/c.cow"])
+
+    def test_progress(self):
+        """The progress printed by qemu-img -p is parsed, also when a line
+        is split."""
+
+        job = self.queue.convert("/a.img", "/b.qcow2", "qcow2")
+        protocol = self.reactor.spawned[0][0]
+        protocol.outReceived("    (0.00/100%)\r    (12.5")
+        self.assertEqual(job.progress, 0)
+        protocol.outReceived("0/100%)\r    (25")
+        self.assertEqual(job.progress, 12.5)
+        protocol.outReceived(".01/100%)\r")
+        self.assertEqual(job.progress, 25.01)
+        self.assertEqual(self.changes.count(job), 4)
+
+    def test_failure(self):
+        job = self.queue.commit("/a.cow")
+        d = job.wait()
+        protocol = self.reactor.spawned[0][0]
+        protocol.errReceived("qemu-img: Could not open '/a.cow'\n")
+        end(protocol, 1)
+        err = failureResultOf(self, d, errors.ImageJobError).value
+        self.assertEqual(err.message, "qemu-img: Could not open '/a.cow'")
+        self.assertEqual(job.state, imagejobs.FAILED)
+        failureResultOf(self, job.wait(), errors.ImageJobError)
+
+    def test_cancel(self):
+        """A queued job is removed, a running one is terminated."""
+
+        running = self.queue.commit("/a.cow")
+        self.queue.commit("/b.cow")
+        queued = self.queue.commit("/c.cow")
+        d = queued.wait()
+        self.assertTrue(self.queue.cancel(queued))
+        failureResultOf(self, d, defer.CancelledError)
+        self.assertEqual(queued.state, imagejobs.CANCELLED)
+        self.assertTrue(self.queue.cancel(running))
+        protocol, _, _, transport = self.reactor.spawned[0]
+        self.assertEqual(transport.signals, ["TERM"])
+        end(protocol, 1)
+        self.assertEqual(running.state, imagejobs.CANCELLED)
+        self.assertFalse(self.queue.cancel(running))
+        self.assertEqual(len(self.reactor.spawned), 2)
+
+    def test_keep_finished(self):
+        self.patch(imagejobs, "KEEP_FINISHED", 1)
+        first = self.queue.create("/a.img", "raw", "1G")
+        end(self.reactor.spawned[0][0])
+        second = self.queue.create("/b.img", "raw", "1G")
+        end(self.reactor.spawned[1][0])
+        self.assertEqual(self.queue.jobs, [second])
+        self.assertIs(self.queue.get(second.id), second)
+        self.assertIs(self.queue.get(first.id), None)
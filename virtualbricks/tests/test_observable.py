@@ -0,0 +1,103 @@
+from twisted.trial import unittest
+from twisted.internet import task
+
+from virtualbricks import observable
+from virtualbricks.tests import stubs
+
+
+class Emitter:
+
+    def __init__(self, name):
+        self.name = name
+
+
+class TestObservable(unittest.TestCase):
+
+    def setUp(self):
+        self.observable = observable.Observable("changed", "removed")
+        self.observable.clock = self.clock = task.Clock()
+        self.calls = []
+        self.observable.add_observer("changed", self.append, ("changed", ),
+                                     {})
+        self.observable.add_observer("removed", self.append, ("removed", ),
+                                     {})
+
+    def append(self, emitter, name):
+        self.calls.append((name, emitter))
+
+    def test_notify(self):
+        emitter = Emitter("a")
+        self.observable.notify("changed", emitter)
+        self.assertEqual(self.calls, [("changed", emitter)])
+
+    def test_batching(self):
+        """In batching mode each emitter is notified once for each event, at
+        the end of the reactor turn and in the order of the first
+        notification."""
+
+        a, b = Emitter("a"), Emitter("b")
+        self.observable.set_batching(True)
+        self.observable.notify("changed", a)
+        self.observable.notify("changed", b)
+        self.observable.notify("changed", a)
+        self.observable.notify("removed", a)
+        self.assertEqual(self.calls, [])
+        self.clock.advance(0)
+        self.assertEqual(self.calls, [("changed", a), ("changed", b),
+                                      ("removed", a)])
+        self.observable.notify("changed", a)
+        self.clock.advance(0)
+        self.assertEqual(self.calls[-1], ("changed", a))
+        self.assertEqual(len(self.calls), 4)
+
+    def test_leave_batching_flushes(self):
+        a = Emitter("a")
+        self.observable.set_batching(True)
+        self.observable.set_batching(True)
+        self.observable.notify("changed", a)
+        self.observable.set_batching(False)
+        self.assertEqual(self.calls, [])
+        self.observable.set_batching(False)
+        self.assertEqual(self.calls, [("changed", a)])
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_immediate(self):
+        """Immediate observers are notified of every event, even in batching
+        mode."""
+
+        immediate = []
+        a = Emitter("a")
+        self.observable.add_observer("changed", immediate.append, (), {},
+                                     immediate=True)
+        with observable.batch(self.observable):
+            self.observable.notify("changed", a)
+            self.observable.notify("changed", a)
+            self.assertEqual(immediate, [a, a])
+        self.assertEqual(self.calls, [("changed", a)])
+        self.observable.remove_observer("changed", immediate.append, (), {})
+        self.observable.notify("changed", a)
+        self.assertEqual(immediate, [a, a])
+
+    def test_thawed(self):
+        self.observable.set_batching(True)
+        with observable.thaw(self.observable):
+            self.observable.notify("changed", Emitter("a"))
+        self.observable.set_batching(False)
+        self.assertEqual(self.calls, [])
+
+
+class TestFactoryBatching(unittest.TestCase):
+
+    def test_restore(self):
+        """While a project is restored a brick is notified only once."""
+
+        factory = stubs.Factory()
+        changed = []
+        factory.connect("brick-changed", changed.append)
+        brick = factory.new_brick("stub", "brick")
+        factory.set_restore(True)
+        brick.notify_changed()
+        brick.notify_changed()
+        self.assertEqual(changed, [])
+        factory.set_restore(False)
+        self.assertEqual(changed, [brick])
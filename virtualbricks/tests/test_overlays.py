@@ -0,0 +1,227 @@
+import os
+import errno
+
+from twisted.trial import unittest
+from twisted.internet import defer
+
+from virtualbricks import overlays
+from virtualbricks.tests import (TEST_DATA_PATH, successResultOf,
+                                 failureResultOf)
+
+
+class TestFsync(unittest.TestCase):
+
+    def test_fsync_paths(self):
+        """The files are flushed, then their directories once each."""
+
+        flushed = []
+        self.patch(overlays, "_fsync", flushed.append)
+        overlays.fsync_paths(["/a/1.cow", "/b/2.cow", "/a/3.cow"])
+        self.assertEqual(flushed, ["/a/1.cow", "/b/2.cow", "/a/3.cow",
+                                   "/a", "/b"])
+
+    def test_real_files(self):
+        path = os.path.abspath(self.mktemp())
+        open(path, "w").close()
+        overlays.fsync_paths([path])
+
+
+class TestOverlayCreator(unittest.TestCase):
+
+    def setUp(self):
+        self.flushes = []
+        self.creations = []
+        self.creator = overlays.OverlayCreator(2, self.flush)
+        self.creator._run = self.run_qemu_img
+
+    def flush(self, paths):
+        d = defer.Deferred()
+        self.flushes.append((paths, d))
+        return d
+
+    def run_qemu_img(self, qemu_img, base, cowname, fmt):
+        d = defer.Deferred()
+        self.creations.append((cowname, d))
+        return d
+
+    def create(self, name):
+        return self.creator.create("qemu-img", "base", name, "qcow2")
+
+    def test_limit(self):
+        for name in "a", "b", "c":
+            self.create(name)
+        self.assertEqual([name for name, _ in self.creations], ["a", "b"])
+        self.creations[0][1].callback("a")
+        self.assertEqual(len(self.creations), 3)
+
+    def test_coalesce(self):
+        """The overlays created while a flush is running are flushed
+        together."""
+
+        results = [self.create(name) for name in "a", "b", "c"]
+        for name, d in self.creations[:2]:
+            d.callback(name)
+        self.creations[2][1].callback("c")
+        self.assertEqual([paths for paths, _ in self.flushes], [["a"]])
+        self.flushes[0][1].callback(None)
+        self.assertEqual(successResultOf(self, results[0]), "a")
+        self.assertEqual([paths for paths, _ in self.flushes],
+                         [["a"], ["b", "c"]])
+        self.assertNoResult(results[1])
+        self.flushes[1][1].callback(None)
+        self.assertEqual(successResultOf(self, results[2]), "c")
+        self.assertEqual(self.creator.flushes, 2)
+
+    def test_flush_failed(self):
+        d = self.create("a")
+        self.creations[0][1].callback("a")
+        self.flushes[0][1].errback(OSError(5, "I/O error"))
+        failureResultOf(self, d, OSError)
+        # the next creation is flushed again
+        self.create("b")
+        self.creations[1][1].callback("b")
+        self.assertEqual(self.flushes[1][0], ["b"])
+
+
+class TestCreate(unittest.TestCase):
+
+    def test_create_failed(self):
+        """If qemu-img fails, the overlay is not flushed."""
+
+        flushed = []
+        creator = overlays.OverlayCreator(flush=flushed.append)
+        qemu_img = os.path.join(TEST_DATA_PATH, "qemu-img")
+        d = creator.create(qemu_img, "base", "1", "qcow2")
+
+        def check(failure):
+            failure.trap(RuntimeError)
+            self.assertEqual(flushed, [])
+
+        return d.addCallbacks(self.fail, check)
+
+
+class ImageStub:
+
+    name = "base"
+    path = "/images/base.img"
+    warm_pool = 2
+
+
+class TestWarmPool(unittest.TestCase):
+
+    def setUp(self):
+        self.home = os.path.abspath(self.mktemp())
+        os.mkdir(self.home)
+        self.flushed = []
+        self.creations = []
+        self.creator = overlays.OverlayCreator(2, self.flushed.append)
+        self.creator._run = self.run_qemu_img
+        self.pool = overlays.WarmPool(self.creator, 1 << 20,
+                                      self.flushed.append, lambda: self.home)
+        self.image = ImageStub()
+        self.patch(overlays, "abspath_qemu", lambda *a, **kw: "qemu-img")
+
+    def run_qemu_img(self, qemu_img, base, cowname, fmt):
+        with open(cowname, "w") as fp:
+            fp.write(base)
+        self.creations.append(cowname)
+        return defer.succeed(cowname)
+
+    def ready(self):
+        return sorted(os.listdir(self.pool.directory()))
+
+    def test_fill(self):
+        self.pool.fill(self.image, "qcow2")
+        self.assertEqual(len(self.creations), 2)
+        self.assertEqual(self.pool.size(self.image, "qcow2"), 2)
+        self.assertTrue(all(name.endswith(".cow") for name in self.ready()))
+        self.pool.fill(self.image, "qcow2")
+        self.assertEqual(len(self.creations), 2)
+
+    def test_take(self):
+        """An overlay is renamed in place, the pool is refilled."""
+
+        self.pool.fill(self.image, "qcow2")
+        cowname = os.path.join(self.home, "vm_hda.cow")
+        d = self.pool.take(self.image, cowname, "qcow2")
+        self.assertEqual(successResultOf(self, d), cowname)
+        with open(cowname) as fp:
+            self.assertEqual(fp.read(), self.image.path)
+        self.assertEqual(self.flushed[-1], [cowname])
+        self.assertEqual(len(self.creations), 3)
+        self.assertEqual(self.pool.size(self.image, "qcow2"), 2)
+
+    def test_take_other_directory(self):
+        """The overlays are always taken from the pool in the home, also if
+        the overlay goes in another directory."""
+
+        self.pool.fill(self.image, "qcow2")
+        other = os.path.abspath(self.mktemp())
+        os.mkdir(other)
+        cowname = os.path.join(other, "vm_hda.cow")
+        d = self.pool.take(self.image, cowname, "qcow2")
+        self.assertEqual(successResultOf(self, d), cowname)
+        self.assertEqual(len(self.creations), 3)
+        self.assertEqual(len(self.ready()), 2)
+        self.assertFalse(os.path.exists(os.path.join(
+            other, overlays.POOL_DIRECTORY)))
+
+    def test_take_other_device(self):
+        """If the overlay cannot be renamed across filesystems it stays in
+        the pool."""
+
+        def rename(src, dst):
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+        self.pool.fill(self.image, "qcow2")
+        usage = self.pool.usage
+        self.patch(os, "rename", rename)
+        cowname = os.path.join(self.home, "vm_hda.cow")
+        self.assertIs(self.pool.take(self.image, cowname, "qcow2"), None)
+        self.assertEqual(self.pool.size(self.image, "qcow2"), 2)
+        self.assertEqual(self.pool.usage, usage)
+        self.assertEqual(len(self.creations), 2)
+
+    def test_take_empty(self):
+        self.image.warm_pool = 0
+        cowname = os.path.join(self.home, "vm_hda.cow")
+        self.assertIs(self.pool.take(self.image, cowname, "qcow2"), None)
+        self.assertEqual(self.creations, [])
+
+    def test_other_format(self):
+        self.pool.fill(self.image, "qcow2")
+        cowname = os.path.join(self.home, "vm_hda.cow")
+        self.assertIs(self.pool.take(self.image, cowname, "qed"), None)
+        self.assertFalse(os.path.exists(cowname))
+
+    def test_budget(self):
+        """No overlay is created once the budget is used."""
+
+        self.pool.budget = 1
+        self.image.warm_pool = 5
+        self.pool.fill(self.image, "qcow2")
+        self.assertEqual(len(self.creations), 1)
+        self.assertEqual(self.pool.usage, os.stat(self.creations[0][:-4] +
+                                                  ".cow").st_blocks * 512)
+
+    def test_adopt(self):
+        """The overlays of a previous session are used, the partial ones
+        removed."""
+
+        self.pool.fill(self.image, "qcow2")
+        names = self.ready()
+        partial = os.path.join(self.pool.directory(),
+                               names[0].replace(".cow", "x.tmp"))
+        open(partial, "w").close()
+        self.pool.clear()
+        self.assertEqual(self.pool.size(self.image, "qcow2"), 2)
+        self.assertEqual(self.ready(), names)
+        self.assertEqual(len(self.creations), 2)
+
+    def test_resize_and_discard(self):
+        self.pool.fill(self.image, "qcow2")
+        self.pool.resize(self.image, 1)
+        self.assertEqual(len(self.ready()), 1)
+        self.pool.discard(self.image)
+        self.assertEqual(self.ready(), [])
+        self.assertEqual(self.pool.usage, 0)
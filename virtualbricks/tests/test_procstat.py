@@ -0,0 +1,132 @@
+import os
+
+from twisted.trial import unittest
+from twisted.internet import task
+
+from virtualbricks import procstat
+
+
+STAT = ("{pid} (qemu (x) 1) S 1 {pid} {pid} 0 -1 4202752 100 0 0 0 "
+        "{utime} {stime} 0 0 20 0 1 0 100 1000 50\n")
+IO = ("rchar: 4096\nwchar: 4096\nsyscr: 1\nsyscw: 1\n"
+      "read_bytes: {read}\nwrite_bytes: {write}\n"
+      "cancelled_write_bytes: 0\n")
+
+
+class BrickStub:
+
+    proc = object()
+    usage = None
+
+    def __init__(self, pid):
+        self.pid = pid
+
+
+class FactoryStub:
+
+    def __init__(self):
+        self.bricks = []
+
+
+class FakeProc:
+
+    def __init__(self, root):
+        self.root = root
+
+    def set(self, pid, utime=0, stime=0, pages=10, read=None, write=None):
+        base = os.path.join(self.root, str(pid))
+        if not os.path.isdir(base):
+            os.makedirs(base)
+        with open(os.path.join(base, "stat"), "w") as fp:
+            fp.write(STAT.format(pid=pid, utime=utime, stime=stime))
+        with open(os.path.join(base, "statm"), "w") as fp:
+            fp.write("1000 {0} 5 1 0 20 0\n".format(pages))
+        if read is not None:
+            with open(os.path.join(base, "io"), "w") as fp:
+                fp.write(IO.format(read=read, write=write))
+
+
+class TestReadCounters(unittest.TestCase):
+
+    def setUp(self):
+        self.proc = FakeProc(self.mktemp())
+
+    def test_counters(self):
+        self.proc.set(42, procstat.CLOCK_TICKS, procstat.CLOCK_TICKS, 10,
+                      1024, 2048)
+        counters = procstat.read_counters(42, self.proc.root)
+        self.assertEqual(counters, (2.0, 10 * procstat.PAGE_SIZE, 1024, 2048))
+
+    def test_no_io(self):
+        """The I/O of the processes of other users is not known."""
+
+        self.proc.set(42)
+        counters = procstat.read_counters(42, self.proc.root)
+        self.assertEqual((counters.read_bytes, counters.write_bytes),
+                         (None, None))
+
+    def test_no_process(self):
+        os.makedirs(self.proc.root)
+        self.assertIs(procstat.read_counters(42, self.proc.root), None)
+
+
+class TestUsage(unittest.TestCase):
+
+    def test_first_sample(self):
+        """From the first sample only the resident set size is known."""
+
+        usage = procstat.usage(procstat.Counters(1.0, 4096, 0, 0))
+        self.assertEqual(usage, (None, 4096, None, None))
+        self.assertEqual(procstat.format_usage(usage), ("-", "4096 B", "-"))
+
+    def test_rates(self):
+        previous = procstat.Counters(1.0, 4096, 0, 0)
+        counters = procstat.Counters(2.0, 8192, 4096, 8192)
+        usage = procstat.usage(counters, previous, 2)
+        self.assertEqual(usage, (50.0, 8192, 2048, 4096))
+        self.assertEqual(procstat.format_usage(usage),
+                         ("50.0%", "8192 B", "2048 B/s 4096 B/s"))
+
+    def test_unknown(self):
+        self.assertEqual(procstat.format_usage(None), ("-", "-", "-"))
+
+
+class TestSampler(unittest.TestCase):
+
+    def setUp(self):
+        self.proc = FakeProc(self.mktemp())
+        self.clock = task.Clock()
+        self.factory = FactoryStub()
+        self.sampler = procstat.Sampler(self.factory, self.clock,
+                                        self.proc.root)
+
+    def test_sample(self):
+        brick = BrickStub(42)
+        self.factory.bricks.append(brick)
+        self.proc.set(42, 0, 0, 10, 0, 0)
+        sampled = []
+        self.sampler.sampled.connect(sampled.append)
+        self.sampler.start(2)
+        self.assertEqual(brick.usage.cpu, None)
+        self.assertEqual(sampled, [self.sampler])
+        self.proc.set(42, procstat.CLOCK_TICKS, 0, 20, 4096, 0)
+        self.clock.advance(2)
+        self.assertEqual(brick.usage, (50.0, 20 * procstat.PAGE_SIZE, 2048,
+                                       0))
+        self.assertEqual(len(sampled), 2)
+        self.sampler.stop()
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_not_running(self):
+        """Bricks without a running process and processes that are gone are
+        not sampled."""
+
+        stopped = BrickStub(-1)
+        stopped.proc = None
+        gone = BrickStub(43)
+        gone.usage = procstat.Usage(None, 0, None, None)
+        self.factory.bricks.extend([stopped, gone])
+        os.makedirs(self.proc.root)
+        self.sampler.sample()
+        self.assertIs(stopped.usage, None)
+        self.assertIs(gone.usage, None)
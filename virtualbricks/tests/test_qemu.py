@@ -0,0 +1,208 @@
+import os
+import stat
+import json
+
+from twisted.trial import unittest
+from twisted.internet import defer
+
+from virtualbricks import qemu, _qemu
+
+
+class TestSpecs(unittest.TestCase):
+
+    def setUp(self):
+        self.patch(_qemu, "_specs", {})
+
+    def test_load_once(self):
+        """A spec is read and parsed only the first time it is needed."""
+
+        loaded = []
+        load_data = _qemu.load_data
+        self.patch(_qemu, "load_data",
+                   lambda v: loaded.append(v) or load_data(v))
+        spec = _qemu.load_spec("2.0.0")
+        self.assertIs(_qemu.load_spec("2.0.0"), spec)
+        self.assertEqual(loaded, ["2.0.0"])
+
+    def test_lookup(self):
+        self.assertIn(("qemu-system-x86_64", "x86_64"),
+                      qemu.get_executables("1.0"))
+        self.assertIn(("cortex-a8", "cortex-a8"),
+                      qemu.get_cpus("qemu-system-arm", "1.1.2"))
+        self.assertIn(("isapc", "ISA-only PC"),
+                      qemu.get_machines("qemu-system-x86_64", "2.0.0"))
+
+    def test_not_found(self):
+        self.assertRaises(_qemu.SpecsNotFound, _qemu.load_spec, "0.1")
+
+    def test_supported_version(self):
+        version = _qemu.parse_qemu_version(
+            "QEMU emulator version 1.1.2 (qemu-kvm-1.1.2)")
+        self.assertEqual(_qemu.last_supported_version(version), "1.1.2")
+        self.assertEqual(_qemu.last_supported_version("1.5"), "1.1.2")
+
+
+X86_CPUS = """\
+x86           qemu64  QEMU Virtual CPU version 2.5+
+x86             kvm64  Common KVM processor
+
+Recognized CPUID flags:
+  fpu de pse tsc msr pae mce cx8 apic sep mtrr pge mca cmov
+"""
+
+ARM_CPUS = """\
+Available CPUs:
+  arm1026
+  cortex-a8
+"""
+
+MACHINES = """\
+Supported machines are:
+pc                   Standard PC (alias of pc-i440fx-2.5)
+none                 empty machine
+"""
+
+SCRIPT = """\
+#!/bin/sh
+echo "$@" >> {log}
+case "$1" in
+    -version) echo "QEMU emulator version 2.5.0";;
+    -cpu) echo "x86 qemu64  QEMU Virtual CPU";;
+    -machine) printf "Supported machines are:\\npc  Standard PC\\n";;
+esac
+"""
+
+
+class TestParse(unittest.TestCase):
+
+    def test_cpus(self):
+        self.assertEqual(qemu.parse_cpus(X86_CPUS),
+                         (("qemu64", "QEMU Virtual CPU version 2.5+"),
+                          ("kvm64", "Common KVM processor")))
+        self.assertEqual(qemu.parse_cpus(ARM_CPUS),
+                         (("arm1026", "arm1026"), ("cortex-a8", "cortex-a8")))
+        self.assertEqual(qemu.parse_cpus("PowerPC 601_v1   PVR 00010001\n"
+                                         "MIPS '4Kc'\n"),
+                         (("601_v1", "PVR 00010001"), ("4Kc", "4Kc")))
+
+    def test_machines(self):
+        self.assertEqual(qemu.parse_machines(MACHINES),
+                         (("pc", "Standard PC (alias of pc-i440fx-2.5)"),
+                          ("none", "empty machine")))
+
+
+class TestProbe(unittest.TestCase):
+
+    def setUp(self):
+        self.patch(qemu, "_capabilities", {})
+        self.patch(qemu, "_probed", False)
+        self.patch(qemu, "_version", None)
+        self.path = os.path.abspath(self.mktemp())
+        os.mkdir(self.path)
+        self.log = os.path.join(self.path, "log")
+        self.cache = os.path.join(self.path, "cache.json")
+        self.exe = os.path.join(self.path, "qemu-system-x86_64")
+        self.write_script()
+
+    def write_script(self, extra=""):
+        with open(self.exe, "w") as fp:
+            fp.write(SCRIPT.format(log=self.log) + extra)
+        os.chmod(self.exe, stat.S_IRWXU)
+
+    def probe(self):
+        return qemu.probe([self.path], self.cache)
+
+    def runs(self):
+        with open(self.log) as fp:
+            return len(fp.readlines())
+
+    def test_probe(self):
+
+        def check(capabilities):
+            caps = capabilities["qemu-system-x86_64"]
+            self.assertEqual(caps.version, "2.5.0")
+            self.assertTrue(qemu.is_probed())
+            self.assertEqual(qemu.get_executables(),
+                             (("qemu-system-x86_64", "x86_64"), ))
+            self.assertEqual(qemu.get_cpus("qemu-system-x86_64"),
+                             (("qemu64", "QEMU Virtual CPU"), ))
+            self.assertEqual(qemu.get_machines("qemu-system-x86_64"),
+                             (("pc", "Standard PC"), ))
+            # the static specs are used for the other binaries
+            self.assertEqual(qemu._get_version(), "2.0.0")
+            self.assertIn(("arm1026", "arm1026"),
+                          qemu.get_cpus("qemu-system-arm"))
+
+        return self.probe().addCallback(check)
+
+    def test_cached(self):
+        """A binary is run again only if it changes."""
+
+        def reprobe(_):
+            self.assertEqual(self.runs(), 3)
+            return self.probe()
+
+        def change(_):
+            self.assertEqual(self.runs(), 3)
+            self.write_script("# changed\n")
+            return self.probe()
+
+        def check(capabilities):
+            self.assertEqual(self.runs(), 6)
+            with open(self.cache) as fp:
+                self.assertEqual(json.load(fp).keys(), [self.exe])
+
+        d = self.probe()
+        d.addCallback(reprobe)
+        d.addCallback(change)
+        return d.addCallback(check)
+
+    def test_one_probe(self):
+        """Only one probe runs at a time."""
+
+        d1 = self.probe()
+        d2 = self.probe()
+        d = defer.gatherResults([d1, d2])
+        d.addCallback(lambda results: self.assertIs(results[0], results[1]))
+        return d.addCallback(lambda _: self.assertEqual(self.runs(), 3))
+
+    def test_broken_binary(self):
+        """A binary that cannot be probed is skipped."""
+
+        with open(self.exe, "w") as fp:
+            fp.write("#!/bin/sh\nexit 1\n")
+
+        def check(capabilities):
+            self.assertEqual(capabilities, {})
+            self.assertFalse(qemu.is_probed())
+            self.assertEqual(len(self.flushLoggedErrors(RuntimeError)), 1)
+
+        return self.probe().addCallback(check)
+
+
+class TestNetdev(unittest.TestCase):
+
+    def setUp(self):
+        self.patch(qemu, "_capabilities", {})
+        self.patch(qemu, "_version", None)
+
+    def test_probed_version(self):
+        qemu._capabilities["qemu-system-i386"] = qemu.Capabilities(
+            "/usr/bin/qemu-system-i386", (0, 0), "0.11.1", (), ())
+        self.assertEqual(qemu.get_version("qemu-system-i386"), (0, 11, 1))
+        self.assertFalse(qemu.supports_netdev("qemu-system-i386"))
+
+    def test_static_version(self):
+        qemu.install("1.0")
+        self.assertEqual(qemu.get_version("qemu-system-x86_64"), (1, 0))
+        self.assertTrue(qemu.supports_netdev("qemu-system-x86_64"))
+
+    def test_unknown_version(self):
+        self.assertIs(qemu.get_version("qemu-system-x86_64"), None)
+        self.assertTrue(qemu.supports_netdev("qemu-system-x86_64"))
+
+    def test_io_uring(self):
+        qemu.install("4.2.1")
+        self.assertFalse(qemu.supports_io_uring("qemu-system-x86_64"))
+        qemu.install("5.0.0")
+        self.assertTrue(qemu.supports_io_uring("qemu-system-x86_64"))
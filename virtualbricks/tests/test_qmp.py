@@ -0,0 +1,144 @@
+import json
+
+from twisted.trial import unittest
+from twisted.internet import error, protocol, reactor
+from twisted.test import proto_helpers
+
+from virtualbricks import qmp, errors
+from virtualbricks.tests import successResultOf, failureResultOf
+
+
+GREETING = {"QMP": {"version": {"qemu": {"major": 2, "minor": 1,
+                                          "micro": 0}},
+                    "capabilities": []}}
+
+
+class TestProtocol(unittest.TestCase):
+
+    def setUp(self):
+        self.transport = proto_helpers.StringTransport()
+        self.protocol = qmp.QMPProtocol()
+        self.protocol.makeConnection(self.transport)
+
+    def receive(self, message):
+        self.protocol.dataReceived(json.dumps(message) + "\r\n")
+
+    def sent(self):
+        requests = [json.loads(line) for line in
+                    self.transport.value().splitlines()]
+        self.transport.clear()
+        return requests
+
+    def negotiate(self):
+        self.receive(GREETING)
+        self.assertEqual(self.sent(), [{"execute": "qmp_capabilities",
+                                        "id": 1}])
+        self.receive({"return": {}, "id": 1})
+
+    def test_negotiate(self):
+        self.negotiate()
+        self.assertIs(successResultOf(self, self.protocol.ready),
+                      self.protocol)
+        self.assertEqual(self.protocol.greeting, GREETING["QMP"])
+
+    def test_pipeline(self):
+        """The responses are matched to the requests by their id."""
+
+        self.negotiate()
+        d1 = self.protocol.query_status()
+        d2 = self.protocol.device_add("e1000", id="net0", netdev="vde0")
+        self.assertEqual(self.sent(), [
+            {"execute": "query-status", "id": 2},
+            {"execute": "device_add", "id": 3,
+             "arguments": {"driver": "e1000", "id": "net0",
+                           "netdev": "vde0"}}])
+        self.receive({"return": {}, "id": 3})
+        self.assertNoResult(d1)
+        self.receive({"return": {"running": True, "status": "running"},
+                      "id": 2})
+        self.assertEqual(successResultOf(self, d1),
+                         {"running": True, "status": "running"})
+        self.assertEqual(successResultOf(self, d2), {})
+
+    def test_error(self):
+        self.negotiate()
+        d = self.protocol.cont()
+        self.receive({"error": {"class": "DeviceNotActive",
+                                "desc": "No such device"}, "id": 2})
+        exc = failureResultOf(self, d, errors.QMPError).value
+        self.assertEqual((exc.error_class, exc.description),
+                         ("DeviceNotActive", "No such device"))
+
+    def test_events(self):
+        events = []
+        self.protocol.subscribe("STOP", lambda e, data: events.append(e))
+        self.negotiate()
+        self.receive({"event": "STOP", "data": {},
+                      "timestamp": {"seconds": 1, "microseconds": 2}})
+        self.receive({"event": "RESUME",
+                      "timestamp": {"seconds": 1, "microseconds": 2}})
+        self.assertEqual(events, ["STOP"])
+
+    def test_block_set_io_throttle(self):
+        """The limits that are not given are removed."""
+
+        self.negotiate()
+        self.protocol.block_set_io_throttle(id="virtio-disk0", bps_wr=1024)
+        self.assertEqual(self.sent(), [
+            {"execute": "block_set_io_throttle", "id": 2,
+             "arguments": {"id": "virtio-disk0", "iops": 0, "iops_rd": 0,
+                           "iops_wr": 0, "bps": 0, "bps_rd": 0,
+                           "bps_wr": 1024}}])
+
+    def test_savevm_error(self):
+        """The errors of the human monitor commands are in their output."""
+
+        self.negotiate()
+        d = self.protocol.loadvm("virtualbricks")
+        self.assertEqual(self.sent(), [
+            {"execute": "human-monitor-command", "id": 2,
+             "arguments": {"command-line": "loadvm virtualbricks"}}])
+        self.receive({"return": "Snapshot 'virtualbricks' does not exist\r\n",
+                      "id": 2})
+        failureResultOf(self, d, errors.QMPError)
+        d = self.protocol.savevm("virtualbricks")
+        self.receive({"return": "", "id": 3})
+        self.assertIs(successResultOf(self, d), None)
+
+    def test_connection_lost(self):
+        self.negotiate()
+        d = self.protocol.stop()
+        self.protocol.connectionLost(error.ConnectionDone())
+        failureResultOf(self, d, error.ConnectionDone)
+        self.assertIs(successResultOf(self, self.protocol.lost), None)
+
+
+class FakeQEMU(protocol.Protocol):
+
+    def connectionMade(self):
+        self.transport.write(json.dumps(GREETING) + "\r\n")
+
+    def dataReceived(self, data):
+        for line in data.splitlines():
+            request = json.loads(line)
+            self.transport.write(json.dumps({"return": {},
+                                             "id": request["id"]}) + "\r\n")
+
+
+class TestConnect(unittest.TestCase):
+
+    def test_connect(self):
+        path = self.mktemp()
+        port = reactor.listenUNIX(path, protocol.Factory.forProtocol(FakeQEMU))
+        self.addCleanup(port.stopListening)
+
+        def connected(client):
+            self.addCleanup(client.transport.loseConnection)
+            self.assertIsInstance(client, qmp.QMPProtocol)
+            return client.stop()
+
+        return qmp.connect(path).addCallback(connected)
+
+    def test_timeout(self):
+        d = qmp.connect(self.mktemp(), timeout=0)
+        return self.assertFailure(d, error.ConnectError)
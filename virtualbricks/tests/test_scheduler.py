@@ -0,0 +1,361 @@
+from twisted.trial import unittest
+from twisted.internet import defer, task
+
+from virtualbricks import errors, link, scheduler
+from virtualbricks.tests import stubs, successResultOf
+
+
+class BrickStub:
+
+    def __init__(self, name, started):
+        self.name = name
+        self.plugs = []
+        self.socks = [link.Sock(self, name + "_port")]
+        self.started = started
+        self.deferred = None
+        self.running = False
+        self.signals = []
+
+    def plug_to(self, *bricks):
+        for brick in bricks:
+            plug = link.Plug(self)
+            plug.connect(brick.socks[0])
+            self.plugs.append(plug)
+        return self
+
+    def poweron(self):
+        self.started.append(self)
+        self.deferred = defer.Deferred()
+        return self.deferred
+
+    def poweroff(self):
+        self.started.append(self)
+        self.deferred = defer.Deferred()
+        return self.deferred
+
+    def send_signal(self, signo):
+        self.signals.append(signo)
+
+    def __isrunning__(self):
+        return self.running
+
+    def __repr__(self):
+        return "<BrickStub {0}>".format(self.name)
+
+
+class TestGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.started = []
+        self.sw = BrickStub("sw", self.started)
+        self.vm1 = BrickStub("vm1", self.started).plug_to(self.sw)
+        self.vm2 = BrickStub("vm2", self.started).plug_to(self.sw, self.sw)
+
+    def test_dependencies(self):
+        self.assertEqual(scheduler.dependencies(self.sw), [])
+        self.assertEqual(scheduler.dependencies(self.vm1), [self.sw])
+        self.assertEqual(scheduler.dependencies(self.vm2), [self.sw])
+
+    def test_dependency_graph_ignore_unknown(self):
+        """Only the dependencies in the given bricks are in the graph."""
+
+        graph = scheduler.dependency_graph([self.vm1, self.vm2])
+        self.assertEqual(graph, {self.vm1: [], self.vm2: []})
+
+    def test_toposort(self):
+        graph = scheduler.dependency_graph([self.vm1, self.vm2, self.sw])
+        order = scheduler.toposort(graph)
+        self.assertEqual(len(order), 3)
+        self.assertEqual(order.index(self.sw), 0)
+
+    def test_toposort_loop(self):
+        """The edges that close a loop are ignored."""
+
+        self.sw.plug_to(self.vm1)
+        graph = scheduler.dependency_graph([self.vm1, self.sw])
+        self.assertEqual(sorted(scheduler.toposort(graph)),
+                         sorted([self.vm1, self.sw]))
+
+
+class TestPoweron(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = task.Clock()
+        self.started = []
+
+    def brick(self, name):
+        return BrickStub(name, self.started)
+
+    def poweron(self, bricks, concurrency=10):
+        return scheduler.poweron(bricks, concurrency, self.clock)
+
+    def test_independent_in_parallel(self):
+        bricks = [self.brick("sw%d" % i) for i in range(5)]
+        d = self.poweron(bricks)
+        self.assertEqual(sorted(self.started), sorted(bricks))
+        for brick in bricks:
+            brick.deferred.callback(brick)
+        report = successResultOf(self, d)
+        self.assertEqual([r.brick for r in report], bricks)
+        self.assertEqual(report.failures(), [])
+
+    def test_concurrency(self):
+        """No more than concurrency bricks are starting at the same time."""
+
+        bricks = [self.brick("sw%d" % i) for i in range(3)]
+        d = self.poweron(bricks, 2)
+        self.assertEqual(len(self.started), 2)
+        self.started[0].deferred.callback(None)
+        self.assertEqual(len(self.started), 3)
+        self.started[1].deferred.callback(None)
+        self.started[2].deferred.callback(None)
+        self.assertEqual(len(successResultOf(self, d)), 3)
+
+    def test_dependencies_first(self):
+        sw = self.brick("sw")
+        vm = self.brick("vm").plug_to(sw)
+        d = self.poweron([vm, sw])
+        self.assertEqual(self.started, [sw])
+        self.clock.advance(2)
+        sw.deferred.callback(sw)
+        self.assertEqual(self.started, [sw, vm])
+        self.clock.advance(3)
+        vm.deferred.callback(vm)
+        report = successResultOf(self, d)
+        self.assertEqual([(r.brick, r.success, r.elapsed) for r in report],
+                         [(vm, True, 3), (sw, True, 2)])
+        self.assertEqual(report.elapsed, 5)
+
+    def test_dependency_fails(self):
+        """If a dependency fails, the dependent bricks are not started."""
+
+        sw = self.brick("sw")
+        vm = self.brick("vm").plug_to(sw)
+        d = self.poweron([sw, vm])
+        sw.deferred.errback(errors.BadConfigError())
+        self.assertEqual(self.started, [sw])
+        report = successResultOf(self, d)
+        self.assertEqual(len(report.failures()), 2)
+        report.results[0].result.trap(errors.BadConfigError)
+        report.results[1].result.trap(errors.DependencyError)
+        self.flushLoggedErrors(errors.BadConfigError, errors.DependencyError)
+
+    def test_poweron_all(self):
+        factory = stubs.Factory()
+        brick1 = factory.new_brick("_stub", "brick1")
+        brick2 = factory.new_brick("_stub", "brick2")
+        report = successResultOf(self, factory.poweron_all())
+        self.assertEqual([r.brick for r in report], [brick1, brick2])
+        self.assertEqual(report.failures(), [])
+
+
+class TestPoweroff(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = task.Clock()
+        self.stopped = []
+
+    def brick(self, name):
+        brick = BrickStub(name, self.stopped)
+        brick.running = True
+        return brick
+
+    def test_dependents_first(self):
+        """A switch is stopped after the bricks plugged to it."""
+
+        sw = self.brick("sw")
+        vm1 = self.brick("vm1").plug_to(sw)
+        vm2 = self.brick("vm2").plug_to(sw)
+        d = scheduler.poweroff([sw, vm1, vm2], clock=self.clock)
+        self.assertEqual(sorted(self.stopped), sorted([vm1, vm2]))
+        vm1.deferred.callback((vm1, None))
+        self.assertEqual(len(self.stopped), 2)
+        self.clock.advance(1)
+        vm2.deferred.callback((vm2, None))
+        self.assertEqual(self.stopped[-1], sw)
+        sw.deferred.callback((sw, None))
+        report = successResultOf(self, d)
+        self.assertEqual([r.brick for r in report], [sw, vm1, vm2])
+        self.assertEqual(report.elapsed, 1)
+
+    def test_not_running(self):
+        """Bricks that are not running are not stopped."""
+
+        sw = self.brick("sw")
+        sw.running = False
+        report = successResultOf(self, scheduler.poweroff([sw]))
+        self.assertEqual(len(report), 0)
+        self.assertEqual(self.stopped, [])
+
+    def test_failure_does_not_block(self):
+        """If a brick cannot be stopped, its dependencies are stopped
+        anyway."""
+
+        sw = self.brick("sw")
+        vm = self.brick("vm").plug_to(sw)
+        d = scheduler.poweroff([sw, vm], clock=self.clock)
+        vm.deferred.errback(OSError(42, "The meaning of file"))
+        self.assertEqual(self.stopped, [vm, sw])
+        sw.deferred.callback((sw, None))
+        report = successResultOf(self, d)
+        self.assertEqual([r.brick for r in report.failures()], [vm])
+        self.flushLoggedErrors(OSError)
+
+    def test_escalation(self):
+        """A brick that does not stop receives a SIGTERM, then a SIGKILL."""
+
+        brick = self.brick("vm")
+        d = scheduler.stop(brick, 10, 5, self.clock)
+        self.clock.advance(10)
+        self.assertEqual(brick.signals, ["TERM"])
+        self.clock.advance(5)
+        self.assertEqual(brick.signals, ["TERM", "KILL"])
+        brick.deferred.callback((brick, None))
+        self.assertEqual(successResultOf(self, d), (brick, None))
+
+    def test_no_escalation(self):
+        brick = self.brick("vm")
+        d = scheduler.stop(brick, 10, 5, self.clock)
+        brick.deferred.callback((brick, None))
+        self.assertEqual(successResultOf(self, d), (brick, None))
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+        self.assertEqual(brick.signals, [])
+
+    def test_poweroff_all(self):
+        factory = stubs.Factory()
+        brick = factory.new_brick("_stub", "brick")
+        successResultOf(self, brick.poweron())
+        report = successResultOf(self, factory.poweroff_all())
+        self.assertEqual([r.brick for r in report], [brick])
+        self.assertIs(brick.proc, None)
+
+
+class QMPStub:
+
+    def __init__(self, log):
+        self.log = log
+        self.deferreds = []
+
+    def call(self, *args):
+        self.log.append(args)
+        d = defer.Deferred()
+        self.deferreds.append(d)
+        return d
+
+    def stop(self):
+        self.log.append(("stop",))
+        return defer.succeed(None)
+
+    def cont(self):
+        self.log.append(("cont",))
+        return defer.succeed(None)
+
+    def savevm(self, tag):
+        return self.call("savevm", tag)
+
+    def loadvm(self, tag):
+        return self.call("loadvm", tag)
+
+
+class VMStub(BrickStub):
+
+    def __init__(self, name, started):
+        BrickStub.__init__(self, name, started)
+        self.running = True
+        self.log = []
+        self.client = QMPStub(self.log)
+
+    def qmp(self):
+        return defer.succeed(self.client)
+
+    def poweron(self, snapshot=""):
+        self.log.append(("poweron", snapshot))
+        return defer.succeed(self)
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = task.Clock()
+        self.vms = [VMStub("vm%d" % i, []) for i in range(3)]
+
+    def test_checkpoint(self):
+        """All the virtual machines are paused before any state is saved and
+        resumed after all of them are saved."""
+
+        off = VMStub("off", [])
+        off.running = False
+        d = scheduler.checkpoint(self.vms + [off], "lab", 2, self.clock)
+        for vm in self.vms:
+            self.assertEqual(vm.log[0], ("stop",))
+        self.assertEqual(off.log, [])
+        self.assertEqual([len(vm.client.deferreds) for vm in self.vms],
+                         [1, 1, 0])
+        self.clock.advance(2)
+        self.vms[0].client.deferreds[0].callback(None)
+        self.assertEqual(self.vms[2].log, [("stop",), ("savevm", "lab")])
+        self.clock.advance(1)
+        self.vms[1].client.deferreds[0].callback(None)
+        self.assertEqual(self.vms[0].log, [("stop",), ("savevm", "lab")])
+        self.vms[2].client.deferreds[0].errback(errors.QMPError("E", "e"))
+        report = successResultOf(self, d)
+        self.assertEqual([(r.brick, r.success, r.elapsed) for r in report],
+                         [(self.vms[0], True, 2), (self.vms[1], True, 3),
+                          (self.vms[2], False, 1)])
+        self.assertEqual(report.elapsed, 3)
+        for vm in self.vms:
+            self.assertEqual(vm.log[-1], ("cont",))
+        self.flushLoggedErrors(errors.QMPError)
+
+    def test_pause_failed(self):
+        """A virtual machine that cannot be paused is not saved."""
+
+        self.vms[0].qmp = lambda: defer.fail(errors.InvalidActionError())
+        d = scheduler.checkpoint(self.vms[:2], "lab", 2, self.clock)
+        self.vms[1].client.deferreds[0].callback(None)
+        report = successResultOf(self, d)
+        self.assertEqual([r.success for r in report], [False, True])
+        report.results[0].result.trap(errors.InvalidActionError)
+        self.flushLoggedErrors(errors.InvalidActionError)
+
+    def test_restore(self):
+        """The running virtual machines load the snapshot, the others are
+        started from it."""
+
+        self.vms[1].running = False
+        d = scheduler.restore(self.vms[:2], "lab", 2, self.clock)
+        self.assertEqual(self.vms[1].log, [("poweron", "lab")])
+        self.assertEqual(self.vms[0].log, [("stop",), ("loadvm", "lab")])
+        self.vms[0].client.deferreds[0].callback(None)
+        report = successResultOf(self, d)
+        self.assertEqual(report.failures(), [])
+        self.assertEqual(self.vms[0].log[-1], ("cont",))
+
+
+class TestFactoryCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = stubs.Factory()
+        self.vms = [VMStub("vm1", []), VMStub("vm2", [])]
+        self.patch(scheduler, "checkpoint", self.checkpoint)
+        path = self.mktemp()
+        self.patch(self.factory, "_checkpoints_file", lambda: path)
+
+    def checkpoint(self, vms, tag, concurrency):
+        return defer.succeed(scheduler.Report([
+            scheduler.PowerResult(self.vms[0], True, None, 1),
+            scheduler.PowerResult(self.vms[1], False, None, 1)], 2))
+
+    def test_record(self):
+        """The virtual machines saved are recorded with the tag."""
+
+        successResultOf(self, self.factory.checkpoint_all("lab"))
+        checkpoints = self.factory.get_checkpoints()
+        self.assertEqual(checkpoints.keys(), ["lab"])
+        self.assertEqual(checkpoints["lab"]["bricks"], ["vm1"])
+
+    def test_invalid(self):
+        self.assertRaises(errors.InvalidNameError,
+                          self.factory.checkpoint_all, "a tag")
+        self.assertRaises(errors.InvalidNameError,
+                          self.factory.restore_all, "missing")
@@ -0,0 +1,89 @@
+import os
+import stat
+
+from twisted.trial import unittest
+
+from virtualbricks import _spawn, settings
+
+
+def touch_exe(path):
+    with open(path, "w"):
+        pass
+    os.chmod(path, stat.S_IRWXU)
+
+
+class TestAbspath(unittest.TestCase):
+
+    def setUp(self):
+        self.path = os.path.abspath(self.mktemp())
+        os.mkdir(self.path)
+        _spawn.clear_cache()
+        self.addCleanup(_spawn.clear_cache)
+        self.time = 1000.0
+        self.patch(_spawn.time, "time", lambda: self.time)
+        self.accesses = []
+        access = os.access
+
+        def count_access(path, mode):
+            self.accesses.append(path)
+            return access(path, mode)
+
+        self.patch(_spawn.os, "access", count_access)
+
+    def set_path(self, name):
+        if settings.has_option(name):
+            self.addCleanup(settings.set, name, settings.get(name))
+        else:
+            self.addCleanup(settings.config.remove_option,
+                            settings.DEFAULT_SECTION, name)
+        settings.set(name, self.path)
+
+    def test_cached(self):
+        """An executable is looked up once."""
+
+        exe = os.path.join(self.path, "qemu-img")
+        touch_exe(exe)
+        for i in range(3):
+            self.assertEqual(_spawn._abspath_exe(self.path, "qemu-img"), exe)
+        self.assertEqual(len(self.accesses), 1)
+
+    def test_not_found(self):
+        self.assertEqual(_spawn._abspath_exe(self.path, "qemu-img"),
+                         "qemu-img")
+        self.assertIs(_spawn._abspath_exe(self.path, "qemu-img", False), None)
+        self.assertEqual(len(self.accesses), 1)
+
+    def test_directory_changed(self):
+        """After the check interval, if the directory has changed the
+        executable is looked up again."""
+
+        self.assertIs(_spawn._abspath_exe(self.path, "qemu-img", False), None)
+        exe = os.path.join(self.path, "qemu-img")
+        touch_exe(exe)
+        os.utime(self.path, (0, 0))
+        self.assertIs(_spawn._abspath_exe(self.path, "qemu-img", False), None)
+        self.time += _spawn.CHECK_INTERVAL
+        self.assertEqual(_spawn._abspath_exe(self.path, "qemu-img"), exe)
+        self.time += _spawn.CHECK_INTERVAL
+        self.assertEqual(_spawn._abspath_exe(self.path, "qemu-img"), exe)
+        self.assertEqual(len(self.accesses), 2)
+
+    def test_settings_clear_cache(self):
+        self.set_path("qemupath")
+        _spawn.abspath_qemu("qemu-img")
+        self.assertNotEqual(_spawn._cache, {})
+        settings.set("qemupath", self.path)
+        self.assertEqual(_spawn._cache, {})
+
+    def test_warm_cache(self):
+        self.set_path("qemupath")
+        self.set_path("vdepath")
+        touch_exe(os.path.join(self.path, "vde_switch"))
+
+        def check(_):
+            del self.accesses[:]
+            self.assertEqual(_spawn.abspath_vde("vde_switch"),
+                             os.path.join(self.path, "vde_switch"))
+            self.assertEqual(self.accesses, [])
+
+        return _spawn.warm_cache().addCallback(check)
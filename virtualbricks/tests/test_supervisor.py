@@ -0,0 +1,155 @@
+from twisted.trial import unittest
+from twisted.internet import defer, error, task
+from twisted.python import failure
+
+from virtualbricks import bricks, supervisor, qemu
+from virtualbricks.tests import stubs, successResultOf
+
+
+DONE = failure.Failure(error.ProcessDone(0))
+CRASH = failure.Failure(error.ProcessTerminated(1))
+
+
+class CrashingBrick(stubs.StubBrick):
+
+    reattached = ()
+
+    def poweron(self):
+        if not self.proc:
+            self._stop_requested = False
+            self._exited_d = defer.Deferred()
+            self.proc = bricks.FakeProcess(self)
+        return defer.succeed(self)
+
+    def poweroff(self, kill=False):
+        self.factory.supervisor.cancel(self)
+        if self.proc is not None:
+            self._stop_requested = True
+            self.process_ended(self.proc, DONE)
+        return defer.succeed((self, None))
+
+    def crash(self, status=CRASH):
+        self.process_ended(self.proc, status)
+
+    def reattach(self, brick):
+        self.reattached += (brick, )
+
+
+class TestSupervisor(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = task.Clock()
+        self.factory = stubs.Factory()
+        self.factory.register_brick_type(CrashingBrick, "crashing")
+        self.supervisor = supervisor.Supervisor(self.factory, self.clock,
+                                                max_restarts=3)
+        self.factory.supervisor = self.supervisor
+        self.brick = self.factory.new_brick("crashing", "brick")
+        self.brick.set({"restart": supervisor.ALWAYS})
+        successResultOf(self, self.brick.poweron())
+
+    def test_never(self):
+        self.brick.set({"restart": supervisor.NEVER})
+        self.brick.crash()
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_on_failure(self):
+        """With the on-failure policy a clean exit is not restarted."""
+
+        self.brick.set({"restart": supervisor.ON_FAILURE})
+        self.brick.crash(DONE)
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+        successResultOf(self, self.brick.poweron())
+        self.brick.crash()
+        self.assertTrue(self.supervisor.is_pending(self.brick))
+
+    def test_restart(self):
+        self.brick.crash()
+        self.assertIs(self.brick.proc, None)
+        self.clock.advance(supervisor.DEFAULT_DELAY)
+        self.assertIsNot(self.brick.proc, None)
+        metrics = self.supervisor.metrics(self.brick)
+        self.assertEqual((metrics.restarts, metrics.downtime),
+                         (1, supervisor.DEFAULT_DELAY))
+        self.assertFalse(self.supervisor.is_pending(self.brick))
+
+    def test_backoff(self):
+        """The delay doubles at every crash in the window."""
+
+        delays = []
+        for i in range(3):
+            self.brick.crash()
+            call, = self.clock.getDelayedCalls()
+            delays.append(call.getTime() - self.clock.seconds())
+            self.clock.advance(delays[-1])
+        self.assertEqual(delays, [1, 2, 4])
+        self.clock.advance(self.supervisor.window)
+        self.brick.crash()
+        call, = self.clock.getDelayedCalls()
+        self.assertEqual(call.getTime() - self.clock.seconds(), 1)
+
+    def test_crash_loop(self):
+        for i in range(3):
+            self.brick.crash()
+            self.clock.advance(2 ** i)
+        self.brick.crash()
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+        metrics = self.supervisor.metrics(self.brick)
+        self.assertTrue(metrics.gave_up)
+        self.assertEqual(metrics.restarts, 3)
+        self.assertEqual(metrics.downtime, 1 + 2 + 4)
+
+    def test_poweroff_not_restarted(self):
+        successResultOf(self, self.brick.poweroff())
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_poweroff_cancel_restart(self):
+        """Stopping a brick waiting to be restarted cancels the restart."""
+
+        self.brick.crash()
+        successResultOf(self, self.brick.poweroff())
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+        self.assertIs(self.supervisor.metrics(self.brick).down_since, None)
+
+    def test_removed_brick(self):
+        self.brick.crash()
+        self.factory.del_brick(self.brick)
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
+    def test_reattach_dependents(self):
+        """After a restart, the running bricks plugged to the restarted brick
+        are re-attached."""
+
+        sock = self.factory.new_sock(self.brick, "sock")
+        self.brick.socks.append(sock)
+        plugged = self.factory.new_brick("crashing", "plugged")
+        stopped = self.factory.new_brick("crashing", "stopped")
+        for other in plugged, stopped:
+            plug = self.factory.new_plug(other)
+            plug.connect(sock)
+            other.plugs.append(plug)
+        successResultOf(self, plugged.poweron())
+        self.assertEqual(supervisor.dependents(self.brick), [plugged])
+        self.brick.crash()
+        self.clock.advance(supervisor.DEFAULT_DELAY)
+        self.assertEqual(plugged.reattached, (self.brick, ))
+        self.assertEqual(stopped.reattached, ())
+
+
+class TestVirtualMachineReattach(unittest.TestCase):
+
+    def test_reattach(self):
+        """A virtual machine replaces the VDE backend of the plugs connected
+        to the restarted brick, the guest keeps running."""
+
+        self.patch(qemu, "supports_netdev", lambda name: False)
+        factory = stubs.Factory()
+        switch = factory.new_brick("stub", "switch")
+        sock = factory.new_sock(switch, "/tmp/switch.ctl")
+        vm = stubs.VirtualMachineStub(factory, "vm")
+        vm.add_plug(factory.new_sock(None, "other"))
+        vm.add_plug(sock)
+        vm.reattach(switch)
+        self.assertEqual(vm.sended, [
+            "host_net_remove 1 vde1\n",
+            "host_net_add vde vlan=1,sock=/tmp/switch.ctl,name=vde1\n"])
@@ -84,3 +84,51 @@ class TestTools(unittest.TestCase):
         self.assertEqual("123.0 MB", tools.fmtsize(123 * 1024 ** 2))
         self.assertEqual("10.0 GB", tools.fmtsize(10200 * 1024 ** 2))
         self.assertEqual("321.0 GB", tools.fmtsize(321 * 1024 ** 3))
+
+
+class TestHostMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.root = self.mktemp()
+        os.mkdir(self.root)
+
+    def write(self, path, content):
+        path = os.path.join(self.root, path)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, "w") as fp:
+            fp.write(content)
+
+    def test_ksm_stats(self):
+        for name, value in [("run", "1\n"), ("pages_shared", "10\n"),
+                            ("pages_sharing", "250\n"),
+                            ("pages_volatile", "3\n")]:
+            self.write(name, value)
+        stats = tools.ksm_stats(self.root)
+        self.assertEqual(stats["run"], 1)
+        self.assertEqual(stats["pages_shared"], 10)
+        self.assertEqual(stats["pages_unshared"], 0)
+        self.assertEqual(stats["saved"], 250 * tools.PAGE_SIZE)
+
+    def test_no_ksm(self):
+        self.assertIs(tools.ksm_stats(self.root), None)
+
+    def test_hugepages(self):
+        self.write("hugepages-2048kB/nr_hugepages", "512\n")
+        self.write("hugepages-2048kB/free_hugepages", "100\n")
+        self.write("hugepages-1048576kB/nr_hugepages", "2\n")
+        self.write("hugepages-1048576kB/free_hugepages", "2\n")
+        self.assertEqual(tools.hugepages(self.root),
+                         [(2 << 20, 512, 100), (1 << 30, 2, 2)])
+        self.assertEqual(tools.hugepages(os.path.join(self.root, "no")), [])
+
+    def test_hugetlbfs_mount(self):
+        self.write("mounts", "proc /proc proc rw 0 0\n"
+                   "hugetlbfs /dev/huge\\040pages hugetlbfs rw,pagesize=2M"
+                   " 0 0\n")
+        self.assertEqual(tools.hugetlbfs_mount(os.path.join(self.root,
+                                                            "mounts")),
+                         "/dev/huge pages")
+        self.write("mounts", "proc /proc proc rw 0 0\n")
+        self.assertIs(tools.hugetlbfs_mount(os.path.join(self.root,
+                                                         "mounts")), None)
@@ -0,0 +1,33 @@
+from twisted.trial import unittest
+from twisted.internet import defer
+
+from virtualbricks import tuntaps, helper, settings
+from virtualbricks.tests import stubs, successResultOf
+
+
+class TestTap(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = stubs.FactoryStub()
+        self.tap = tuntaps.Tap(self.factory, "tap0")
+        self.tap.set({"mode": "dhcp"})
+        self.commands = []
+        self.patch(helper, "run_commands", self.run_commands)
+        self.patch(self.tap, "needsudo", lambda: False)
+        self.addCleanup(settings.set, "helper", settings.get("helper"))
+        settings.set("helper", False)
+
+    def run_commands(self, commands, env=None):
+        self.commands.extend(commands)
+        return defer.succeed(0)
+
+    def test_configure(self):
+        self.assertIs(self.tap._configure_interface(None), None)
+        self.assertEqual(self.commands, [["dhclient", "tap0"]])
+
+    def test_poweron_running(self):
+        """A tap already running is not configured again."""
+
+        self.tap.proc = object()
+        self.assertIs(successResultOf(self, self.tap.poweron()), self.tap)
+        self.assertEqual(self.commands, [])
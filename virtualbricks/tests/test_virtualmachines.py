@@ -4,12 +4,14 @@ import copy
 import StringIO
 
 from twisted.trial import unittest
-from twisted.internet import defer
+from twisted.internet import defer, error, task
+from twisted.python import failure
 
 from virtualbricks import (link, virtualmachines as vm, errors, settings,
-                           configfile, tools)
+                           configfile, tools, diskinfo, qmp, qemu, affinity)
 from virtualbricks.tests import (stubs, test_link, successResultOf,
-                                 failureResultOf, TEST_DATA_PATH)
+                                 failureResultOf, LoggingObserver,
+                                 TEST_DATA_PATH)
 
 
 def disks(vm):
@@ -20,7 +22,9 @@ def disks(vm):
 ARGS = ["true", "-m", "64", "-smp", "1", "@@DRIVESARGS@@", "-name", "vm",
         "-net", "none", "-mon", "chardev=mon", "-chardev",
         "socket,id=mon,path=/home/marco/.virtualbricks/vm.mgmt,server,nowait",
-        "-mon", "chardev=mon_cons", "-chardev", "stdio,id=mon_cons,signal=off"]
+        "-mon", "chardev=mon_cons", "-chardev", "stdio,id=mon_cons,signal=off",
+        "-mon", "chardev=qmp,mode=control", "-chardev",
+        "socket,id=qmp,path=/home/marco/.virtualbricks/vm.qmp,server,nowait"]
 
 
 class _Image(vm.Image):
@@ -61,6 +65,230 @@ class TestVirtualMachine(unittest.TestCase):
         args = self.get_args("-drive", drv)
         self.assertEquals(successResultOf(self, self.vm.args()), args)
 
+    def test_args_cached(self):
+        """The disks are resolved at every start, the rest of the command
+        line is cached until the plugs change."""
+
+        args = successResultOf(self, self.vm.args())
+        self.assertEqual(self.vm.cached_args(),
+                         [a for a in args if a not in ("-hda",
+                                                       self.image_path)])
+        plug = self.vm.add_plug(vm.hostonly_sock, "00:11:22:33:44:55")
+        self.assertIs(self.vm.cached_args(), None)
+        args = successResultOf(self, self.vm.args())
+        self.assertIn("rtl8139,netdev=user0,mac=00:11:22:33:44:55,id=eth0",
+                      args)
+        plug.mac = "00:11:22:33:44:66"
+        args = successResultOf(self, self.vm.args())
+        self.assertIn("rtl8139,netdev=user0,mac=00:11:22:33:44:66,id=eth0",
+                      args)
+
+    def nic_args(self):
+        args = successResultOf(self, self.vm.args())
+        start = args.index("vm") + 1
+        return args[start:args.index("-mon")]
+
+    def test_args_netdev(self):
+        """Every NIC is bound to its own backend, without the qemu vlans."""
+
+        brick = stubs.BrickStub(self.factory, "switch")
+        sock = self.factory.new_sock(brick, "switch_port")
+        sock.path = "/tmp/switch[]"
+        self.vm.add_plug(sock, "00:11:22:33:44:55", "virtio-net-pci")
+        self.vm.add_plug(vm.hostonly_sock, "00:11:22:33:44:66", "e1000")
+        self.assertEqual(self.nic_args(), [
+            "-netdev", "vde,id=vde0,sock=/tmp/switch",
+            "-device", "virtio-net-pci,netdev=vde0,mac=00:11:22:33:44:55,"
+            "id=eth0",
+            "-netdev", "user,id=user1",
+            "-device", "e1000,netdev=user1,mac=00:11:22:33:44:66,id=eth1"])
+
+    def test_args_legacy(self):
+        """The qemu that do not support -netdev use the vlans."""
+
+        self.patch(qemu, "supports_netdev", lambda name: False)
+        self.vm.add_plug(vm.hostonly_sock, "00:11:22:33:44:66", "e1000")
+        self.assertEqual(self.nic_args(), [
+            "-device", "e1000,vlan=0,mac=00:11:22:33:44:66,id=eth0",
+            "-net", "user,vlan=0"])
+
+    def test_reattach_netdev(self):
+        """The NIC is unplugged before its backend is replaced."""
+
+        brick = stubs.BrickStub(self.factory, "switch")
+        sock = self.factory.new_sock(brick, "switch_port")
+        sock.path = "/tmp/switch[]"
+        plug = self.vm.add_plug(sock, "00:11:22:33:44:55", "e1000")
+        client = qmp.QMPProtocol()
+        executed = []
+
+        def execute(command, **arguments):
+            executed.append((command, arguments))
+            return defer.succeed({})
+
+        client.execute = execute
+        self.vm._qmp_client = client
+        self.vm.reattach(brick)
+        self.assertEqual(executed, [("device_del", {"id": "eth0"})])
+        client._dispatch({"event": "DEVICE_DELETED",
+                          "data": {"device": "eth0"}})
+        self.assertEqual(executed[1:], [
+            ("netdev_del", {"id": "vde0"}),
+            ("netdev_add", {"type": "vde", "id": "vde0",
+                            "sock": "/tmp/switch"}),
+            ("device_add", {"driver": "e1000", "id": "eth0",
+                            "netdev": "vde0", "mac": plug.mac})])
+
+    def replug(self, device_del):
+        brick = stubs.BrickStub(self.factory, "switch")
+        sock = self.factory.new_sock(brick, "switch_port")
+        sock.path = "/tmp/switch[]"
+        plug = self.vm.add_plug(sock, "00:11:22:33:44:55", "e1000")
+        client = qmp.QMPProtocol()
+        executed = []
+
+        def execute(command, **arguments):
+            executed.append(command)
+            if command == "device_del":
+                return device_del
+            return defer.succeed({})
+
+        client.execute = execute
+        self.vm.clock = task.Clock()
+        return client, executed, self.vm._replug(client, 0, plug)
+
+    def test_replug_timeout(self):
+        """If the guest does not release the NIC the reattach fails after a
+        while and stops waiting for the event."""
+
+        client, executed, d = self.replug(defer.succeed({}))
+        self.assertNoResult(d)
+        self.vm.clock.advance(vm.UNPLUG_TIMEOUT)
+        err = failureResultOf(self, d, errors.QMPError).value
+        self.assertEqual(err.error_class, "DeviceNotRemoved")
+        self.assertEqual(client._subscribers["DEVICE_DELETED"], [])
+        self.assertEqual(executed, ["device_del"])
+
+    def test_replug_device_del_error(self):
+        client, executed, d = self.replug(
+            defer.fail(errors.QMPError("DeviceNotFound", "")))
+        failureResultOf(self, d, errors.QMPError)
+        self.assertEqual(client._subscribers["DEVICE_DELETED"], [])
+        self.assertEqual(self.vm.clock.getDelayedCalls(), [])
+
+    def test_set_throttle_live(self):
+        """The I/O limits of a running virtual machine are changed through
+        QMP, the disk is found by its image."""
+
+        client = qmp.QMPProtocol()
+        executed = []
+
+        def execute(command, **arguments):
+            executed.append((command, arguments))
+            if command == "query-block":
+                return defer.succeed([
+                    {"device": "ide0-hd0", "qdev": "",
+                     "inserted": {"file": self.image_path}}])
+            return defer.succeed({})
+
+        client.execute = execute
+        self.vm._qmp_client = client
+        self.vm.config["hda"]._drive_file = self.image_path
+        self.vm.set({"iops_wrhda": 100})
+        self.assertEqual(executed, [])
+        self.vm.proc = object()
+        self.vm.set({"iops_wrhda": 200, "iops_wr_maxhda": 400, "ram": 256})
+        self.assertEqual(executed, [
+            ("query-block", {}),
+            ("block_set_io_throttle", {
+                "device": "ide0-hd0", "iops": 0, "iops_rd": 0,
+                "iops_wr": 200, "bps": 0, "bps_rd": 0, "bps_wr": 0,
+                "iops_wr_max": 400})])
+
+    def test_args_mutable_parameter(self):
+        """A list changed in place and set again changes the memoized
+        command line."""
+
+        self.patch(self.vm, "prog", lambda: "qemu")
+        devices = ["1d6b:0002"]
+        self.vm.set({"usbmode": True, "usbdevlist": devices})
+        self.assertIn("host:1d6b:0002", successResultOf(self, self.vm.args()))
+        devices.append("046d:c52b")
+        self.vm.set({"usbdevlist": devices})
+        self.assertIn("host:046d:c52b", successResultOf(self, self.vm.args()))
+
+    def test_disk_set_image(self):
+        """Changing the image of a disk in place changes the configuration
+        of the virtual machine."""
+
+        version = self.vm.config.version
+        self.vm.config["hda"].set_image(object())
+        self.assertGreater(self.vm.config.version, version)
+
+    def test_args_memory_backend(self):
+        """The guest RAM can be preallocated and shared, the backend is the
+        memory of the node 0 of the guest."""
+
+        self.vm.set({"ram": 512, "memprealloc": True, "memshare": True})
+        self.assertEqual(self.vm._memory_args(), [
+            "-object", "memory-backend-ram,id=ram0,size=512M,share=on,"
+            "prealloc=on", "-numa", "node,memdev=ram0"])
+        self.vm.set({"memprealloc": False, "memshare": False})
+        self.assertEqual(self.vm._memory_args(), [])
+
+    def test_args_hugepages(self):
+        self.patch(tools, "hugepages", lambda: [(2 << 20, 512, 512)])
+        self.patch(tools, "hugetlbfs_mount", lambda: None)
+        self.vm.set({"ram": 256, "hugepages": True})
+        self.assertRaises(errors.BadConfigError, self.vm._memory_args)
+        self.vm.set({"hugepath": "/dev/hugepages"})
+        self.assertEqual(self.vm._memory_args(), [
+            "-object", "memory-backend-file,id=ram0,size=256M,"
+            "mem-path=/dev/hugepages", "-numa", "node,memdev=ram0"])
+
+    def test_few_hugepages(self):
+        """The free huge pages are checked at every start, also when the
+        command line is already built."""
+
+        free = [(2 << 20, 512, 512)]
+        observer = LoggingObserver()
+        self.addCleanup(vm.few_hugepages.tap(observer, vm.logger.publisher))
+        self.patch(tools, "hugepages", lambda: free)
+        self.patch(self.vm, "prog", lambda: "qemu")
+        self.vm.set({"ram": 256, "hugepages": True,
+                     "hugepath": "/dev/hugepages"})
+        successResultOf(self, self.vm.args())
+        self.assertEqual(len(observer), 0)
+        free[:] = [(2 << 20, 512, 64)]
+        successResultOf(self, self.vm.args())
+        successResultOf(self, self.vm.args())
+        self.assertEqual([event["free"] for event in observer], [128, 128])
+
+    def test_pin_vcpus(self):
+        """The vCPU threads are bound to the CPUs in order, query-cpus is
+        used if qemu does not know query-cpus-fast."""
+
+        client = qmp.QMPProtocol()
+
+        def execute(command, **arguments):
+            if command == "query-cpus-fast":
+                return defer.fail(errors.QMPError("CommandNotFound", ""))
+            return defer.succeed([{"CPU": 2, "thread_id": 1003},
+                                  {"CPU": 0, "thread_id": 1001},
+                                  {"CPU": 1, "thread_id": 1002}])
+
+        client.execute = execute
+        pinned = []
+        self.patch(affinity, "sched_setaffinity",
+                   lambda tid, cpus: pinned.append((tid, cpus)))
+        self.vm._qmp_client = client
+        self.vm.set({"vcpus": "4,6"})
+        self.assertEqual(successResultOf(self, self.vm.pin_vcpus()),
+                         [(0, 1001, 4), (1, 1002, 6), (2, 1003, 4)])
+        self.assertEqual(pinned, [(1001, [4]), (1002, [6]), (1003, [4])])
+        self.vm.set({"vcpus": "x"})
+        failureResultOf(self, self.vm.pin_vcpus(), errors.BadConfigError)
+
     def test_add_plug_hostonly(self):
         mac, model = object(), object()
         plug = self.vm.add_plug(vm.hostonly_sock, mac, model)
@@ -138,6 +366,62 @@ class TestVirtualMachine(unittest.TestCase):
             self.fail("vm lock acquired but it should not happend")
         self.assertEqual(_image.acquired, _image.released)
 
+    def test_qmp_not_running(self):
+        failureResultOf(self, self.vm.qmp(), errors.InvalidActionError)
+
+    def test_qmp_connection_shared(self):
+        """The connection to the QMP socket is opened once, the STOP and
+        RESUME events change the state of the virtual machine."""
+
+        connections = []
+        self.patch(qmp, "connect", lambda path: connections.append(path) or
+                   defer.Deferred())
+        self.vm.proc = object()
+        d1, d2 = self.vm.qmp(), self.vm.qmp()
+        self.assertEqual(connections, [self.vm.qmp_socket()])
+        client = qmp.QMPProtocol()
+        self.vm._qmp_connected(client)
+        self.assertIs(successResultOf(self, d1), client)
+        self.assertIs(successResultOf(self, d2), client)
+        client._dispatch({"event": "STOP"})
+        self.assertTrue(self.vm.paused)
+        self.assertEqual(self.vm.get_state(), "paused")
+        client._dispatch({"event": "RESUME"})
+        self.assertEqual(self.vm.get_state(), "running")
+        client.lost.callback(None)
+        self.assertIs(self.vm._qmp_client, None)
+
+    def test_qmp_connected_at_start(self):
+        """The connection to the QMP socket is opened when the process
+        starts, the events emitted during the boot are not lost."""
+
+        connections = []
+        self.patch(qmp, "connect", lambda path: connections.append(path) or
+                   defer.Deferred())
+        self.vm._started_d = defer.Deferred()
+        self.vm.proc = object()
+        self.vm.process_started(self.vm.proc)
+        self.assertEqual(connections, [self.vm.qmp_socket()])
+        client = qmp.QMPProtocol()
+        self.vm._qmp_connected(client)
+        client._dispatch({"event": "STOP"})
+        self.assertTrue(self.vm.paused)
+
+    def test_qmp_connect_error_after_exit(self):
+        """A failed connection is not an error if the virtual machine has
+        already exited."""
+
+        connection = defer.Deferred()
+        self.patch(qmp, "connect", lambda path: connection)
+        observer = LoggingObserver()
+        self.addCleanup(vm.qmp_error.tap(observer, vm.logger.publisher))
+        self.vm._started_d = defer.Deferred()
+        self.vm.proc = object()
+        self.vm.process_started(self.vm.proc)
+        self.vm.proc = None
+        connection.errback(failure.Failure(error.ConnectError()))
+        self.assertEqual(len(observer), 0)
+
 
 class TestVMPlug(test_link.TestPlug):
 
@@ -210,6 +494,7 @@ class TestPlugWithHostOnlySock(unittest.TestCase):
 class ImageStub:
 
     path = "cucu"
+    warm_pool = 0
 
 
 class NULL:
@@ -233,7 +518,6 @@ class FULL:
 class DiskStub(vm.Disk):
 
     _basefolder = None
-    sync_cmd = "false"
 
     def get_basefolder(self):
         if self._basefolder is not None:
@@ -271,35 +555,50 @@ class TestDisk(unittest.TestCase):
             failure.trap(RuntimeError)
         return self.disk._create_cow("1").addCallbacks(cb, eb)
 
-    def test_sync_err(self):
-        def cb(ret):
-            self.fail("_create_cow did not failed while it had to")
+    def test_create_cow_from_warm_pool(self):
+        """If the image has a ready overlay, it is used instead of creating a
+        new one."""
 
-        def eb(failure):
-            failure.trap(RuntimeError)
-            failure.value.args[0].startswith("sync failed")
+        self.disk.image = ImageStub()
+        self.disk.image.warm_pool = 1
+        taken = []
 
-        return self.disk._sync(("", "", 0)).addCallbacks(cb, eb)
+        def take(image, cowname, fmt):
+            taken.append((image, cowname, fmt))
+            return defer.succeed(cowname)
+
+        self.patch(self.factory.warm_pool, "take", take)
+        d = self.disk._create_cow("name")
+        self.assertEqual(successResultOf(self, d), "name")
+        self.assertEqual(taken, [(self.disk.image, "name",
+                                  settings.get("cowfmt"))])
 
     def test_check_base(self):
-        err = self.assertRaises(IOError, self.disk._check_base, "/montypython")
-        self.assertEqual(err.errno, errno.ENOENT)
-        self.patch(tools, "get_backing_file", lambda _: NULL())
+        self.assertRaises(tools.UnknowTypeError,
+                          self.disk._check_backing_file,
+                          diskinfo.DiskInfo("cow", tools.ImageFormat.RAW, 0,
+                                            0), "cow")
         self.disk._create_cow = lambda _: defer.succeed(None)
         self.disk.image = ImageStub()
         cowname = self.mktemp()
         fp = open(cowname, "w")
         fp.close()
-        result = []
-        self.disk._check_base(cowname).addCallback(result.append)
-        self.assertEqual(result, [cowname])
-        self.patch(tools, "get_backing_file", lambda _: FULL())
-        del result[:]
+        info = diskinfo.DiskInfo(cowname, tools.ImageFormat.QCOW2, 0, 0,
+                                 backing_file=NULL())
+        d = defer.maybeDeferred(self.disk._check_backing_file, info, cowname)
+        self.assertEqual(successResultOf(self, d), cowname)
         cowname = self.mktemp()
         fp = open(cowname, "w")
         fp.close()
-        self.disk._check_base(cowname).addCallback(result.append)
-        self.assertEqual(result, [cowname])
+        info = diskinfo.DiskInfo(cowname, tools.ImageFormat.QCOW2, 0, 0,
+                                 backing_file=FULL())
+        d = defer.maybeDeferred(self.disk._check_backing_file, info, cowname)
+        self.assertEqual(successResultOf(self, d), cowname)
+
+    def test_check_base_missing(self):
+        d = self.disk._check_base(os.path.abspath("/montypython"))
+        return self.assertFailure(d, IOError).addCallback(
+            lambda err: self.assertEqual(err.errno, errno.ENOENT))
 
     def test_get_cow_name(self):
         self.disk.basefolder = "/nonono/"
@@ -319,7 +618,7 @@ class TestDisk(unittest.TestCase):
 
         def throw(_errno):
             def _check_base(_):
-                raise IOError(_errno, os.strerror(_errno))
+                return defer.fail(IOError(_errno, os.strerror(_errno)))
             return _check_base
 
         self.disk.basefolder = basefolder = self.mktemp()
@@ -327,8 +626,8 @@ class TestDisk(unittest.TestCase):
                                                           self.disk.device))
         self.disk._check_base = throw(errno.EACCES)
         self.disk._create_cow = lambda passthru: defer.succeed(passthru)
-        err = self.assertRaises(IOError, self.disk._get_cow_name)
-        self.assertEqual(err.errno, errno.EACCES)
+        err = failureResultOf(self, self.disk._get_cow_name(), IOError)
+        self.assertEqual(err.value.errno, errno.EACCES)
         self.disk._check_base = throw(errno.ENOENT)
         result = []
         self.disk._get_cow_name().addCallback(result.append)
@@ -345,6 +644,72 @@ class TestDisk(unittest.TestCase):
         # self.disk.get_real_disk_name = lambda: defer.fail(f)
         # failureResultOf(self, self.disk.args(), RuntimeError)
 
+    def disk_args(self):
+        self.disk.image = ImageStub()
+        self.disk.get_real_disk_name = lambda: defer.succeed("/a,b.img")
+        return self.disk.args()
+
+    def test_args_io_settings(self):
+        """The I/O settings of the disk are passed with -drive, the commas in
+        the name of the image are escaped."""
+
+        self.vm.set({"cachehda": "none", "aiohda": "native",
+                     "discardhda": True})
+        self.assertEqual(successResultOf(self, self.disk_args()), [
+            "-drive", "file=/a,,b.img,if=ide,index=0,cache=none,aio=native,"
+            "discard=unmap,detect-zeroes=unmap"])
+
+    def test_args_io_settings_virtio(self):
+        self.vm.set({"use_virtio": True, "cachehda": "writeback"})
+        self.assertEqual(successResultOf(self, self.disk_args()),
+                         ["-drive", "file=/a,,b.img,if=virtio,cache=writeback"])
+
+    def test_args_iothread(self):
+        """A disk with its own iothread is a virtio-blk device bound to it."""
+
+        self.vm.set({"use_virtio": True, "iothreadhda": True,
+                     "aiohda": "threads"})
+        self.assertEqual(successResultOf(self, self.disk_args()), [
+            "-object", "iothread,id=iohda",
+            "-drive", "file=/a,,b.img,if=none,id=drive-hda,aio=threads",
+            "-device", "virtio-blk-pci,drive=drive-hda,iothread=iohda"])
+
+    def test_args_iothread_no_virtio(self):
+        self.vm.set({"iothreadhda": True})
+        failureResultOf(self, self.disk_args(), errors.BadConfigError)
+
+    def test_args_invalid_io_settings(self):
+        self.vm.set({"cachehda": "sometimes"})
+        failureResultOf(self, self.disk_args(), errors.BadConfigError)
+        self.vm.set({"cachehda": "writeback", "aiohda": "native"})
+        failureResultOf(self, self.disk_args(), errors.BadConfigError)
+
+    def test_args_io_uring_fallback(self):
+        """If qemu is too old for io_uring the disk uses the threads."""
+
+        self.patch(qemu, "supports_io_uring", lambda name: False)
+        self.vm.set({"aiohda": "io_uring"})
+        self.assertEqual(successResultOf(self, self.disk_args()), [
+            "-drive", "file=/a,,b.img,if=ide,index=0,aio=threads"])
+
+    def test_args_throttle(self):
+        self.vm.set({"bps_rdhda": 1 << 20, "bps_rd_maxhda": 4 << 20,
+                     "iops_wrhda": 50})
+        self.assertEqual(successResultOf(self, self.disk_args()), [
+            "-drive", "file=/a,,b.img,if=ide,index=0,iops_wr=50,"
+            "bps_rd=1048576,bps_rd_max=4194304"])
+
+    def test_throttle_invalid_burst(self):
+        """A burst is allowed only together with a lower limit."""
+
+        self.vm.set({"iops_rd_maxhda": 10})
+        self.assertRaises(errors.BadConfigError, self.disk.throttle)
+        self.vm.set({"iops_rdhda": 20})
+        self.assertRaises(errors.BadConfigError, self.disk.throttle)
+        self.vm.set({"iops_rdhda": 5})
+        self.assertEqual(self.disk.throttle(),
+                         {"iops_rd": 5, "iops_rd_max": 10})
+
     def test_get_real_disk_name(self):
 
         def raise_IOError():
@@ -399,6 +764,17 @@ class TestDisk(unittest.TestCase):
 
 class TestImage(unittest.TestCase):
 
+    def test_save_to(self):
+        image = vm.Image("test", "/vmimage")
+        fp = StringIO.StringIO()
+        image.save_to(fp)
+        self.assertEqual(fp.getvalue(), "[Image:test]\npath=/vmimage\n\n")
+        image.warm_pool = 3
+        fp = StringIO.StringIO()
+        image.save_to(fp)
+        self.assertEqual(fp.getvalue(),
+                         "[Image:test]\npath=/vmimage\nwarm_pool=3\n\n")
+
     def test_acquire(self):
         image = vm.Image("test", "/vmimage")
         o = object()
@@ -3,6 +3,7 @@ try:
 except ImportError:
     mock = None
 from twisted.trial import unittest
+from twisted.test import proto_helpers
 
 from virtualbricks import wires, link, settings
 from virtualbricks.tests import stubs
@@ -88,3 +89,19 @@ class TestNetemu(unittest.TestCase):
     if mock is None:
         test_live_management_2.skip = "Mock library not installed"
 
+    def test_live_management_batch(self):
+        """The commands of a change are sent together to the process."""
+
+        proc = wires.WFProcessProtocol(self.netemu)
+        writes = []
+        transport = proto_helpers.StringTransport()
+        transport.writeSequence = writes.append
+        transport.pid = -1
+        proc.transport = transport
+        self.netemu.proc = proc
+        self.netemu.set({"delay": 10, "loss": 5, "bandwidth": 1000})
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(sorted("".join(writes[0]).splitlines()),
+                         ["bandwidth 1000", "delay 10", "loss 5"])
+        proc.data_received("1000 Success\nVDEwf$ " * 3)
+        self.assertEqual(len(proc.queue), 0)
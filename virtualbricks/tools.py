@@ -124,6 +124,74 @@ def check_ksm():
         return False
 
 
+KSM_ROOT = "/sys/kernel/mm/ksm"
+HUGEPAGES_ROOT = "/sys/kernel/mm/hugepages"
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+KSM_COUNTERS = ("run", "pages_shared", "pages_sharing", "pages_unshared",
+                "pages_volatile", "full_scans")
+
+
+def ksm_stats(root=KSM_ROOT):
+    """Return the counters of KSM, a dictionary counter -> value, and the
+    bytes saved in the C{saved} key. The pages merged are counted once in
+    C{pages_shared} and every other mapping of them in C{pages_sharing}.
+
+    Return C{None} if the kernel has no KSM.
+    """
+
+    stats = {}
+    for name in KSM_COUNTERS:
+        try:
+            with open(os.path.join(root, name)) as fp:
+                stats[name] = int(fp.read())
+        except (IOError, ValueError):
+            if name == "run":
+                return None
+            stats[name] = 0
+    stats["saved"] = stats["pages_sharing"] * PAGE_SIZE
+    return stats
+
+
+def hugepages(root=HUGEPAGES_ROOT):
+    """Return the pools of huge pages, a list of (page size, total pages,
+    free pages), the sizes are in bytes."""
+
+    pools = []
+    try:
+        names = os.listdir(root)
+    except OSError:
+        return pools
+    for name in names:
+        match = re.match(r"hugepages-(\d+)kB$", name)
+        if match is None:
+            continue
+        counters = []
+        for counter in "nr_hugepages", "free_hugepages":
+            try:
+                with open(os.path.join(root, name, counter)) as fp:
+                    counters.append(int(fp.read()))
+            except (IOError, ValueError):
+                counters.append(0)
+        pools.append((int(match.group(1)) << 10, counters[0], counters[1]))
+    return sorted(pools)
+
+
+def hugetlbfs_mount(mounts="/proc/mounts"):
+    """Return the first mount point of hugetlbfs or C{None} if it is not
+    mounted."""
+
+    try:
+        with open(mounts) as fp:
+            for line in fp:
+                fields = line.split()
+                if len(fields) > 2 and fields[2] == "hugetlbfs":
+                    # the spaces are escaped as \040
+                    return fields[1].replace("\\040", " ")
+    except IOError:
+        pass
+    return None
+
+
 def _check_cb(exit_code, cmd):
     if exit_code:  # exit state != 0
         logger.error(ksm_error, cmd=cmd)
@@ -156,6 +224,8 @@ class Tempfile:
 
 
 GENERIC_HEADER_FMT = ">II"
+# the magic of the formats below is stored in little endian
+LE_HEADER_FMT = "<II"
 _L = struct.calcsize(GENERIC_HEADER_FMT)
 COW_MAGIC = 0x4f4f4f4d # OOOM
 COW_SIZE = 1024
@@ -327,26 +397,37 @@ class ImageFormat(constants.Names):
 
 
 _type_map = {
-    COW_MAGIC: {1: ImageFormat.COW},
-    QCOW_MAGIC: {1: ImageFormat.QCOW, 2: ImageFormat.QCOW2},
+    COW_MAGIC: {1: ImageFormat.COW, 2: ImageFormat.COW, 3: ImageFormat.COW},
+    QCOW_MAGIC: {1: ImageFormat.QCOW, 2: ImageFormat.QCOW2,
+                 3: ImageFormat.QCOW2},
+}
+_le_type_map = {
     COWD_MAGIC: {1: ImageFormat.VMDK},
-    VMDK_MAGIC: {1: ImageFormat.VMDK},
+    VMDK_MAGIC: DummyDict(ImageFormat.VMDK),
     QED_MAGIC: DummyDict(ImageFormat.QED)
 }
 
 
 def image_type(data):
+    if len(data) < _L:
+        return ImageFormat.UNKNOWN
     magic, version = struct.unpack(GENERIC_HEADER_FMT, data[:_L])
     try:
         return _type_map[magic][version]
     except KeyError:
         pass
-    _, signature = struct.unpack(VDI_HEADER_FMT, data[:_VDI_L])
-    if signature == VDI_SIGNATURE:
-        return ImageFormat.VDI
-    if struct.unpack(VPC_HEADER_FMT, data[:_VPC_L]) == VPC_CREATOR:
+    magic, version = struct.unpack(LE_HEADER_FMT, data[:_L])
+    try:
+        return _le_type_map[magic][version]
+    except KeyError:
+        pass
+    if len(data) >= _VDI_L:
+        signature = struct.unpack(VDI_HEADER_FMT, data[:_VDI_L])[-1]
+        if signature == VDI_SIGNATURE:
+            return ImageFormat.VDI
+    if data[:_VPC_L] == VPC_CREATOR:
         return ImageFormat.VPC
-    if struct.unpack(CLOOP_HEADER_FMT, data[:_CLOOP_L]) == CLOOP_MAGIC:
+    if data[:_CLOOP_L] == CLOOP_MAGIC:
         return ImageFormat.CLOOP
     return ImageFormat.UNKNOWN
 
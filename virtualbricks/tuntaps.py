@@ -19,17 +19,23 @@
 import os
 from collections import OrderedDict as odict
 
-from virtualbricks import bricks, link, settings
+from virtualbricks import bricks, link, settings, log, helper
 from virtualbricks._spawn import abspath_vde
 
 if False:  # pyflakes
     _ = str
 
+logger = log.Logger()
+configure_failed = log.Event("Cannot configure interface {iface}")
+invalid_config = log.Event("Cannot configure interface {iface}: {reason}")
+
 
 class PrivilegedBrick(bricks.Brick):
 
     def needsudo(self):
         return os.geteuid() != 0
+
+
 class CaptureConfig(bricks.Config):
 
     parameters = {"iface": bricks.String("")}
@@ -107,32 +113,42 @@ class Tap(PrivilegedBrick):
     def configured(self):
         return bool(self.plugs[0].sock)
 
-    def post_poweron(self):
-        # XXX: fixme
-        self.start_related_events(on=True)
-        if self.config["mode"] == 'dhcp':
-            if self.needsudo():
-                os.system(settings.get('sudo') + ' "dhclient ' + self.name
-                          + '"')
-            else:
-                os.system('dhclient ' + self.name)
-        elif self.config["mode"] == 'manual':
-            if self.needsudo():
-                    # XXX Ugly, can't we ioctls?
-                    os.system(settings.get('sudo') + ' "/sbin/ifconfig ' +
-                              self.name + ' ' + self.config["ip"] + ' netmask ' +
-                              self.config["nm"] + '"')
-                    if (len(self.config["gw"]) > 0):
-                        os.system(settings.get('sudo') +
-                                  ' "/sbin/route add default gw ' +
-                                  self.config["gw"] + ' dev ' + self.name +
-                                  '"')
-            else:
-                    os.system('/sbin/ifconfig ' + self.name + ' ' +
-                              self.config["ip"] + ' netmask ' +
-                              self.config["nm"])
-                    if (len(self.config["gw"]) > 0):
-                        os.system('/sbin/route add default gw ' +
-                                  self.config["gw"] + ' dev ' + self.name)
+    def poweron(self):
+        # a running tap is already configured, configuring it again would
+        # renew the lease and add the route again
+        was_running = self.proc is not None
+        d = PrivilegedBrick.poweron(self)
+        if not was_running:
+            d.addCallback(self._configure_interface)
+        return d
+
+    def _configure_interface(self, passthru):
+        """Configure the tap interface, the brick does not wait for it."""
+
+        try:
+            commands = helper.interface_commands(
+                self.name, self.config["mode"], self.config["ip"],
+                self.config["nm"], self.config["gw"])
+        except ValueError as e:
+            logger.error(invalid_config, iface=self.name, reason=str(e))
+            return passthru
+        if not commands:
+            return passthru
+        if not self.needsudo():
+            d = helper.run_commands(commands)
+        elif settings.get("helper"):
+            d = self.factory.helper.configure(
+                self.name, self.config["mode"], self.config["ip"],
+                self.config["nm"], self.config["gw"])
         else:
-            return
+            sudo = settings.get("sudo")
+            d = helper.run_commands([sudo, "--"] + cmd for cmd in commands)
+
+        def check_status(status):
+            if status != 0:
+                logger.error(invalid_config, iface=self.name,
+                             reason="exit status %d" % status)
+
+        d.addCallback(check_status)
+        d.addErrback(logger.failure_eb, configure_failed, iface=self.name)
+        return passthru
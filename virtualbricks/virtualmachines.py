@@ -23,11 +23,12 @@ import datetime
 import shutil
 import itertools
 
-from twisted.internet import utils, defer
+from twisted.internet import defer
+from twisted.python import failure
 
 from virtualbricks import (errors, tools, settings, bricks, log, project,
-                           observable)
-from virtualbricks._spawn import getQemuOutputAndValue, abspath_qemu
+                           observable, qmp, qemu, affinity)
+from virtualbricks._spawn import abspath_qemu
 
 
 if False:
@@ -36,13 +37,26 @@ if False:
 __metaclass__ = type
 logger = log.Logger()
 new_cow = log.Event("Creating a new private COW from {base} image.")
+pooled_cow = log.Event("Taking a private COW of {base} from the warm pool.")
 invalid_base = log.Event("{cowname} private cow found with a different base "
                          "image ({base}): moving it in {path}")
 powerdown = log.Event("Sending powerdown to {vm}")
+reattach_plug = log.Event("Re-attaching {vm} to {sock.nickname}")
+reattach_error = log.Event("Cannot re-attach {vm} to {sock.nickname}")
 update_usb = log.Event("update_usbdevlist: old {old} - new {new}")
 own_err = log.Event("plug {plug} does not belong to {brick}")
+no_io_uring = log.Event("{vm} does not support aio=io_uring, using threads "
+                        "for {device}")
+throttle_set = log.Event("Throttling {device} of {vm}: {limits}")
+throttle_error = log.Event("Cannot throttle {device} of {vm}")
 acquire_lock = log.Event("Aquiring disk locks")
 release_lock = log.Event("Releasing disk locks")
+qmp_event = log.Event("{vm} QMP event {name}")
+qmp_error = log.Event("Cannot connect to the QMP socket of {vm}")
+vcpu_pinned = log.Event("{vm} vCPU {vcpu} (thread {tid}) pinned to CPU {cpu}")
+pin_error = log.Event("Cannot pin the vCPUs of {vm}")
+few_hugepages = log.Event("{vm} needs {needed} MB of huge pages, only {free} "
+                          "MB are free")
 
 
 class UsbDevice:
@@ -156,6 +170,7 @@ class Image:
 
     readonly = False
     master = None
+    warm_pool = 0
     _description = None
     _name = ""
 
@@ -228,7 +243,10 @@ class Image:
             raise errors.LockedImageError(self, self.master)
 
     def save_to(self, fileobj):
-        fileobj.write("[Image:{0.name}]\npath={0.path}\n\n".format(self))
+        fileobj.write("[Image:{0.name}]\npath={0.path}\n".format(self))
+        if self.warm_pool:
+            fileobj.write("warm_pool={0}\n".format(self.warm_pool))
+        fileobj.write("\n")
 
     def __format__(self, format_string):
         if format_string in ("n", ""):
@@ -256,9 +274,21 @@ def move(src, dst):
             raise
 
 
+# seconds the guest has to release a NIC before a reattach gives up
+UNPLUG_TIMEOUT = 10
+CACHE_MODES = ("none", "writeback", "writethrough", "directsync", "unsafe")
+AIO_BACKENDS = ("threads", "native", "io_uring")
+# the bursts, *_max, are allowed only together with their limits
+THROTTLE_LIMITS = ("iops_rd", "iops_wr", "bps_rd", "bps_wr", "iops_rd_max",
+                   "iops_wr_max", "bps_rd_max", "bps_wr_max")
+# the interface and the index of the disks given with -drive
+DRIVE_INTERFACES = {"hda": ("ide", 0), "hdb": ("ide", 1), "hdc": ("ide", 2),
+                    "hdd": ("ide", 3), "fda": ("floppy", 0),
+                    "fdb": ("floppy", 1), "mtdblock": ("mtd", 0)}
+
+
 class Disk:
 
-    sync_cmd = "sync"
     image = None
 
     @property
@@ -276,17 +306,130 @@ class Disk:
     def __init__(self, VM, dev):
         self.VM = VM
         self.device = dev
+        # the image opened by the running virtual machine
+        self._drive_file = None
 
     def _virtio_args_cb(self, disk_name):
+        self._drive_file = disk_name
         return ["-drive", "file={0},if=virtio".format(disk_name)]
 
     def _args_cb(self, disk_name):
+        self._drive_file = disk_name
         return ["-" + self.device, disk_name]
 
+    def _io_settings(self):
+        config = self.VM.config
+        return (config["cache" + self.device], config["aio" + self.device],
+                config["iothread" + self.device],
+                config["discard" + self.device])
+
+    def _io_options(self):
+        cache, aio, iothread, discard = self._io_settings()
+        options = []
+        if cache:
+            if cache not in CACHE_MODES:
+                raise errors.BadConfigError(
+                    _("Invalid cache mode %s for %s") % (cache, self.device))
+            options.append("cache=" + cache)
+        if aio:
+            if aio not in AIO_BACKENDS:
+                raise errors.BadConfigError(
+                    _("Invalid aio backend %s for %s") % (aio, self.device))
+            if aio == "native" and cache not in ("none", "directsync"):
+                raise errors.BadConfigError(
+                    _("aio=native requires cache=none or cache=directsync"))
+            if (aio == "io_uring" and
+                    not qemu.supports_io_uring(self.VM.executable())):
+                logger.info(no_io_uring, vm=self.VM, device=self.device)
+                aio = "threads"
+            options.append("aio=" + aio)
+        if discard:
+            options.extend(["discard=unmap", "detect-zeroes=unmap"])
+        limits = self.throttle()
+        options.extend("{0}={1}".format(key, limits[key])
+                       for key in THROTTLE_LIMITS if key in limits)
+        return options
+
+    def throttle(self):
+        """Return the I/O limits of the disk that are set, a dictionary
+        limit -> value.
+
+        @raise errors.BadConfigError: if a burst is set without its limit or
+            is lower than it.
+        """
+
+        limits = {}
+        for key in THROTTLE_LIMITS:
+            value = self.VM.config[key + self.device]
+            if value < 0:
+                raise errors.BadConfigError(
+                    _("Invalid %s for %s") % (key, self.device))
+            if value:
+                limits[key] = value
+        for key in THROTTLE_LIMITS[4:]:
+            if key in limits and not 0 < limits.get(key[:-4]) <= limits[key]:
+                raise errors.BadConfigError(
+                    _("%s of %s requires a lower %s") % (
+                        key, self.device, key[:-4]))
+        return limits
+
+    def apply_throttle(self, client):
+        """Change the I/O limits of the disk of the running virtual machine.
+
+        The block device is looked up by the image that it has opened.
+        """
+
+        limits = self.throttle()
+        self.VM.logger.info(throttle_set, device=self.device, vm=self.VM,
+                            limits=limits)
+        d = client.query_block()
+        d.addCallback(self._set_io_throttle, client, limits)
+        return d
+
+    def _set_io_throttle(self, blocks, client, limits):
+        name = self._drive_file
+        for block in blocks:
+            inserted = block.get("inserted", {})
+            if name is not None and name in (inserted.get("file"),
+                                             inserted.get("backing_file")):
+                if block.get("device"):
+                    return client.block_set_io_throttle(
+                        device=block["device"], **limits)
+                return client.block_set_io_throttle(id=block["qdev"],
+                                                    **limits)
+        raise errors.InvalidActionError(
+            _("%s is not attached to %s") % (self.device, self.VM.name))
+
+    def _drive_args_cb(self, disk_name):
+        self._drive_file = disk_name
+        options = ["file=" + disk_name.replace(",", ",,")]
+        options.extend(self._io_options())
+        virtio = self.VM.get("use_virtio")
+        if self.VM.config["iothread" + self.device]:
+            if not virtio:
+                raise errors.BadConfigError(
+                    _("An iothread requires a virtio disk"))
+            iothread = "io" + self.device
+            drive = "drive-" + self.device
+            options[1:1] = ["if=none", "id=" + drive]
+            return ["-object", "iothread,id=" + iothread,
+                    "-drive", ",".join(options),
+                    "-device", "virtio-blk-pci,drive={0},iothread={1}".format(
+                        drive, iothread)]
+        if virtio:
+            options.insert(1, "if=virtio")
+        else:
+            interface, index = DRIVE_INTERFACES[self.device]
+            options[1:1] = ["if=" + interface, "index=%d" % index]
+        return ["-drive", ",".join(options)]
+
     def args(self):
         if self.image:
             d = self.get_real_disk_name()
-            if self.VM.get("use_virtio"):
+            if (self._io_settings() != ("", "", False, False) or
+                    self.throttle()):
+                d.addCallback(self._drive_args_cb)
+            elif self.VM.get("use_virtio"):
                 d.addCallback(self._virtio_args_cb)
             else:
                 d.addCallback(self._args_cb)
@@ -296,6 +439,9 @@ class Disk:
 
     def set_image(self, image):
         self.image = image
+        # the disk is changed in place, the memoized command line of the
+        # virtual machine is stale
+        self.VM.config.bump_version()
 
     def acquire(self):
         if self.image and not self.cow and not self.readonly():
@@ -308,47 +454,47 @@ class Disk:
     def _get_base(self):
         return self.image.path
 
-    def _sync(self, ret):
-
-        def complain_on_error(ret):
-            out, err, code = ret
-            if code != 0:
-                raise RuntimeError("sync failed\n%s" % err)
-
-        out, err, code = ret
-        if code != 0:
-            raise RuntimeError("Cannot create private COW\n%s" % err)
-
-        exit = utils.getProcessOutputAndValue(self.sync_cmd, env=os.environ)
-        exit.addCallback(complain_on_error)
-        return exit
-
     def _create_cow(self, cowname):
-        if abspath_qemu('qemu-img', return_relative=False) is None:
+        if self.image is not None and self.image.warm_pool:
+            d = self.VM.factory.warm_pool.take(self.image, cowname,
+                                               settings.get("cowfmt"))
+            if d is not None:
+                logger.info(pooled_cow, base=self._get_base())
+                return d
+        qemu_img = abspath_qemu("qemu-img", return_relative=False)
+        if qemu_img is None:
             msg = _("qemu-img not found! I can't create a new image.")
             return defer.fail(errors.BadConfigError(msg))
 
         logger.info(new_cow, base=self._get_base())
-        args = ["create", "-b", self._get_base(), "-f",
-                settings.get("cowfmt"), cowname]
-        exit = getQemuOutputAndValue("qemu-img", args, os.environ)
-        exit.addCallback(self._sync)
-        exit.addCallback(lambda _: cowname)
-        return exit
+        return self.VM.factory.overlays.create(qemu_img, self._get_base(),
+                                               cowname,
+                                               settings.get("cowfmt"))
 
     def _check_base(self, cowname):
-        with open(cowname) as fp:
-            backing_file = tools.get_backing_file(fp)
-        if backing_file == self._get_base():
-            return defer.succeed(cowname)
+        d = self.VM.factory.image_cache.lookup(cowname)
+        return d.addCallback(self._check_backing_file, cowname)
+
+    def _check_backing_file(self, info, cowname):
+        if info.backing_file is None:
+            raise tools.UnknowTypeError()
+        if info.backing_file == self._get_base():
+            return cowname
         else:
             dt = datetime.datetime.now()
             cowback = cowname + ".back-" + dt.strftime("%Y-%m-%d_%H-%M-%S")
-            logger.debug(invalid_base, cowname=cowname, base=backing_file,
-                         path=cowback)
+            logger.debug(invalid_base, cowname=cowname,
+                         base=info.backing_file, path=cowback)
             move(cowname, cowback)
+            self.VM.factory.image_cache.invalidate(cowname)
             return self._create_cow(cowname).addCallback(lambda _: cowname)
 
+    def _create_missing_cow(self, failure, cowname):
+        failure.trap(IOError)
+        if failure.value.errno != errno.ENOENT:
+            return failure
+        return self._create_cow(cowname)
+
     def _get_cow_name(self):
         try:
             os.makedirs(self.basefolder)
@@ -356,13 +502,8 @@ class Disk:
             if e.errno != errno.EEXIST:
                 raise
         cowname = self.get_cow_path()
-        try:
-            return self._check_base(cowname)
-        except IOError, e:
-            if e.errno == errno.ENOENT:
-                return self._create_cow(cowname)
-            else:
-                raise
+        d = self._check_base(cowname)
+        return d.addErrback(self._create_missing_cow, cowname)
 
     def get_cow_path(self):
         return os.path.join(self.basefolder, "%s_%s.cow" % (self.vm_name,
@@ -385,7 +526,6 @@ class Disk:
 
     def __deepcopy__(self, memo):
         new = type(self)(self.VM, self.device)
-        new.sync_cmd = self.sync_cmd
         if self.image is not None:
             new.set_image(self.image)
         return new
@@ -577,6 +717,8 @@ class VirtualMachineConfig(bricks.Config):
                   "machine": bricks.String(""),
                   "kvm": bricks.Boolean(False),
                   "smp": bricks.SpinInt(1, 1, 64),
+                  # the CPUs of the vCPUs, in order, reused if fewer
+                  "vcpus": bricks.String(""),
 
                   # audio device soundcard
                   "soundhw": bricks.String(""),
@@ -585,6 +727,11 @@ class VirtualMachineConfig(bricks.Config):
                   "ram": bricks.SpinInt(64, 1, 99999),
                   "kvmsm": bricks.Boolean(False),
                   "kvmsmem": bricks.SpinInt(1, 0, 99999),
+                  # the guest RAM on hugetlbfs, preallocated or shared
+                  "hugepages": bricks.Boolean(False),
+                  "hugepath": bricks.String(""),
+                  "memprealloc": bricks.Boolean(False),
+                  "memshare": bricks.Boolean(False),
 
                   # display options
                   "novga": bricks.Boolean(False),
@@ -622,6 +769,18 @@ class VirtualMachineConfig(bricks.Config):
                   "loadvm": bricks.String("")}
 
 
+for _dev in "hda", "hdb", "hdc", "hdd", "fda", "fdb", "mtdblock":
+    # I/O settings of the disk, the empty strings are the defaults of qemu
+    VirtualMachineConfig.parameters.update({
+        "cache" + _dev: bricks.String(""),
+        "aio" + _dev: bricks.String(""),
+        "iothread" + _dev: bricks.Boolean(False),
+        "discard" + _dev: bricks.Boolean(False)})
+    VirtualMachineConfig.parameters.update(
+        (key + _dev, bricks.Integer(0)) for key in THROTTLE_LIMITS)
+del _dev
+
+
 def _get_nick(link):
     if hasattr(link, "sock"):
         return str(getattr(link.sock, "nickname", "None"))
@@ -636,6 +795,10 @@ class VirtualMachine(bricks.Brick):
     config_factory = VirtualMachineConfig
     process_protocol = bricks.Process
     default_arg0 = 'qemu-system-x86_64'
+    paused = False
+    _qmp_client = None
+    _qmp_waiting = None
+    clock = None
 
     def __init__(self, factory, name):
         bricks.Brick.__init__(self, factory, name)
@@ -667,8 +830,10 @@ class VirtualMachine(bricks.Brick):
 
     def poweroff(self, kill=False, term=False):
         if self.proc is None:
-            return defer.succeed((self, self._last_status))
+            return bricks.Brick.poweroff(self)
         elif not any((kill, term)):
+            self.factory.supervisor.cancel(self)
+            self._stop_requested = True
             self.logger.info(powerdown, vm=self)
             self.send("system_powerdown\n")
             return self._exited_d
@@ -677,6 +842,187 @@ class VirtualMachine(bricks.Brick):
         else:
             return bricks.Brick.poweroff(self, kill)
 
+    def process_started(self, proc):
+        bricks.Brick.process_started(self, proc)
+        # connect at once to receive the events since the boot
+        d = self.qmp()
+        d.addErrback(self._qmp_failed)
+        if self.config["vcpus"]:
+            d = self.pin_vcpus()
+            d.addErrback(self.logger.failure_eb, pin_error, vm=self)
+
+    def process_ended(self, proc, status):
+        self.paused = False
+        if self._qmp_client is not None:
+            self._qmp_client.transport.loseConnection()
+        bricks.Brick.process_ended(self, proc, status)
+
+    def get_state(self):
+        if self.proc is not None and self.paused:
+            return _("paused")
+        return bricks.Brick.get_state(self)
+
+    # QMP
+
+    def qmp_socket(self):
+        return "%s/%s.qmp" % (settings.VIRTUALBRICKS_HOME, self.name)
+
+    def qmp(self):
+        """Return a deferred that fires with the L{qmp.QMPProtocol}
+        connected to the running virtual machine."""
+
+        if self._qmp_client is not None:
+            return defer.succeed(self._qmp_client)
+        if self.proc is None:
+            return defer.fail(errors.InvalidActionError(
+                _("Virtual machine %s is not running") % self.name))
+        d = defer.Deferred()
+        if self._qmp_waiting is None:
+            self._qmp_waiting = [d]
+            qmp.connect(self.qmp_socket()).addBoth(self._qmp_connected)
+        else:
+            self._qmp_waiting.append(d)
+        return d
+
+    def _qmp_connected(self, result):
+        waiting, self._qmp_waiting = self._qmp_waiting, None
+        if isinstance(result, failure.Failure):
+            for d in waiting:
+                d.errback(result)
+            return
+        self._qmp_client = result
+        for event in "STOP", "RESUME", "SHUTDOWN", "RESET":
+            result.subscribe(event, self._qmp_event)
+        result.lost.addCallback(self._qmp_lost, result)
+        for d in waiting:
+            d.callback(result)
+
+    def _qmp_failed(self, fail):
+        # the virtual machine can exit before it opens the socket
+        if self.proc is not None:
+            self.logger.failure(qmp_error, fail, vm=self)
+
+    def _qmp_lost(self, _, client):
+        if self._qmp_client is client:
+            self._qmp_client = None
+
+    def _qmp_event(self, event, data):
+        self.logger.debug(qmp_event, vm=self, name=event)
+        if event in ("STOP", "RESUME"):
+            self.paused = event == "STOP"
+            self.notify_changed()
+
+    def pin_vcpus(self):
+        """Bind every vCPU thread of the running virtual machine to a CPU of
+        the C{vcpus} setting.
+
+        @return: a deferred that fires with a list of (vcpu, thread id, cpu).
+        """
+
+        try:
+            cpus = affinity.parse_cpus(self.config["vcpus"])
+        except ValueError:
+            return defer.fail(errors.BadConfigError(
+                _("Invalid vCPU list %s") % self.config["vcpus"]))
+        d = self.qmp()
+        d.addCallback(self._vcpu_threads)
+        d.addCallback(self._pin_threads, cpus)
+        return d
+
+    def _vcpu_threads(self, client):
+        # query-cpus-fast does not interrupt the guest, older versions of
+        # qemu have only query-cpus
+
+        def threads(cpus):
+            cpus = sorted(cpus, key=lambda c: c.get("cpu-index", c.get("CPU")))
+            return [cpu.get("thread-id", cpu.get("thread_id"))
+                    for cpu in cpus]
+
+        def fallback(fail):
+            fail.trap(errors.QMPError)
+            return client.execute("query-cpus")
+
+        d = client.execute("query-cpus-fast")
+        d.addErrback(fallback)
+        return d.addCallback(threads)
+
+    def _pin_threads(self, threads, cpus):
+        pinned = []
+        for vcpu, tid in enumerate(threads):
+            cpu = cpus[vcpu % len(cpus)]
+            affinity.sched_setaffinity(tid, [cpu])
+            self.logger.info(vcpu_pinned, vm=self, vcpu=vcpu, tid=tid,
+                             cpu=cpu)
+            pinned.append((vcpu, tid, cpu))
+        return pinned
+
+    def reattach(self, brick):
+        """Replace the VDE backends of the plugs connected to C{brick}, the
+        guest keeps running."""
+
+        netdev = self.use_netdev()
+        for i, plug in enumerate(self.plugs):
+            if (plug.mode == "vde" and plug.sock is not None and
+                    plug.sock.brick is brick):
+                self.logger.info(reattach_plug, vm=self, sock=plug.sock)
+                if netdev:
+                    d = self.qmp()
+                    d.addCallback(self._replug, i, plug)
+                    d.addErrback(self.logger.failure_eb, reattach_error,
+                                 vm=self, sock=plug.sock)
+                else:
+                    self.send("host_net_remove {0} vde{0}\n".format(i))
+                    self.send("host_net_add vde vlan={0},sock={1},name=vde{0}"
+                              "\n".format(i, plug.sock.path.rstrip("[]")))
+
+    def _replug(self, client, i, plug):
+        # a -netdev backend cannot be replaced while a NIC uses it, the NIC
+        # is unplugged first
+        device, netdev = "eth{0}".format(i), "vde{0}".format(i)
+        deleted = defer.Deferred()
+
+        def device_deleted(event, data):
+            if data.get("device") == device:
+                client.unsubscribe("DEVICE_DELETED", device_deleted)
+                deleted.callback(None)
+
+        def unsubscribe(fail):
+            client.unsubscribe("DEVICE_DELETED", device_deleted)
+            return fail
+
+        def timed_out(fail):
+            # the guest ignores the hot-unplug, without ACPI or still booting
+            fail.trap(defer.TimeoutError)
+            raise errors.QMPError("DeviceNotRemoved", _(
+                "The guest did not release %s in %d seconds") % (
+                    device, UNPLUG_TIMEOUT))
+
+        def unplug_failed(fail):
+            deleted.addErrback(lambda _: None)
+            deleted.cancel()
+            return fail
+
+        client.subscribe("DEVICE_DELETED", device_deleted)
+        deleted.addTimeout(UNPLUG_TIMEOUT, self._get_clock())
+        deleted.addErrback(unsubscribe)
+        deleted.addErrback(timed_out)
+        d = client.device_del(device)
+        d.addCallbacks(lambda _: deleted, unplug_failed)
+        d.addCallback(lambda _: client.execute("netdev_del", id=netdev))
+        d.addCallback(lambda _: client.execute(
+            "netdev_add", type="vde", id=netdev,
+            sock=plug.sock.path.rstrip("[]")))
+        d.addCallback(lambda _: client.device_add(plug.model, id=device,
+                                                  netdev=netdev,
+                                                  mac=plug.mac))
+        return d
+
+    def _get_clock(self):
+        if self.clock is None:
+            from twisted.internet import reactor
+            return reactor
+        return self.clock
+
     def get_parameters(self):
         ram = self.config["ram"]
         txt = [_("command:") + " %s, ram: %s" % (self.prog(), ram)]
@@ -710,8 +1056,31 @@ class VirtualMachine(bricks.Brick):
         d.addCallback(self.__args)
         return d
 
+    def cached_args(self):
+        """Return the command line built for the current configuration,
+        without the disks, or C{None} if it is not built yet."""
+
+        cached = self._get_memoized("args")
+        if cached is not None:
+            head, tail = cached
+            return [self.prog()] + head + tail
+        return None
+
     def __args(self, results):
+        # the executable and the disks are the only parts resolved at every
+        # start, the path of a private cow depends on the project
+        head, tail = self._memoize("args", lambda: (self.__head(),
+                                                    self.__tail()))
+        self._check_hugepages()
         res = [self.prog()]
+        res.extend(head)
+        for disk_args in results:
+            res.extend(disk_args)
+        res.extend(tail)
+        return res
+
+    def __head(self):
+        res = []
         if (self.config['kvm'] or self.config['machine'] or
                 self.config['kvmsm']):
             props = []
@@ -728,10 +1097,48 @@ class VirtualMachine(bricks.Brick):
         if self.config["cpu"]:
             res.extend(["-cpu", self.config["cpu"]])
         res.extend(list(self.build_cmd_line()))
+        res.extend(self._memory_args())
         if self.config["novga"]:
             res.extend(["-display", "none"])
-        for disk_args in results:
-            res.extend(disk_args)
+        return res
+
+    def _memory_args(self):
+        # the guest RAM is given to a memory backend, the node 0 of the
+        # guest uses it
+        hugepages = self.config["hugepages"]
+        if not (hugepages or self.config["memprealloc"] or
+                self.config["memshare"]):
+            return []
+        ram = self.config["ram"]
+        props = ["id=ram0", "size=%dM" % ram]
+        if hugepages:
+            backend = "memory-backend-file"
+            path = self.config["hugepath"] or tools.hugetlbfs_mount()
+            if not path:
+                raise errors.BadConfigError(_("hugetlbfs is not mounted"))
+            props.append("mem-path=" + path)
+        else:
+            backend = "memory-backend-ram"
+        if self.config["memshare"]:
+            props.append("share=on")
+        if self.config["memprealloc"]:
+            props.append("prealloc=on")
+        return ["-object", ",".join([backend] + props),
+                "-numa", "node,memdev=ram0"]
+
+    def _check_hugepages(self):
+        # the free huge pages change at every start, the check is not part
+        # of the memoized command line
+        if self.config["hugepages"]:
+            ram = self.config["ram"]
+            free = sum(size * nfree
+                       for size, total, nfree in tools.hugepages()) >> 20
+            if free < ram:
+                self.logger.warn(few_hugepages, vm=self, needed=ram,
+                                 free=free)
+
+    def __tail(self):
+        res = []
         if self.config["kernelenbl"] and self.config["kernel"]:
             res.extend(["-kernel", self.config["kernel"]])
         if self.config["initrdenbl"] and self.config["initrd"]:
@@ -756,6 +1163,9 @@ class VirtualMachine(bricks.Brick):
         res.extend(["-name", self.name])
         if not self.plugs and not self.socks:
             res.extend(["-net", "none"])
+        elif self.use_netdev():
+            for i, link in enumerate(itertools.chain(self.plugs, self.socks)):
+                res.extend(self._netdev_args(i, link))
         else:
             for i, link in enumerate(itertools.chain(self.plugs, self.socks)):
                 res.append("-device")
@@ -765,7 +1175,7 @@ class VirtualMachine(bricks.Brick):
                     res.extend(("-net", "user,vlan={0}".format(i)))
                 elif link.mode == "vde":
                     res.append("-net")
-                    res.append("vde,vlan={0},sock={1}".format(
+                    res.append("vde,vlan={0},sock={1},name=vde{0}".format(
                         i, link.sock.path.rstrip('[]')))
                 elif link.mode == "sock":
                     res.append("-net")
@@ -794,17 +1204,54 @@ class VirtualMachine(bricks.Brick):
                     "socket,id=mon,path=%s,server,nowait" %
                     self.console(),
                     "-mon", "chardev=mon_cons", "-chardev",
-                    "stdio,id=mon_cons,signal=off"])
+                    "stdio,id=mon_cons,signal=off",
+                    "-mon", "chardev=qmp,mode=control", "-chardev",
+                    "socket,id=qmp,path=%s,server,nowait" %
+                    self.qmp_socket()])
         return res
 
+    def executable(self):
+        """Return the name of the qemu executable."""
+
+        return os.path.basename(self.config["argv0"] or self.default_arg0)
+
+    def use_netdev(self):
+        """Return C{True} if the NICs are bound to their backends with
+        C{-netdev}, C{False} if the old qemu vlans are used."""
+
+        return qemu.supports_netdev(self.executable())
+
+    def cmd_line_key(self):
+        # the form of the NICs depends on the qemu probed
+        return bricks.Brick.cmd_line_key(self) + (self.use_netdev(),)
+
+    def _netdev_args(self, i, link):
+        if link.sock and link.sock.mode == "hostonly":
+            netdev = "user{0}".format(i)
+            backend = "user,id=" + netdev
+        elif link.mode == "vde":
+            netdev = "vde{0}".format(i)
+            backend = "vde,id={0},sock={1}".format(
+                netdev, link.sock.path.rstrip("[]"))
+        elif link.mode == "sock":
+            netdev = "vde{0}".format(i)
+            backend = "vde,id={0},sock={1}".format(netdev, link.path)
+        else:
+            netdev = "user{0}".format(i)
+            backend = "user,id=" + netdev
+        device = "{0.model},netdev={1},mac={0.mac},id=eth{2}".format(
+            link, netdev, i)
+        return ["-netdev", backend, "-device", device]
+
     def add_sock(self, mac=None, model=None):
-        s = self.factory.new_sock(self)
-        sock = VMSock(s)
         vlan = len(self.plugs) + len(self.socks)
-        sock.path = "{0}/{1.brick.name}_sock_eth{2}[]".format(
-            settings.VIRTUALBRICKS_HOME, sock, vlan)
-        sock.nickname = "{0.brick.name}_sock_eth{1}".format(sock, vlan)
+        # the nickname is given to the factory because socks are indexed by
+        # nickname
+        nickname = "{0}_sock_eth{1}".format(self.name, vlan)
+        sock = VMSock(self.factory.new_sock(self, nickname))
+        sock.path = "{0}/{1}[]".format(settings.VIRTUALBRICKS_HOME, nickname)
         self.socks.append(sock)
+        self.config.bump_version()
         if mac:
             sock.mac = mac
         if model:
@@ -814,6 +1261,7 @@ class VirtualMachine(bricks.Brick):
     def add_plug(self, sock, mac=None, model=None):
         plug = VMPlug(self.factory.new_plug(self))
         self.plugs.append(plug)
+        self.config.bump_version()
         if sock:
             plug.connect(sock)
         if mac:
@@ -833,6 +1281,8 @@ class VirtualMachine(bricks.Brick):
                 self.plugs.remove(plug)
         except ValueError:
             self.logger.error(own_err, plug=plug, brick=self)
+        else:
+            self.config.bump_version()
 
     def commit_disks(self, args):
         # XXX: fixme
@@ -862,13 +1312,29 @@ class VirtualMachine(bricks.Brick):
             yield self.config[hd]
 
     def set_image(self, disk, image):
-        self.config[disk].image = image
+        self.config[disk].set_image(image)
         if not self._restore:
             self._observable.notify("image-changed", (self, image))
 
     def set_vm(self, disk):
         disk.VM = self
 
+    def set(self, attrs):
+        throttled = set()
+        for disk in self.disks():
+            for key in (limit + disk.device for limit in THROTTLE_LIMITS):
+                if key in attrs and attrs[key] != self.config[key]:
+                    throttled.add(disk.device)
+        bricks.Brick.set(self, attrs)
+        if self.proc is not None:
+            # the limits of the running disks are changed in place
+            for dev in sorted(throttled):
+                disk = self.config[dev]
+                d = self.qmp()
+                d.addCallback(disk.apply_throttle)
+                d.addErrback(self.logger.failure_eb, throttle_error,
+                             device=dev, vm=self)
+
     cbset_hda = cbset_hdb = cbset_hdc = cbset_hdd = cbset_fda = cbset_fdb = \
             cbset_mtblock = set_vm
 
@@ -18,12 +18,15 @@
 
 import re
 
-from virtualbricks import bricks
+from virtualbricks import bricks, log
 from virtualbricks._spawn import abspath_vde
 
 if False:  # pyflakes
     _ = str
 
+logger = log.Logger()
+set_failed = log.Event("Cannot change the parameters of {brick}")
+
 
 class Wire(bricks.Brick):
 
@@ -96,6 +99,7 @@ class Netemu(Wire):
     type = "Netemu"
     config_factory = NetemuConfig
     process_protocol = WFProcessProtocol
+    _batch = None
 
     def __init__(self, factory, name):
         Wire.__init__(self, factory, name)
@@ -147,7 +151,21 @@ class Netemu(Wire):
         self._set(attrs, "delaysymm", "delay", "delayr")
         self._set(attrs, "bandwidthsymm", "bandwidth", "bandwidthr")
         self._set(attrs, "losssymm", "loss", "lossr")
-        Wire.set(self, attrs)
+        # the commands of the live-management callbacks are sent at once
+        self._batch = []
+        try:
+            Wire.set(self, attrs)
+        finally:
+            batch, self._batch = self._batch, None
+        if batch and self.proc:
+            d = self.proc.send_batch(batch)
+            d.addErrback(logger.failure_eb, set_failed, brick=self)
+
+    def send(self, data):
+        if self._batch is not None:
+            self._batch.append(data)
+        else:
+            Wire.send(self, data)
 
     def _set(self, attrs, symm, left_to_right, right_to_left):
         if symm in attrs and attrs[symm] != self.config[symm]: